@@ -1,18 +1,27 @@
-from abverdict import effects
-from abverdict.effects import outcome
-from abverdict.effects.outcome import conversion
-from abverdict.effects.outcome import magnitude
-from abverdict.effects.outcome import timing
-
-# New modules
-from abverdict import methods
-from abverdict import diagnostics
-from abverdict import planning
-from abverdict import business
-from abverdict import segments
+from abverdict._lazy import attach
 
 __version__ = "0.3.1"
 
+# Subpackages are imported on first access so that ``import abverdict`` stays
+# cheap (serverless cold starts); numpy and scipy load only when used.
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules={
+        # Core effects
+        "effects": "abverdict.effects",
+        "outcome": "abverdict.effects.outcome",
+        "conversion": "abverdict.effects.outcome.conversion",
+        "magnitude": "abverdict.effects.outcome.magnitude",
+        "timing": "abverdict.effects.outcome.timing",
+        # New modules
+        "methods": "abverdict.methods",
+        "diagnostics": "abverdict.diagnostics",
+        "planning": "abverdict.planning",
+        "business": "abverdict.business",
+        "segments": "abverdict.segments",
+    },
+)
+
 __all__ = [
     # Core effects
     "effects",
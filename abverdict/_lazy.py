@@ -0,0 +1,48 @@
+"""
+Lazy attribute loading for abverdict packages.
+
+Package ``__init__`` modules declare which names they export and where those
+names live; the defining module is imported on first attribute access through
+a module-level ``__getattr__`` (PEP 562). ``import abverdict`` therefore does
+not pull in numpy or scipy until an analysis function is actually used.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Optional[Dict[str, str]] = None,
+    attributes: Optional[Dict[str, str]] = None,
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build ``__getattr__`` and ``__dir__`` for a lazily loaded package.
+
+    Args:
+        package: ``__name__`` of the package being set up
+        submodules: Exported name -> dotted path of a module to expose
+        attributes: Exported name -> dotted path of the module defining it
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) to assign at module level
+    """
+    submodules = dict(submodules or {})
+    attributes = dict(attributes or {})
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            value = importlib.import_module(submodules[name])
+        elif name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache on the package so later lookups bypass __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(submodules) | set(attributes))
+
+    return __getattr__, __dir__
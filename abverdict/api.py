@@ -1,9 +1,11 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 from typing import Literal, Optional, List
+from contextlib import asynccontextmanager
 import os
 
 import abverdict
@@ -13,10 +15,21 @@ from abverdict.diagnostics import srm, health, novelty
 from abverdict.segments import analysis as segment_analysis
 from abverdict.business import impact
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Workers sharing ABVERDICT_BOUNDARY_STORE split the warm-up: each design
+    # is claimed and computed by one of them, in a thread since it is CPU-bound
+    if sequential.get_boundary_store() is not None:
+        await run_in_threadpool(sequential.warm_boundary_store)
+    yield
+
+
 app = FastAPI(
     title="abverdict API",
     description="Simple A/B testing tools for marketers and analysts",
     version=abverdict.__version__,
+    lifespan=lifespan,
 )
 
 CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
@@ -154,6 +167,7 @@ class BayesianAnalyzeRequest(BaseModel):
     prior_alpha: float = Field(1, gt=0, description="Beta prior alpha parameter")
     prior_beta: float = Field(1, gt=0, description="Beta prior beta parameter")
     confidence_threshold: float = Field(0.95, gt=0, le=1, description="Probability threshold for winner")
+    seed: Optional[int] = Field(None, ge=0, description="Random seed for reproducible Monte Carlo metrics")
 
 
 # Sequential testing models
@@ -956,6 +970,7 @@ def bayesian_analyze(request: BayesianAnalyzeRequest):
             prior_alpha=request.prior_alpha,
             prior_beta=request.prior_beta,
             confidence_threshold=request.confidence_threshold,
+            seed=request.seed,
         )
         return {
             "control_rate": float(result.control_rate),
@@ -1176,10 +1191,9 @@ def project_business_impact(request: ImpactProjectionRequest):
 
         # Calculate confidence interval for lift
         import math
-        from scipy.stats import norm
+        from abverdict.utils.stats import z_alpha
 
-        alpha = 1 - request.confidence / 100
-        z = norm.ppf(1 - alpha / 2)
+        z = z_alpha(request.confidence)
 
         se_c = math.sqrt(control_rate * (1 - control_rate) / request.control_visitors) if request.control_visitors > 0 and 0 < control_rate < 1 else 0
         se_v = math.sqrt(variant_rate * (1 - variant_rate) / request.variant_visitors) if request.variant_visitors > 0 and 0 < variant_rate < 1 else 0
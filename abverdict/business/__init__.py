@@ -6,14 +6,17 @@ Tools to translate A/B test results into business value:
 - Guardrail metrics monitoring
 """
 
-from abverdict.business.impact import (
-    project_impact,
-    ImpactProjection,
-)
-from abverdict.business.guardrails import (
-    check_guardrails,
-    GuardrailResult,
-    GuardrailCheck,
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "project_impact": "abverdict.business.impact",
+        "ImpactProjection": "abverdict.business.impact",
+        "check_guardrails": "abverdict.business.guardrails",
+        "GuardrailResult": "abverdict.business.guardrails",
+        "GuardrailCheck": "abverdict.business.guardrails",
+    },
 )
 
 __all__ = [
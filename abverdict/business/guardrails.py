@@ -14,7 +14,9 @@ you might be trading short-term gains for long-term harm.
 import math
 from dataclasses import dataclass
 from typing import List, Optional, Literal, Tuple
-from scipy import stats as scipy_stats
+
+from abverdict.utils.math import normal_sf
+from abverdict.utils.stats import critical_t, critical_z
 
 
 @dataclass
@@ -76,6 +78,7 @@ class GuardrailReport:
 def check_guardrails(
     guardrails: List[dict],
     alpha: float = 0.05,
+    explain: bool = True,
 ) -> GuardrailReport:
     """
     Check multiple guardrail metrics for an A/B test.
@@ -90,6 +93,8 @@ def check_guardrails(
             - control_data: List of values OR dict with count/total for proportions
             - variant_data: List of values OR dict with count/total for proportions
         alpha: Significance level for statistical tests
+        explain: Build per-guardrail interpretations and the overall
+            recommendation (default True)
 
     Returns:
         GuardrailReport with status of all guardrails
@@ -121,7 +126,7 @@ def check_guardrails(
     failures = []
 
     for guardrail in guardrails:
-        result = _check_single_guardrail(guardrail, alpha)
+        result = _check_single_guardrail(guardrail, alpha, explain)
         results.append(result)
 
         if result.status == "passed":
@@ -137,12 +142,14 @@ def check_guardrails(
     has_failures = len(failures) > 0
 
     can_ship = len(failures) == 0
-    recommendation = _generate_recommendation(
-        results=results,
-        passed=passed,
-        warnings=warnings,
-        failures=failures,
-    )
+    recommendation = ""
+    if explain:
+        recommendation = _generate_recommendation(
+            results=results,
+            passed=passed,
+            warnings=warnings,
+            failures=failures,
+        )
 
     return GuardrailReport(
         all_passed=all_passed,
@@ -157,7 +164,7 @@ def check_guardrails(
     )
 
 
-def _check_single_guardrail(guardrail: dict, alpha: float) -> GuardrailResult:
+def _check_single_guardrail(guardrail: dict, alpha: float, explain: bool = True) -> GuardrailResult:
     """Check a single guardrail metric."""
     name = guardrail["name"]
     metric_type = guardrail.get("metric_type", "mean")
@@ -169,15 +176,15 @@ def _check_single_guardrail(guardrail: dict, alpha: float) -> GuardrailResult:
 
     if metric_type == "proportion":
         result = _check_proportion_guardrail(
-            name, control_data, variant_data, direction, threshold, critical, alpha
+            name, control_data, variant_data, direction, threshold, critical, alpha, explain
         )
     elif metric_type == "ratio":
         result = _check_ratio_guardrail(
-            name, control_data, variant_data, direction, threshold, critical, alpha
+            name, control_data, variant_data, direction, threshold, critical, alpha, explain
         )
     else:  # mean
         result = _check_mean_guardrail(
-            name, control_data, variant_data, direction, threshold, critical, alpha
+            name, control_data, variant_data, direction, threshold, critical, alpha, explain
         )
 
     return result
@@ -191,6 +198,7 @@ def _check_mean_guardrail(
     threshold: float,
     critical: float,
     alpha: float,
+    explain: bool = True,
 ) -> GuardrailResult:
     """Check guardrail for a continuous metric (mean comparison)."""
     import numpy as np
@@ -208,7 +216,9 @@ def _check_mean_guardrail(
         change_percent = 0 if variant_mean == 0 else float('inf')
 
     # Welch's t-test (unequal variances)
-    t_stat, p_value = scipy_stats.ttest_ind(variant_array, control_array, equal_var=False)
+    from scipy.stats import ttest_ind
+
+    t_stat, p_value = ttest_ind(variant_array, control_array, equal_var=False)
 
     # Confidence interval for the difference (Welch-Satterthwaite df, matching the Welch p-value)
     n1, n2 = len(control_array), len(variant_array)
@@ -218,9 +228,9 @@ def _check_mean_guardrail(
         df = (s1**2/n1 + s2**2/n2) ** 2 / (
             (s1**2/n1) ** 2 / (n1 - 1) + (s2**2/n2) ** 2 / (n2 - 1)
         )
-        t_crit = scipy_stats.t.ppf(1 - alpha/2, df)
+        t_crit = critical_t(df, alpha)
     else:
-        t_crit = scipy_stats.norm.ppf(1 - alpha/2)
+        t_crit = critical_z(alpha)
     diff = variant_mean - control_mean
     ci = (diff - t_crit * se, diff + t_crit * se)
 
@@ -241,10 +251,12 @@ def _check_mean_guardrail(
         status = "warning"
 
     # Generate interpretation
-    interpretation = _interpret_guardrail(
-        name, control_mean, variant_mean, change_percent,
-        is_significant, p_value, direction, status
-    )
+    interpretation = ""
+    if explain:
+        interpretation = _interpret_guardrail(
+            name, control_mean, variant_mean, change_percent,
+            is_significant, p_value, direction, status
+        )
 
     return GuardrailResult(
         name=name,
@@ -269,6 +281,7 @@ def _check_proportion_guardrail(
     threshold: float,
     critical: float,
     alpha: float,
+    explain: bool = True,
 ) -> GuardrailResult:
     """Check guardrail for a proportion metric."""
     control_count = control_data["count"]
@@ -291,7 +304,9 @@ def _check_proportion_guardrail(
 
     # Handle edge cases
     if min(control_total, variant_total) > 0:
-        chi2, p_value, _, _ = scipy_stats.chi2_contingency(contingency)
+        from scipy.stats import chi2_contingency
+
+        chi2, p_value, _, _ = chi2_contingency(contingency)
     else:
         p_value = 1.0
 
@@ -299,7 +314,7 @@ def _check_proportion_guardrail(
     se_control = math.sqrt(control_rate * (1 - control_rate) / control_total) if control_total > 0 else 0
     se_variant = math.sqrt(variant_rate * (1 - variant_rate) / variant_total) if variant_total > 0 else 0
     se_diff = math.sqrt(se_control**2 + se_variant**2)
-    z_crit = scipy_stats.norm.ppf(1 - alpha / 2)
+    z_crit = critical_z(alpha)
     diff = variant_rate - control_rate
     ci = (diff - z_crit * se_diff, diff + z_crit * se_diff)
 
@@ -319,10 +334,12 @@ def _check_proportion_guardrail(
     else:
         status = "warning"
 
-    interpretation = _interpret_guardrail(
-        name, control_rate, variant_rate, change_percent,
-        is_significant, p_value, direction, status
-    )
+    interpretation = ""
+    if explain:
+        interpretation = _interpret_guardrail(
+            name, control_rate, variant_rate, change_percent,
+            is_significant, p_value, direction, status
+        )
 
     return GuardrailResult(
         name=name,
@@ -347,6 +364,7 @@ def _check_ratio_guardrail(
     threshold: float,
     critical: float,
     alpha: float,
+    explain: bool = True,
 ) -> GuardrailResult:
     """Check guardrail for a ratio metric (e.g., revenue per user) using delta method."""
     import numpy as np
@@ -379,13 +397,13 @@ def _check_ratio_guardrail(
     diff = variant_ratio - control_ratio
     if se_diff > 0:
         z_stat = diff / se_diff
-        p_value = 2 * (1 - scipy_stats.norm.cdf(abs(z_stat)))
+        p_value = 2 * normal_sf(abs(z_stat))
     else:
         p_value = 1.0
 
     is_significant = p_value < alpha
 
-    z_crit = scipy_stats.norm.ppf(1 - alpha / 2)
+    z_crit = critical_z(alpha)
     ci = (diff - z_crit * se_diff, diff + z_crit * se_diff)
 
     # Determine if it's a bad change
@@ -403,11 +421,13 @@ def _check_ratio_guardrail(
     else:
         status = "warning"
 
-    interpretation = _interpret_guardrail(
-        name, control_ratio, variant_ratio, change_percent,
-        is_significant, p_value, direction, status
-    )
-    if variance_assumed:
+    interpretation = ""
+    if explain:
+        interpretation = _interpret_guardrail(
+            name, control_ratio, variant_ratio, change_percent,
+            is_significant, p_value, direction, status
+        )
+    if explain and variance_assumed:
         interpretation += (
             " Note: no 'variance' was provided, so the significance test assumes "
             "variance ≈ mean (Poisson-like); provide per-unit variance for a reliable p-value."
@@ -10,7 +10,9 @@ Translates A/B test results into business value that stakeholders understand:
 import math
 from dataclasses import dataclass
 from typing import Optional, Tuple, Literal
-from scipy.stats import norm
+
+from abverdict.utils.math import normal_cdf
+from abverdict.utils.stats import z_alpha as get_z_alpha
 
 
 @dataclass
@@ -57,6 +59,7 @@ def project_impact(
     revenue_per_conversion: float,
     confidence: int = 95,
     cost_of_change: float = 0,
+    explain: bool = True,
 ) -> ImpactProjection:
     """
     Project the business impact of implementing an A/B test winner.
@@ -71,6 +74,7 @@ def project_impact(
         revenue_per_conversion: Average revenue per conversion
         confidence: Confidence level used (default 95)
         cost_of_change: One-time cost to implement the change
+        explain: Generate the recommendation text (default True)
 
     Returns:
         ImpactProjection with revenue and conversion projections
@@ -130,14 +134,14 @@ def project_impact(
 
     # Probability calculations (assuming normal distribution of lift)
     # Estimate standard error from CI
-    z_alpha = norm.ppf(1 - (1 - confidence / 100) / 2)
+    z_alpha = get_z_alpha(confidence)
     ci_width = lift_ci_upper - lift_ci_lower
     se = ci_width / (2 * z_alpha) if z_alpha > 0 else ci_width / 4
 
     if se > 0:
         # Probability that true effect is positive
         z_positive = lift_percent / se
-        probability_positive = norm.cdf(z_positive)
+        probability_positive = normal_cdf(z_positive)
         probability_negative = 1 - probability_positive
     else:
         probability_positive = 1.0 if lift_percent > 0 else 0.0
@@ -149,17 +153,19 @@ def project_impact(
     expected_value = annual_revenue_lift  # unbiased expected value from the point estimate
 
     # Generate recommendation
-    recommendation = _generate_recommendation(
-        lift_percent=lift_percent,
-        lift_ci_lower=lift_ci_lower,
-        lift_ci_upper=lift_ci_upper,
-        monthly_revenue_lift=monthly_revenue_lift,
-        annual_revenue_lift=annual_revenue_lift,
-        revenue_lift_range=revenue_lift_range,
-        probability_positive=probability_positive,
-        cost_of_change=cost_of_change,
-        expected_value=expected_value,
-    )
+    recommendation = ""
+    if explain:
+        recommendation = _generate_recommendation(
+            lift_percent=lift_percent,
+            lift_ci_lower=lift_ci_lower,
+            lift_ci_upper=lift_ci_upper,
+            monthly_revenue_lift=monthly_revenue_lift,
+            annual_revenue_lift=annual_revenue_lift,
+            revenue_lift_range=revenue_lift_range,
+            probability_positive=probability_positive,
+            cost_of_change=cost_of_change,
+            expected_value=expected_value,
+        )
 
     return ImpactProjection(
         monthly_revenue_lift=monthly_revenue_lift,
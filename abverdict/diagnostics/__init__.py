@@ -7,9 +7,19 @@ This module provides tools to validate your test:
 - Novelty effect detection
 """
 
-from abverdict.diagnostics.srm import check_sample_ratio, SampleRatioResult
-from abverdict.diagnostics.health import check_health, TestHealthReport
-from abverdict.diagnostics.novelty import detect_novelty_effect, NoveltyEffectResult
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "check_sample_ratio": "abverdict.diagnostics.srm",
+        "SampleRatioResult": "abverdict.diagnostics.srm",
+        "check_health": "abverdict.diagnostics.health",
+        "TestHealthReport": "abverdict.diagnostics.health",
+        "detect_novelty_effect": "abverdict.diagnostics.novelty",
+        "NoveltyEffectResult": "abverdict.diagnostics.novelty",
+    },
+)
 
 __all__ = [
     "check_sample_ratio",
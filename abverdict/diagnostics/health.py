@@ -13,9 +13,10 @@ import math
 from dataclasses import dataclass, field
 from typing import List, Optional, Literal
 from datetime import datetime, timedelta
-from scipy.stats import norm
 
 from abverdict.diagnostics.srm import check_sample_ratio
+from abverdict.utils.math import normal_cdf
+from abverdict.utils.stats import z_alpha
 
 
 @dataclass
@@ -67,6 +68,7 @@ def check_health(
     num_peeks: int = 1,
     baseline_rate: Optional[float] = None,
     minimum_detectable_effect: float = 0.10,
+    explain: bool = True,
 ) -> TestHealthReport:
     """
     Perform comprehensive health check on an A/B test.
@@ -85,6 +87,8 @@ def check_health(
         num_peeks: Number of times results have been checked
         baseline_rate: Expected baseline conversion rate (for power calc)
         minimum_detectable_effect: MDE as proportion (e.g., 0.10 for 10%)
+        explain: Build the recommendation and markdown summary (default True);
+            the individual checks are always returned
 
     Returns:
         TestHealthReport with comprehensive health assessment
@@ -118,7 +122,7 @@ def check_health(
             pass
 
     # Check 1: Sample Ratio Mismatch
-    srm_result = check_sample_ratio(control_visitors, variant_visitors, expected_ratio)
+    srm_result = check_sample_ratio(control_visitors, variant_visitors, expected_ratio, explain=False)
 
     if srm_result.is_valid:
         checks.append(HealthCheckItem(
@@ -190,7 +194,8 @@ def check_health(
 
         if se > 0:
             z_effect = effect_size / se
-            power = norm.cdf(z_effect - norm.ppf(0.975)) + norm.cdf(-z_effect - norm.ppf(0.975))
+            z_crit = z_alpha(95)
+            power = normal_cdf(z_effect - z_crit) + normal_cdf(-z_effect - z_crit)
         else:
             power = 0
 
@@ -303,34 +308,37 @@ def check_health(
         (test_duration_days is None or test_duration_days >= minimum_days)
     )
 
-    # Generate recommendation
-    if overall_status == "healthy":
-        recommendation = (
-            "Test looks healthy. You can analyze results with confidence."
-        )
-    elif overall_status == "warning":
-        recommendation = (
-            "Test has minor issues. Results may be directionally correct but "
-            "consider addressing warnings before making final decisions.\n\n"
-            f"Issues: {'; '.join(issues)}"
-        )
-    else:
-        recommendation = (
-            "TEST HAS CRITICAL ISSUES. Do not trust results until resolved.\n\n"
-            f"Critical issues: {'; '.join(issues)}"
+    recommendation = ""
+    summary = ""
+    if explain:
+        # Generate recommendation
+        if overall_status == "healthy":
+            recommendation = (
+                "Test looks healthy. You can analyze results with confidence."
+            )
+        elif overall_status == "warning":
+            recommendation = (
+                "Test has minor issues. Results may be directionally correct but "
+                "consider addressing warnings before making final decisions.\n\n"
+                f"Issues: {'; '.join(issues)}"
+            )
+        else:
+            recommendation = (
+                "TEST HAS CRITICAL ISSUES. Do not trust results until resolved.\n\n"
+                f"Critical issues: {'; '.join(issues)}"
+            )
+
+        # Generate summary
+        summary = _generate_summary(
+            checks=checks,
+            overall_status=overall_status,
+            score=score,
+            total_visitors=total_visitors,
+            test_duration_days=test_duration_days,
+            can_trust=can_trust,
+            recommendation=recommendation,
         )
 
-    # Generate summary
-    summary = _generate_summary(
-        checks=checks,
-        overall_status=overall_status,
-        score=score,
-        total_visitors=total_visitors,
-        test_duration_days=test_duration_days,
-        can_trust=can_trust,
-        recommendation=recommendation,
-    )
-
     return TestHealthReport(
         overall_status=overall_status,
         score=score,
@@ -17,7 +17,6 @@ import math
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Literal
 import numpy as np
-from scipy import stats as scipy_stats
 
 
 @dataclass
@@ -68,6 +67,7 @@ def detect_novelty_effect(
     min_days: int = 7,
     trend_threshold: float = 0.1,  # 10% change per week considered significant
     smoothing_window: int = 3,
+    explain: bool = True,
 ) -> NoveltyEffectResult:
     """
     Detect if the experiment effect is changing over time.
@@ -82,6 +82,7 @@ def detect_novelty_effect(
         min_days: Minimum days of data needed for analysis
         trend_threshold: Weekly change threshold to consider significant
         smoothing_window: Days for moving average smoothing
+        explain: Build the warning and recommendation text (default True)
 
     Returns:
         NoveltyEffectResult with trend analysis and recommendations
@@ -174,7 +175,9 @@ def detect_novelty_effect(
     days = np.arange(1, len(daily_lifts) + 1)
     lifts = np.array(daily_lifts)
 
-    slope, intercept, r_value, p_value, std_err = scipy_stats.linregress(days, lifts)
+    from scipy.stats import linregress
+
+    slope, intercept, r_value, p_value, std_err = linregress(days, lifts)
 
     # Convert slope to weekly change
     weekly_change = slope * 7
@@ -210,14 +213,16 @@ def detect_novelty_effect(
     confidence = (1 - p_value) * r_value ** 2 * 100 if p_value < 0.05 else 0
 
     # Generate warning and recommendation
-    warning, recommendation = _generate_warnings(
-        effect_type=effect_type,
-        initial_lift=initial_lift,
-        current_lift=current_lift,
-        weekly_change=weekly_change,
-        confidence=confidence,
-        projected_steady_state=projected_steady_state,
-    )
+    warning, recommendation = "", ""
+    if explain:
+        warning, recommendation = _generate_warnings(
+            effect_type=effect_type,
+            initial_lift=initial_lift,
+            current_lift=current_lift,
+            weekly_change=weekly_change,
+            confidence=confidence,
+            projected_steady_state=projected_steady_state,
+        )
 
     return NoveltyEffectResult(
         effect_detected=effect_detected,
@@ -15,7 +15,8 @@ Common causes of SRM:
 import math
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
-from scipy.stats import chi2
+
+from abverdict.utils.math import chi2_sf_1df
 
 
 @dataclass
@@ -45,6 +46,7 @@ def check_sample_ratio(
     variant_visitors: int,
     expected_ratio: float = 0.5,
     alpha: float = 0.001,  # Very low threshold - SRM is serious
+    explain: bool = True,
 ) -> SampleRatioResult:
     """
     Check for Sample Ratio Mismatch (SRM).
@@ -58,6 +60,7 @@ def check_sample_ratio(
         variant_visitors: Number of visitors in variant group
         expected_ratio: Expected proportion in control (default 0.5 for 50/50 split)
         alpha: Significance level for SRM detection (default 0.001, very strict)
+        explain: Build the warning and recommendation text (default True)
 
     Returns:
         SampleRatioResult with validity check and recommendations
@@ -109,7 +112,7 @@ def check_sample_ratio(
         ((variant_visitors - expected_variant) ** 2 / expected_variant)
     )
 
-    p_value = 1 - chi2.cdf(chi2_stat, df=1)
+    p_value = chi2_sf_1df(chi2_stat)
 
     # Calculate deviation
     deviation_percent = abs(observed_ratio - expected_ratio) / expected_ratio * 100
@@ -125,35 +128,38 @@ def check_sample_ratio(
     else:
         severity = "critical"
 
-    # Generate warning message
-    if is_valid:
-        warning = (
-            f"Traffic split looks good: {observed_ratio*100:.1f}%/{variant_ratio*100:.1f}% "
-            f"(expected {expected_ratio*100:.0f}%/{(1-expected_ratio)*100:.0f}%)."
-        )
-    else:
-        warning = (
-            f"SAMPLE RATIO MISMATCH DETECTED! "
-            f"Traffic split is {observed_ratio*100:.1f}%/{variant_ratio*100:.1f}%, "
-            f"expected {expected_ratio*100:.0f}%/{(1-expected_ratio)*100:.0f}%. "
-            f"This {deviation_percent:.1f}% deviation is statistically significant (p={p_value:.6f}). "
-            f"Your experiment results may be INVALID."
-        )
-
-    # Generate recommendation
-    if is_valid:
-        recommendation = "No action needed. Traffic is splitting as expected."
-    else:
-        recommendation = (
-            "STOP AND INVESTIGATE before trusting results:\n\n"
-            "1. **Check randomization code** - Is the bucketing logic correct?\n"
-            "2. **Look for bot traffic** - Are bots hitting one variant more?\n"
-            "3. **Check for redirects** - Are there any redirects affecting traffic?\n"
-            "4. **Review JavaScript errors** - Are errors preventing tracking in one variant?\n"
-            "5. **Check caching** - Is one variant being cached differently?\n"
-            "6. **Review recent deployments** - Did anything change recently?\n\n"
-            "DO NOT trust experiment results until SRM is resolved."
-        )
+    warning = ""
+    recommendation = ""
+    if explain:
+        # Generate warning message
+        if is_valid:
+            warning = (
+                f"Traffic split looks good: {observed_ratio*100:.1f}%/{variant_ratio*100:.1f}% "
+                f"(expected {expected_ratio*100:.0f}%/{(1-expected_ratio)*100:.0f}%)."
+            )
+        else:
+            warning = (
+                f"SAMPLE RATIO MISMATCH DETECTED! "
+                f"Traffic split is {observed_ratio*100:.1f}%/{variant_ratio*100:.1f}%, "
+                f"expected {expected_ratio*100:.0f}%/{(1-expected_ratio)*100:.0f}%. "
+                f"This {deviation_percent:.1f}% deviation is statistically significant (p={p_value:.6f}). "
+                f"Your experiment results may be INVALID."
+            )
+
+        # Generate recommendation
+        if is_valid:
+            recommendation = "No action needed. Traffic is splitting as expected."
+        else:
+            recommendation = (
+                "STOP AND INVESTIGATE before trusting results:\n\n"
+                "1. **Check randomization code** - Is the bucketing logic correct?\n"
+                "2. **Look for bot traffic** - Are bots hitting one variant more?\n"
+                "3. **Check for redirects** - Are there any redirects affecting traffic?\n"
+                "4. **Review JavaScript errors** - Are errors preventing tracking in one variant?\n"
+                "5. **Check caching** - Is one variant being cached differently?\n"
+                "6. **Review recent deployments** - Did anything change recently?\n\n"
+                "DO NOT trust experiment results until SRM is resolved."
+            )
 
     return SampleRatioResult(
         control_visitors=control_visitors,
@@ -174,6 +180,7 @@ def check_sample_ratio_multi(
     variant_visitors: List[int],
     expected_ratios: Optional[List[float]] = None,
     alpha: float = 0.001,
+    explain: bool = True,
 ) -> SampleRatioResult:
     """
     Check for SRM with multiple variants.
@@ -182,6 +189,7 @@ def check_sample_ratio_multi(
         variant_visitors: List of visitor counts for each variant
         expected_ratios: Expected proportions (default: equal split)
         alpha: Significance level
+        explain: Build the warning and recommendation text (default True)
 
     Returns:
         SampleRatioResult for the overall check
@@ -224,6 +232,8 @@ def check_sample_ratio_multi(
         if expected > 0:
             chi2_stat += (observed - expected) ** 2 / expected
 
+    from scipy.stats import chi2
+
     df = n_variants - 1
     p_value = 1 - chi2.cdf(chi2_stat, df)
 
@@ -244,7 +254,7 @@ def check_sample_ratio_multi(
         warning = (
             f"SAMPLE RATIO MISMATCH DETECTED across {n_variants} variants! "
             f"Maximum deviation: {max_deviation:.1f}% (p={p_value:.6f})."
-        )
+        ) if explain else ""
 
     return SampleRatioResult(
         control_visitors=variant_visitors[0],
@@ -257,7 +267,10 @@ def check_sample_ratio_multi(
         severity=severity,
         deviation_percent=max_deviation,
         warning=warning,
-        recommendation="Investigate SRM before trusting results." if not is_valid else "No action needed.",
+        recommendation=(
+            ("Investigate SRM before trusting results." if not is_valid else "No action needed.")
+            if explain else ""
+        ),
     )
 
 
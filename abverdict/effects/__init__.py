@@ -1,3 +1,8 @@
-from abverdict.effects import outcome
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules={"outcome": "abverdict.effects.outcome"},
+)
 
 __all__ = ["outcome"]
@@ -1,5 +1,12 @@
-from abverdict.effects.outcome import conversion
-from abverdict.effects.outcome import magnitude
-from abverdict.effects.outcome import timing
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules={
+        "conversion": "abverdict.effects.outcome.conversion",
+        "magnitude": "abverdict.effects.outcome.magnitude",
+        "timing": "abverdict.effects.outcome.timing",
+    },
+)
 
 __all__ = ["conversion", "magnitude", "timing"]
@@ -1,17 +1,26 @@
 import math
-from scipy.stats import norm, chi2_contingency
 from typing import Literal, Optional, List, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 from abverdict.effects.outcome.base import FullOutcomeEffect
+from abverdict.utils import frames
+from abverdict.utils.math import normal_sf
+from abverdict.utils.validation import validate_visitors_array
 from abverdict.utils.stats import (
     sample_size_two_proportions,
     z_test_two_proportions,
+    z_test_two_proportions_array,
     proportion_ci,
     proportion_difference_se,
+    proportion_difference_se_array,
     lift_calculations,
+    lift_calculations_array,
     bonferroni_correction,
     z_alpha as get_z_alpha,
+    z_alpha_array,
+    critical_z,
 )
 
 
@@ -158,6 +167,42 @@ class ConversionDiffInDiffResults:
     recommendation: str
 
 
+class ConversionResultsFrame(frames.ResultsFrame):
+    """Columnar results of ``ConversionEffect.analyze_batch``, one row per test."""
+
+    _columns = (
+        "control_rate",
+        "variant_rate",
+        "lift_percent",
+        "lift_absolute",
+        "is_significant",
+        "confidence",
+        "p_value",
+        "confidence_interval_lower",
+        "confidence_interval_upper",
+        "control_visitors",
+        "control_conversions",
+        "variant_visitors",
+        "variant_conversions",
+    )
+    _derived = ("winner",)
+
+    @property
+    def winner(self) -> np.ndarray:
+        direction = np.where(self.variant_rate > self.control_rate, "variant", "control")
+        decided = np.where(self.is_significant, direction, "no winner yet")
+        return np.where(np.isnan(self.p_value), "invalid", decided)
+
+    def result(self, index: int) -> ConversionTestResults:
+        """Materialize one row as a full ``ConversionTestResults``."""
+        row = self[index].to_dict()
+        if math.isnan(row["p_value"]):
+            raise ValueError(f"Row {index} has invalid inputs; see frame.validation")
+        result = ConversionTestResults(**row, recommendation="")
+        result.recommendation = _default_instance._generate_recommendation(result)
+        return result
+
+
 class ConversionEffect(FullOutcomeEffect):
     
     def sample_size(
@@ -208,6 +253,7 @@ class ConversionEffect(FullOutcomeEffect):
         variant_visitors: int,
         variant_conversions: int,
         confidence: int = 95,
+        explain: bool = True,
     ) -> ConversionTestResults:
         if control_conversions > control_visitors:
             raise ValueError("control_conversions cannot exceed control_visitors")
@@ -249,10 +295,78 @@ class ConversionEffect(FullOutcomeEffect):
             recommendation="",
         )
         
-        result.recommendation = self._generate_recommendation(result)
+        if explain:
+            result.recommendation = self._generate_recommendation(result)
         
         return result
     
+    def analyze_batch(
+        self,
+        control_visitors,
+        control_conversions,
+        variant_visitors,
+        variant_conversions,
+        confidence=95,
+        strict: bool = False,
+    ) -> ConversionResultsFrame:
+        """
+        Analyze many A/B tests at once.
+
+        Arguments broadcast like NumPy arrays; every row matches what
+        ``analyze`` returns for the same inputs, without the per-row
+        recommendation text (use ``frame.result(i)`` for that).
+
+        Rows with invalid counts do not abort the batch: their statistics
+        are NaN, their winner is "invalid" and ``frame.validation`` lists
+        them by reason. Pass ``strict=True`` to raise instead.
+        """
+        control_visitors, control_conversions, variant_visitors, variant_conversions, confidence = (
+            np.broadcast_arrays(
+                *(np.atleast_1d(np.asarray(v)) for v in (
+                    control_visitors, control_conversions, variant_visitors, variant_conversions, confidence,
+                ))
+            )
+        )
+        report = validate_visitors_array(
+            control_visitors, control_conversions, "control_visitors", "control_conversions"
+        ).merge(validate_visitors_array(
+            variant_visitors, variant_conversions, "variant_visitors", "variant_conversions"
+        ))
+        if strict:
+            report.raise_if_invalid()
+
+        # Invalid rows are computed on placeholder counts and blanked afterwards
+        n1, c1 = report.where_valid(control_visitors, 1), report.where_valid(control_conversions, 0)
+        n2, c2 = report.where_valid(variant_visitors, 1), report.where_valid(variant_conversions, 0)
+        p1 = c1 / n1
+        p2 = c2 / n2
+
+        lift_absolute, lift_percent = lift_calculations_array(p1, p2)
+        test_result = z_test_two_proportions_array(p1, n1, p2, n2, confidence)
+
+        margin = z_alpha_array(confidence) * proportion_difference_se_array(p1, n1, p2, n2)
+
+        def blank(values):
+            return report.where_valid(values, np.nan)
+
+        frame = ConversionResultsFrame(
+            control_rate=blank(p1),
+            variant_rate=blank(p2),
+            lift_percent=blank(lift_percent),
+            lift_absolute=blank(lift_absolute),
+            is_significant=report.where_valid(test_result.is_significant, False),
+            confidence=confidence,
+            p_value=blank(test_result.p_value),
+            confidence_interval_lower=blank(lift_absolute - margin),
+            confidence_interval_upper=blank(lift_absolute + margin),
+            control_visitors=control_visitors,
+            control_conversions=control_conversions,
+            variant_visitors=variant_visitors,
+            variant_conversions=variant_conversions,
+        )
+        frame.validation = report
+        return frame
+    
     def _generate_recommendation(self, result: ConversionTestResults) -> str:
         direction = "higher" if result.variant_rate > result.control_rate else "lower"
         
@@ -307,6 +421,7 @@ class ConversionEffect(FullOutcomeEffect):
         variants: List[Dict[str, Any]],
         confidence: int = 95,
         correction: Literal["bonferroni", "none"] = "bonferroni",
+        explain: bool = True,
     ) -> ConversionMultiVariantResults:
         if len(variants) < 2:
             raise ValueError("At least 2 variants are required")
@@ -329,6 +444,8 @@ class ConversionEffect(FullOutcomeEffect):
         for v in variant_objects:
             observed.append([v.conversions, v.visitors - v.conversions])
         
+        from scipy.stats import chi2_contingency
+
         chi2, p_value, dof, expected = chi2_contingency(observed)
         
         alpha = 1 - (confidence / 100)
@@ -352,9 +469,11 @@ class ConversionEffect(FullOutcomeEffect):
                 
                 pairwise.append(comparison)
         
-        recommendation = self._generate_multi_recommendation(
-            variant_objects, is_significant, p_value, best_variant, pairwise, confidence
-        )
+        recommendation = ""
+        if explain:
+            recommendation = self._generate_multi_recommendation(
+                variant_objects, is_significant, p_value, best_variant, pairwise, confidence
+            )
         
         return ConversionMultiVariantResults(
             variants=variant_objects,
@@ -555,6 +674,7 @@ class ConversionEffect(FullOutcomeEffect):
         treatment_post_visitors: int,
         treatment_post_conversions: int,
         confidence: int = 95,
+        explain: bool = True,
     ) -> ConversionDiffInDiffResults:
         if control_pre_conversions > control_pre_visitors:
             raise ValueError("control_pre_conversions cannot exceed control_pre_visitors")
@@ -585,11 +705,11 @@ class ConversionEffect(FullOutcomeEffect):
         se_did = math.sqrt(var_c_pre + var_c_post + var_t_pre + var_t_post)
         
         alpha = 1 - (confidence / 100)
-        z_crit = norm.ppf(1 - alpha / 2)
+        z_crit = critical_z(alpha)
         
         if se_did > 0:
             z_stat = did / se_did
-            p_value = 2 * (1 - norm.cdf(abs(z_stat)))
+            p_value = 2 * normal_sf(abs(z_stat))
         else:
             z_stat = 0
             p_value = 1.0
@@ -625,7 +745,8 @@ class ConversionEffect(FullOutcomeEffect):
             recommendation="",
         )
         
-        result.recommendation = self._generate_did_recommendation(result)
+        if explain:
+            result.recommendation = self._generate_did_recommendation(result)
         
         return result
     
@@ -700,6 +821,7 @@ _default_instance = ConversionEffect()
 
 sample_size = _default_instance.sample_size
 analyze = _default_instance.analyze
+analyze_batch = _default_instance.analyze_batch
 analyze_multi = _default_instance.analyze_multi
 confidence_interval = _default_instance.confidence_interval
 summarize = _default_instance.summarize
@@ -715,11 +837,13 @@ Variant = ConversionVariant
 PairwiseComparison = ConversionPairwiseComparison
 MultiVariantResults = ConversionMultiVariantResults
 DiffInDiffResults = ConversionDiffInDiffResults
+ResultsFrame = ConversionResultsFrame
 
 __all__ = [
     "ConversionEffect",
     "ConversionSampleSizePlan",
     "ConversionTestResults",
+    "ConversionResultsFrame",
     "ConversionConfidenceInterval",
     "ConversionVariant",
     "ConversionPairwiseComparison",
@@ -727,6 +851,7 @@ __all__ = [
     "ConversionDiffInDiffResults",
     "sample_size",
     "analyze",
+    "analyze_batch",
     "analyze_multi",
     "confidence_interval",
     "summarize",
@@ -741,4 +866,5 @@ __all__ = [
     "PairwiseComparison",
     "MultiVariantResults",
     "DiffInDiffResults",
+    "ResultsFrame",
 ]
@@ -1,18 +1,33 @@
 import math
-from scipy.stats import norm, t, f as f_dist
 from typing import Literal, Optional, List, Dict, Any
 from dataclasses import dataclass
 
+import numpy as np
+
 from abverdict.effects.outcome.base import FullOutcomeEffect
+from abverdict.utils import frames
+from abverdict.utils.math import t_cdf
+from abverdict.utils.validation import (
+    validate_finite_array,
+    validate_non_negative_array,
+    validate_sample_size_array,
+)
 from abverdict.utils.stats import (
     sample_size_two_means,
     welch_t_test,
+    welch_t_test_array,
     mean_ci as calc_mean_ci,
     mean_difference_se,
+    mean_difference_se_array,
     lift_calculations,
+    lift_calculations_array,
     bonferroni_correction,
     t_critical,
+    t_critical_array,
     welch_df,
+    welch_df_array,
+    critical_t,
+    critical_z,
 )
 
 
@@ -159,6 +174,42 @@ class MagnitudeDiffInDiffResults:
     recommendation: str
 
 
+class MagnitudeResultsFrame(frames.ResultsFrame):
+    """Columnar results of ``MagnitudeEffect.analyze_batch``, one row per test."""
+
+    _columns = (
+        "control_mean",
+        "variant_mean",
+        "lift_percent",
+        "lift_absolute",
+        "is_significant",
+        "confidence",
+        "p_value",
+        "confidence_interval_lower",
+        "confidence_interval_upper",
+        "control_visitors",
+        "control_std",
+        "variant_visitors",
+        "variant_std",
+    )
+    _derived = ("winner",)
+
+    @property
+    def winner(self) -> np.ndarray:
+        direction = np.where(self.variant_mean > self.control_mean, "variant", "control")
+        decided = np.where(self.is_significant, direction, "no winner yet")
+        return np.where(np.isnan(self.p_value), "invalid", decided)
+
+    def result(self, index: int) -> MagnitudeTestResults:
+        """Materialize one row as a full ``MagnitudeTestResults``."""
+        row = self[index].to_dict()
+        if math.isnan(row["p_value"]):
+            raise ValueError(f"Row {index} has invalid inputs; see frame.validation")
+        result = MagnitudeTestResults(**row, recommendation="")
+        result.recommendation = _default_instance._generate_recommendation(result)
+        return result
+
+
 class MagnitudeEffect(FullOutcomeEffect):
     
     def sample_size(
@@ -209,6 +260,7 @@ class MagnitudeEffect(FullOutcomeEffect):
         variant_mean: float,
         variant_std: float,
         confidence: int = 95,
+        explain: bool = True,
     ) -> MagnitudeTestResults:
         if control_visitors <= 0 or variant_visitors <= 0:
             raise ValueError("visitors must be positive")
@@ -252,10 +304,85 @@ class MagnitudeEffect(FullOutcomeEffect):
             recommendation="",
         )
         
-        result.recommendation = self._generate_recommendation(result)
+        if explain:
+            result.recommendation = self._generate_recommendation(result)
         
         return result
     
+    def analyze_batch(
+        self,
+        control_visitors,
+        control_mean,
+        control_std,
+        variant_visitors,
+        variant_mean,
+        variant_std,
+        confidence=95,
+        strict: bool = False,
+    ) -> MagnitudeResultsFrame:
+        """
+        Analyze many A/B tests at once.
+
+        Arguments broadcast like NumPy arrays; every row matches what
+        ``analyze`` returns for the same inputs, without the per-row
+        recommendation text (use ``frame.result(i)`` for that).
+
+        Rows with invalid inputs do not abort the batch: their statistics
+        are NaN, their winner is "invalid" and ``frame.validation`` lists
+        them by reason. Pass ``strict=True`` to raise instead.
+        """
+        control_visitors, control_mean, control_std, variant_visitors, variant_mean, variant_std, confidence = (
+            np.broadcast_arrays(
+                *(np.atleast_1d(np.asarray(v)) for v in (
+                    control_visitors, control_mean, control_std,
+                    variant_visitors, variant_mean, variant_std, confidence,
+                ))
+            )
+        )
+        report = validate_sample_size_array(control_visitors, "control_visitors", min_recommended=None)
+        for check in (
+            validate_sample_size_array(variant_visitors, "variant_visitors", min_recommended=None),
+            validate_finite_array(control_mean, "control_mean"),
+            validate_finite_array(variant_mean, "variant_mean"),
+            validate_non_negative_array(control_std, "control_std"),
+            validate_non_negative_array(variant_std, "variant_std"),
+        ):
+            report = report.merge(check)
+        if strict:
+            report.raise_if_invalid()
+
+        # Invalid rows are computed on placeholder inputs and blanked afterwards
+        n1, n2 = report.where_valid(control_visitors, 2), report.where_valid(variant_visitors, 2)
+        m1, m2 = report.where_valid(control_mean, 1.0), report.where_valid(variant_mean, 1.0)
+        s1, s2 = report.where_valid(control_std, 1.0), report.where_valid(variant_std, 1.0)
+
+        lift_absolute, lift_percent = lift_calculations_array(m1, m2)
+        test_result = welch_t_test_array(m1, s1, n1, m2, s2, n2, confidence)
+
+        df = welch_df_array(s1**2, s2**2, n1, n2)
+        margin = t_critical_array(df, confidence) * mean_difference_se_array(s1, n1, s2, n2)
+
+        def blank(values):
+            return report.where_valid(values, np.nan)
+
+        frame = MagnitudeResultsFrame(
+            control_mean=control_mean,
+            variant_mean=variant_mean,
+            lift_percent=blank(lift_percent),
+            lift_absolute=blank(lift_absolute),
+            is_significant=report.where_valid(test_result.is_significant, False),
+            confidence=confidence,
+            p_value=blank(test_result.p_value),
+            confidence_interval_lower=blank(lift_absolute - margin),
+            confidence_interval_upper=blank(lift_absolute + margin),
+            control_visitors=control_visitors,
+            control_std=control_std,
+            variant_visitors=variant_visitors,
+            variant_std=variant_std,
+        )
+        frame.validation = report
+        return frame
+    
     def _generate_recommendation(self, result: MagnitudeTestResults, currency: str = "$") -> str:
         direction = "higher" if result.variant_mean > result.control_mean else "lower"
         
@@ -312,6 +439,7 @@ class MagnitudeEffect(FullOutcomeEffect):
         variants: List[Dict[str, Any]],
         confidence: int = 95,
         correction: Literal["bonferroni", "none"] = "bonferroni",
+        explain: bool = True,
     ) -> MagnitudeMultiVariantResults:
         if len(variants) < 2:
             raise ValueError("At least 2 variants are required")
@@ -349,6 +477,8 @@ class MagnitudeEffect(FullOutcomeEffect):
         ms_within = ss_within / df_within if df_within > 0 else 0
 
         if ms_within > 0:
+            from scipy.stats import f as f_dist
+
             f_stat = ms_between / ms_within
             p_value = 1 - f_dist.cdf(f_stat, df_between, df_within) if f_stat > 0 else 1.0
         elif ms_between > 0:
@@ -380,9 +510,11 @@ class MagnitudeEffect(FullOutcomeEffect):
                 
                 pairwise.append(comparison)
         
-        recommendation = self._generate_multi_recommendation(
-            variant_objects, is_significant, p_value, best_variant, pairwise, confidence
-        )
+        recommendation = ""
+        if explain:
+            recommendation = self._generate_multi_recommendation(
+                variant_objects, is_significant, p_value, best_variant, pairwise, confidence
+            )
         
         return MagnitudeMultiVariantResults(
             variants=variant_objects,
@@ -609,6 +741,7 @@ class MagnitudeEffect(FullOutcomeEffect):
         treatment_post_mean: float,
         treatment_post_std: float,
         confidence: int = 95,
+        explain: bool = True,
     ) -> MagnitudeDiffInDiffResults:
         if any(n <= 0 for n in [control_pre_n, control_post_n, treatment_pre_n, treatment_post_n]):
             raise ValueError("All sample sizes must be positive")
@@ -636,12 +769,12 @@ class MagnitudeEffect(FullOutcomeEffect):
         
         if se_did > 0 and df > 0:
             t_stat = did / se_did
-            p_value = 2 * (1 - t.cdf(abs(t_stat), df))
+            p_value = 2 * t_cdf(-abs(t_stat), df)
         else:
             t_stat = 0
             p_value = 1.0
         
-        t_crit = t.ppf(1 - alpha / 2, df) if df > 0 else norm.ppf(1 - alpha / 2)
+        t_crit = critical_t(df, alpha) if df > 0 else critical_z(alpha)
         ci_lower = did - t_crit * se_did
         ci_upper = did + t_crit * se_did
         
@@ -674,7 +807,8 @@ class MagnitudeEffect(FullOutcomeEffect):
             recommendation="",
         )
         
-        result.recommendation = self._generate_did_recommendation(result)
+        if explain:
+            result.recommendation = self._generate_did_recommendation(result)
         
         return result
     
@@ -756,6 +890,7 @@ _default_instance = MagnitudeEffect()
 
 sample_size = _default_instance.sample_size
 analyze = _default_instance.analyze
+analyze_batch = _default_instance.analyze_batch
 analyze_multi = _default_instance.analyze_multi
 confidence_interval = _default_instance.confidence_interval
 summarize = _default_instance.summarize
@@ -771,11 +906,13 @@ Variant = MagnitudeVariant
 PairwiseComparison = MagnitudePairwiseComparison
 MultiVariantResults = MagnitudeMultiVariantResults
 DiffInDiffResults = MagnitudeDiffInDiffResults
+ResultsFrame = MagnitudeResultsFrame
 
 __all__ = [
     "MagnitudeEffect",
     "MagnitudeSampleSizePlan",
     "MagnitudeTestResults",
+    "MagnitudeResultsFrame",
     "MagnitudeConfidenceInterval",
     "MagnitudeVariant",
     "MagnitudePairwiseComparison",
@@ -783,6 +920,7 @@ __all__ = [
     "MagnitudeDiffInDiffResults",
     "sample_size",
     "analyze",
+    "analyze_batch",
     "analyze_multi",
     "confidence_interval",
     "summarize",
@@ -797,4 +935,5 @@ __all__ = [
     "PairwiseComparison",
     "MultiVariantResults",
     "DiffInDiffResults",
+    "ResultsFrame",
 ]
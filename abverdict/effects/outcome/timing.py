@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 import numpy as np
-from scipy import stats
 
+from abverdict.utils.math import chi2_sf_1df
+from abverdict.utils.profiling import stage
 from abverdict.utils.stats import (
     sample_size_survival,
     hazard_ratio_from_events,
+    z_alpha,
 )
 
 
@@ -111,8 +113,7 @@ def _kaplan_meier(times: np.ndarray, events: np.ndarray, confidence: int = 95) -
     variance = np.array([0.0] + variance)
     km_times = np.array(km_times)
     
-    alpha = 1 - confidence / 100
-    z = stats.norm.ppf(1 - alpha / 2)
+    z = z_alpha(confidence)
 
     # Use log transformation for CIs to ensure they stay in [0, 1]
     with np.errstate(divide='ignore', invalid='ignore'):
@@ -187,13 +188,15 @@ def _log_rank_test(
         E1 += (at_risk_trt / n) * d if n > 0 else 0
         
         if n > 1:
-            V += (at_risk_ctrl * at_risk_trt * d * (n - d)) / (n * n * (n - 1))
+            # Divide before multiplying: the integer product overflows int64
+            # once each arm has ~10^5 subjects at risk
+            V += (at_risk_ctrl / n) * (at_risk_trt / n) * d * (n - d) / (n - 1)
     
     if V <= 0:
         return 0.0, 1.0
     
     chi2 = (O1 - E1) ** 2 / V
-    p_value = 1 - stats.chi2.cdf(chi2, df=1)
+    p_value = chi2_sf_1df(chi2)
     
     return float(chi2), float(p_value)
 
@@ -299,7 +302,8 @@ def survival_curve(
     if not np.all((events_arr == 0) | (events_arr == 1)):
         raise ValueError("events must contain only 0 (censored) or 1 (event occurred)")
     
-    km_times, survival, ci_lower, ci_upper = _kaplan_meier(times_arr, events_arr, confidence)
+    with stage("timing.kaplan_meier"):
+        km_times, survival, ci_lower, ci_upper = _kaplan_meier(times_arr, events_arr, confidence)
     median = _find_median(km_times, survival)
     
     return SurvivalCurve(
@@ -320,6 +324,7 @@ def analyze(
     treatment_times: List[float],
     treatment_events: List[int],
     confidence: int = 95,
+    explain: bool = True,
 ) -> TimingResults:
     ctrl_times = np.array(control_times, dtype=float)
     ctrl_events = np.array(control_events, dtype=int)
@@ -333,15 +338,18 @@ def analyze(
     if len(ctrl_times) == 0 or len(trt_times) == 0:
         raise ValueError("Both groups must have at least one observation")
     
-    ctrl_km_times, ctrl_surv, _, _ = _kaplan_meier(ctrl_times, ctrl_events, confidence)
-    trt_km_times, trt_surv, _, _ = _kaplan_meier(trt_times, trt_events, confidence)
+    with stage("timing.kaplan_meier"):
+        ctrl_km_times, ctrl_surv, _, _ = _kaplan_meier(ctrl_times, ctrl_events, confidence)
+        trt_km_times, trt_surv, _, _ = _kaplan_meier(trt_times, trt_events, confidence)
     
     ctrl_median = _find_median(ctrl_km_times, ctrl_surv)
     trt_median = _find_median(trt_km_times, trt_surv)
     
-    _, p_value = _log_rank_test(ctrl_times, ctrl_events, trt_times, trt_events)
+    with stage("timing.log_rank"):
+        _, p_value = _log_rank_test(ctrl_times, ctrl_events, trt_times, trt_events)
     
-    hr, hr_lower, hr_upper = _estimate_hazard_ratio(ctrl_times, ctrl_events, trt_times, trt_events, confidence)
+    with stage("timing.hazard_ratio"):
+        hr, hr_lower, hr_upper = _estimate_hazard_ratio(ctrl_times, ctrl_events, trt_times, trt_events, confidence)
     
     alpha = 1 - confidence / 100
     is_significant = p_value < alpha
@@ -352,14 +360,17 @@ def analyze(
         time_saved = ctrl_median - trt_median
         time_saved_percent = (time_saved / ctrl_median) * 100 if ctrl_median > 0 else None
     
-    recommendation = _generate_timing_recommendation(
-        is_significant=is_significant,
-        p_value=p_value,
-        hazard_ratio=hr,
-        time_saved=time_saved,
-        time_saved_percent=time_saved_percent,
-        confidence=confidence,
-    )
+    recommendation = ""
+    if explain:
+        with stage("timing.recommendation"):
+            recommendation = _generate_timing_recommendation(
+                is_significant=is_significant,
+                p_value=p_value,
+                hazard_ratio=hr,
+                time_saved=time_saved,
+                time_saved_percent=time_saved_percent,
+                confidence=confidence,
+            )
     
     return TimingResults(
         control_median_time=ctrl_median,
@@ -448,6 +459,7 @@ def analyze_rates(
     treatment_events: int,
     treatment_exposure: float,
     confidence: int = 95,
+    explain: bool = True,
 ) -> RateResults:
     if control_events < 0 or treatment_events < 0:
         raise ValueError("Event counts must be non-negative")
@@ -466,7 +478,7 @@ def analyze_rates(
         if control_events > 0 and treatment_events > 0:
             se_log_rr = np.sqrt(1/control_events + 1/treatment_events)
             log_rr = np.log(rate_ratio)
-            z = stats.norm.ppf(1 - (1 - confidence/100) / 2)
+            z = z_alpha(confidence)
             rr_lower = np.exp(log_rr - z * se_log_rr)
             rr_upper = np.exp(log_rr + z * se_log_rr)
         else:
@@ -481,22 +493,24 @@ def analyze_rates(
     if expected_ctrl > 0 and expected_trt > 0:
         chi2 = ((control_events - expected_ctrl) ** 2 / expected_ctrl + 
                 (treatment_events - expected_trt) ** 2 / expected_trt)
-        p_value = 1 - stats.chi2.cdf(chi2, df=1)
+        p_value = chi2_sf_1df(chi2)
     else:
         p_value = 1.0
     
     alpha = 1 - confidence / 100
     is_significant = p_value < alpha
     
-    recommendation = _generate_rate_recommendation(
-        is_significant=is_significant,
-        p_value=p_value,
-        rate_ratio=rate_ratio,
-        ctrl_rate=ctrl_rate,
-        trt_rate=trt_rate,
-        rate_diff_percent=rate_diff_percent,
-        confidence=confidence,
-    )
+    recommendation = ""
+    if explain:
+        recommendation = _generate_rate_recommendation(
+            is_significant=is_significant,
+            p_value=p_value,
+            rate_ratio=rate_ratio,
+            ctrl_rate=ctrl_rate,
+            trt_rate=trt_rate,
+            rate_diff_percent=rate_diff_percent,
+            confidence=confidence,
+        )
     
     return RateResults(
         control_rate=ctrl_rate,
@@ -668,8 +682,9 @@ class TimingEffect:
         treatment_times: List[float],
         treatment_events: List[int],
         confidence: int = 95,
+        explain: bool = True,
     ) -> TimingResults:
-        return analyze(control_times, control_events, treatment_times, treatment_events, confidence)
+        return analyze(control_times, control_events, treatment_times, treatment_events, confidence, explain)
     
     def sample_size(
         self,
@@ -697,8 +712,9 @@ class TimingEffect:
         treatment_events: int,
         treatment_exposure: float,
         confidence: int = 95,
+        explain: bool = True,
     ) -> RateResults:
-        return analyze_rates(control_events, control_exposure, treatment_events, treatment_exposure, confidence)
+        return analyze_rates(control_events, control_exposure, treatment_events, treatment_exposure, confidence, explain)
     
     def summarize(self, result: TimingResults, test_name: str = "Timing Effect Test") -> str:
         return summarize(result, test_name)
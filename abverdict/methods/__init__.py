@@ -3,10 +3,19 @@ Statistical methods for A/B testing.
 
 This module provides different statistical approaches:
 - sequential: Sequential testing with early stopping
+- msprt: Always-valid testing for continuous monitoring
 - bayesian: Bayesian A/B testing
 """
 
-from abverdict.methods import sequential
-from abverdict.methods import bayesian
+from abverdict._lazy import attach
 
-__all__ = ["sequential", "bayesian"]
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules={
+        "sequential": "abverdict.methods.sequential",
+        "msprt": "abverdict.methods.msprt",
+        "bayesian": "abverdict.methods.bayesian",
+    },
+)
+
+__all__ = ["sequential", "msprt", "bayesian"]
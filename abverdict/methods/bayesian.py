@@ -16,10 +16,19 @@ References:
 """
 
 import math
-from dataclasses import dataclass
-from typing import Literal, Optional, Tuple, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Literal, Optional, Tuple, List
 import numpy as np
-from scipy import stats as scipy_stats
+from scipy.special import (
+    betainc, betaincinv, betaln, digamma, ndtr, ndtri, polygamma, stdtr, stdtrit, xlog1py, xlogy,
+)
+
+from abverdict.utils import frames
+from abverdict.utils.math import normal_cdf
+from abverdict.utils.profiling import stage
+from abverdict.utils.rng import Seed, make_rng
+from abverdict.utils.validation import validate_visitors_array
 
 
 @dataclass
@@ -60,6 +69,11 @@ class BayesianTestResult:
     # Recommendation
     recommendation: str
 
+    # Monte Carlo precision: draws used and the standard error of each
+    # sampled field (same units as the field); empty if nothing was sampled
+    monte_carlo_samples: int = 0
+    monte_carlo_error: Dict[str, float] = field(default_factory=dict)
+
 
 @dataclass
 class BayesianMultiVariantResult:
@@ -69,6 +83,49 @@ class BayesianMultiVariantResult:
     expected_losses: dict     # {variant_name: expected_loss}
     best_variant: str
     recommendation: str
+    monte_carlo_samples: int = 0
+    monte_carlo_error: Dict[str, float] = field(default_factory=dict)  # Largest SE over variants
+
+
+@dataclass
+class BayesianContinuousResult:
+    """Results from Bayesian analysis of a continuous metric."""
+
+    # Input data
+    model: Literal["normal", "lognormal"]
+    control_visitors: int
+    control_mean: float
+    control_std: float
+    variant_visitors: int
+    variant_mean: float
+    variant_std: float
+
+    # Bayesian metrics
+    probability_variant_better: float  # P(variant mean > control mean)
+    probability_control_better: float
+
+    # Expected loss, in the metric's own units
+    expected_loss_choosing_variant: float
+    expected_loss_choosing_control: float
+
+    # Credible intervals for each group's mean, for variant - control and
+    # for the relative lift in percent
+    control_credible_interval: Tuple[float, float]
+    variant_credible_interval: Tuple[float, float]
+    difference_credible_interval: Tuple[float, float]
+    lift_credible_interval: Tuple[float, float]
+
+    # Point estimates
+    lift_percent: float
+    lift_absolute: float
+
+    # Decision
+    has_winner: bool
+    winner: Literal["control", "variant", "none"]
+    confidence_threshold: float
+
+    # Recommendation
+    recommendation: str
 
 
 def _beta_posterior(successes: int, trials: int, prior_alpha: float = 1, prior_beta: float = 1):
@@ -87,83 +144,674 @@ def _beta_posterior(successes: int, trials: int, prior_alpha: float = 1, prior_b
     return posterior_alpha, posterior_beta
 
 
+ProbabilityMethod = Literal["auto", "exact", "quadrature", "normal", "monte_carlo"]
+
+# Cost model for method="auto", in units of one term of the exact sum.
+# Quadrature costs about as much as a ~1000-term sum; the normal
+# approximation is essentially free but only used once every posterior
+# parameter is large enough for it to be accurate to ~1e-5.
+_QUADRATURE_COST = 1_000
+_NORMAL_MIN_PARAMETER = 10_000
+
+# Fixed Gauss-Legendre rule for smooth integrands; densities with a
+# parameter below _GAUSS_MIN_PARAMETER are too steep at the boundary for it
+# and fall back to adaptive quadrature.
+_GAUSS_NODES, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(96)
+_GAUSS_MIN_PARAMETER = 3
+
+
+def _miller_sum(alpha_a: float, beta_a: float, alpha_b: float, beta_b: float) -> float:
+    """
+    Exact P(B > A) for integer alpha_b (Evan Miller's closed form).
+
+    P(B > A) = sum_{i=0}^{alpha_b-1} B(alpha_a+i, beta_a+beta_b)
+               / ((beta_b+i) B(1+i, beta_b) B(alpha_a, beta_a))
+
+    Evaluated in log space, so large counts do not overflow.
+    """
+    i = np.arange(int(alpha_b))
+    log_terms = (
+        betaln(alpha_a + i, beta_a + beta_b)
+        - np.log(beta_b + i)
+        - betaln(1 + i, beta_b)
+        - betaln(alpha_a, beta_a)
+    )
+    peak = log_terms.max()
+    return float(np.exp(peak) * np.exp(log_terms - peak).sum())
+
+
+def _exact_probability(alpha_a: float, beta_a: float, alpha_b: float, beta_b: float) -> float:
+    """
+    Exact P(B > A) summing over the smallest integer posterior parameter.
+
+    The sum runs over alpha_b; the other three parameters are reached through
+    P(B > A) = 1 - P(A > B) and the reflection p -> 1 - p, which swaps the
+    roles of alpha and beta.
+    """
+    forms = [
+        (alpha_b, lambda: _miller_sum(alpha_a, beta_a, alpha_b, beta_b)),
+        (beta_a, lambda: _miller_sum(beta_b, alpha_b, beta_a, alpha_a)),
+        (alpha_a, lambda: 1 - _miller_sum(alpha_b, beta_b, alpha_a, beta_a)),
+        (beta_b, lambda: 1 - _miller_sum(beta_a, alpha_a, beta_b, alpha_b)),
+    ]
+    forms = [(terms, f) for terms, f in forms if float(terms).is_integer()]
+    if not forms:
+        raise ValueError("The exact sum needs at least one integer posterior parameter")
+    # min() keeps the first of equal-length forms, preferring the direct sums
+    # over the complements, which lose relative precision for tiny probabilities
+    _, evaluate = min(forms, key=lambda form: form[0])
+    return min(max(evaluate(), 0.0), 1.0)
+
+
+def _beta_variance(alpha: float, beta: float) -> float:
+    n = alpha + beta
+    return alpha * beta / (n * n * (n + 1))
+
+
+def _quadrature_probability(alpha_a: float, beta_a: float, alpha_b: float, beta_b: float) -> float:
+    """
+    P(B > A) = integral of pdf_B(x) * cdf_A(x) dx.
+
+    The integral runs over the narrower posterior's density (using
+    P(B > A) = 1 - P(A > B) when that is A), so the other arm's CDF is smooth
+    across the integration window.
+    """
+    flip = _beta_variance(alpha_a, beta_a) < _beta_variance(alpha_b, beta_b)
+    if flip:
+        alpha_a, beta_a, alpha_b, beta_b = alpha_b, beta_b, alpha_a, beta_a
+
+    # Integrate over the region holding all but 1e-14 of the density's mass
+    lower, upper = betaincinv(alpha_b, beta_b, [1e-14, 1 - 1e-14])
+    log_norm = betaln(alpha_b, beta_b)
+
+    if min(alpha_b, beta_b) >= _GAUSS_MIN_PARAMETER:
+        half_width = 0.5 * (upper - lower)
+        x = half_width * _GAUSS_NODES + 0.5 * (upper + lower)
+        pdf = np.exp(xlogy(alpha_b - 1, x) + xlog1py(beta_b - 1, -x) - log_norm)
+        value = float(half_width * np.dot(_GAUSS_WEIGHTS, pdf * betainc(alpha_a, beta_a, x)))
+    else:
+        from scipy import integrate
+
+        def integrand(x: float) -> float:
+            log_pdf = (alpha_b - 1) * math.log(x) + (beta_b - 1) * math.log1p(-x) - log_norm
+            return math.exp(log_pdf) * betainc(alpha_a, beta_a, x)
+
+        value, _ = integrate.quad(integrand, lower, upper, epsabs=1e-13, epsrel=1e-10, limit=200)
+
+    value = 1 - value if flip else value
+    return min(max(value, 0.0), 1.0)
+
+
+def _normal_probability(alpha_a: float, beta_a: float, alpha_b: float, beta_b: float) -> float:
+    """P(B > A) with both posteriors replaced by normals of equal mean and variance."""
+    mean_a = alpha_a / (alpha_a + beta_a)
+    mean_b = alpha_b / (alpha_b + beta_b)
+    se = math.sqrt(_beta_variance(alpha_a, beta_a) + _beta_variance(alpha_b, beta_b))
+    return normal_cdf((mean_b - mean_a) / se)
+
+
+def _select_probability_method(alpha_a: float, beta_a: float, alpha_b: float, beta_b: float) -> str:
+    """Pick the cheapest accurate method for method="auto"."""
+    params = (alpha_a, beta_a, alpha_b, beta_b)
+    if min(params) >= _NORMAL_MIN_PARAMETER:
+        return "normal"
+    integer_terms = [p for p in params if float(p).is_integer()]
+    if integer_terms and min(integer_terms) <= _QUADRATURE_COST:
+        return "exact"
+    return "quadrature"
+
+
 def _probability_b_beats_a(
     alpha_a: float, beta_a: float,
     alpha_b: float, beta_b: float,
-    num_samples: int = 100000
+    num_samples: int = 100000,
+    method: ProbabilityMethod = "auto",
+    draws: Optional["_PairDraws"] = None,
+    seed: Seed = None,
 ) -> float:
     """
-    Calculate P(B > A) using Monte Carlo simulation.
+    Calculate P(B > A) for two Beta posteriors.
+
+    "exact" uses Evan Miller's closed-form sum (needs one integer parameter),
+    "quadrature" integrates over the Beta densities, "normal" is the
+    large-count approximation and "monte_carlo" compares ``num_samples``
+    draws (or reads an existing ``draws`` buffer). "auto" picks the cheapest
+    deterministic method that is accurate for the given parameters.
+    """
+    if method == "auto":
+        method = _select_probability_method(alpha_a, beta_a, alpha_b, beta_b)
+
+    if method == "exact":
+        return _exact_probability(alpha_a, beta_a, alpha_b, beta_b)
+    if method == "quadrature":
+        return _quadrature_probability(alpha_a, beta_a, alpha_b, beta_b)
+    if method == "normal":
+        return _normal_probability(alpha_a, beta_a, alpha_b, beta_b)
+    if method != "monte_carlo":
+        raise ValueError(
+            "method must be 'auto', 'exact', 'quadrature', 'normal' or 'monte_carlo'"
+        )
+
+    if draws is None:
+        draws = _draw_pair(alpha_a, beta_a, alpha_b, beta_b, num_samples, seed=seed)
+    return draws.probability_b_better
+
+
+# Posterior draws are generated and reduced in chunks of this many samples,
+# so the Monte Carlo path never holds more than a few chunk-sized temporaries
+# besides the per-draw lift needed for its quantiles.
+_CHUNK_SIZE = 65_536
+
+# First chunk of an adaptive run. Later chunks double the total drawn so far
+# (up to _CHUNK_SIZE), so the standard errors are re-checked O(log n) times.
+_ADAPTIVE_FIRST_CHUNK = 4_096
+
+MonteCarloQuantity = Literal["probability", "loss", "lift"]
+
+Sampler = Literal["pseudo", "qmc"]
+
+# Randomized quasi-Monte Carlo: independently scrambled Sobol sequences mapped
+# through the Beta inverse CDF, whose spread gives the standard error. Four
+# replicates of 4,096 points reach the lift-interval accuracy of roughly
+# 100,000 pseudo-random draws.
+_QMC_REPLICATES = 4
+_DEFAULT_SAMPLES = {"pseudo": 100_000, "qmc": 16_384}
+
+# Points per replicate in the first round of an adaptive QMC run
+_ADAPTIVE_FIRST_QMC_POINTS = 1_024
+
+
+class _PairDraws:
+    """
+    Running reductions of one shared Monte Carlo draw from two Beta posteriors.
 
-    More accurate than closed-form approximations for the Beta distribution.
+    Chunks are folded in with ``add``; only sums and the per-draw lift (for
+    its quantiles) are kept.
     """
-    # Sample from both posteriors
-    samples_a = np.random.beta(alpha_a, beta_a, num_samples)
-    samples_b = np.random.beta(alpha_b, beta_b, num_samples)
 
-    # Count how often B > A
-    return float(np.mean(samples_b > samples_a))
+    def __init__(self):
+        self.num_samples = 0
+        self._wins = 0
+        self._total = 0.0        # sum of B - A
+        self._total_sq = 0.0     # sum of (B - A)^2
+        self._gain = 0.0         # sum of max(0, B - A)
+        self._gain_sq = 0.0      # sum of max(0, B - A)^2
+        self._lift_chunks: List[np.ndarray] = []
+        self._lift: Optional[np.ndarray] = None
+
+    def add(self, samples_a: np.ndarray, samples_b: np.ndarray) -> None:
+        diff = samples_b
+        diff -= samples_a
+        lift = np.zeros(len(diff))
+        np.divide(diff, samples_a, out=lift, where=samples_a > 0)
+        lift *= 100
+
+        self.num_samples += len(diff)
+        self._wins += int(np.count_nonzero(diff > 0))
+        self._total += float(diff.sum())
+        self._total_sq += float(np.dot(diff, diff))
+        gain = np.maximum(diff, 0, out=diff)
+        self._gain += float(gain.sum())
+        self._gain_sq += float(np.dot(gain, gain))
+        self._lift_chunks.append(lift)
+        self._lift = None
+
+    @property
+    def probability_b_better(self) -> float:
+        """P(B > A)."""
+        return self._wins / self.num_samples
+
+    @property
+    def loss_choosing_a(self) -> float:
+        """E[max(0, B - A)]."""
+        return self._gain / self.num_samples
+
+    @property
+    def loss_choosing_b(self) -> float:
+        """E[max(0, A - B)], using max(0, A - B) = max(0, B - A) - (B - A)."""
+        return (self._gain - self._total) / self.num_samples
+
+    @property
+    def lift_percent(self) -> np.ndarray:
+        """(B - A) / A * 100 per draw, 0 where A == 0."""
+        if self._lift is None:
+            self._lift = np.concatenate(self._lift_chunks) if len(self._lift_chunks) > 1 else self._lift_chunks[0]
+            self._lift_chunks = [self._lift]
+        return self._lift
+
+    def estimates(
+        self,
+        quantities: Tuple[MonteCarloQuantity, ...] = ("probability", "loss", "lift"),
+        credibility: float = 0.95,
+    ) -> Dict[str, float]:
+        """The sampled fields, keyed and scaled like ``standard_errors``."""
+        values = {}
+        if "probability" in quantities:
+            values["probability_variant_better"] = 100 * self.probability_b_better
+        if "loss" in quantities:
+            values["expected_loss_choosing_control"] = 100 * self.loss_choosing_a
+            values["expected_loss_choosing_variant"] = 100 * self.loss_choosing_b
+        if "lift" in quantities:
+            low, high = _lift_credible_interval(self, credibility)
+            values["lift_credible_interval_lower"] = low
+            values["lift_credible_interval_upper"] = high
+        return values
+
+    def standard_errors(
+        self,
+        quantities: Tuple[MonteCarloQuantity, ...] = ("probability", "loss", "lift"),
+        credibility: float = 0.95,
+    ) -> Dict[str, float]:
+        """
+        Monte Carlo standard errors, in the percent units ``analyze`` reports.
+
+        Quantile errors use the distribution-free order-statistic estimate
+        (x_(nq + d) - x_(nq - d)) / 2 with d = sqrt(n q (1 - q)).
+        """
+        n = self.num_samples
+        errors = {}
+        if "probability" in quantities:
+            p = self.probability_b_better
+            errors["probability_variant_better"] = 100 * math.sqrt(p * (1 - p) / n)
+        if "loss" in quantities:
+            loss_a = self.loss_choosing_a
+            loss_b = self.loss_choosing_b
+            var_a = max(self._gain_sq / n - loss_a ** 2, 0.0)
+            # max(0, A - B)^2 = (B - A)^2 - max(0, B - A)^2
+            var_b = max((self._total_sq - self._gain_sq) / n - loss_b ** 2, 0.0)
+            errors["expected_loss_choosing_control"] = 100 * math.sqrt(var_a / n)
+            errors["expected_loss_choosing_variant"] = 100 * math.sqrt(var_b / n)
+        if "lift" in quantities:
+            lower = (1 - credibility) / 2
+            for name, q in (("lift_credible_interval_lower", lower), ("lift_credible_interval_upper", 1 - lower)):
+                spread = math.sqrt(n * q * (1 - q))
+                ranks = np.clip([round(n * q - spread), round(n * q + spread)], 0, n - 1)
+                low, high = np.partition(self.lift_percent, ranks)[ranks]
+                errors[name] = float(high - low) / 2
+        return errors
+
+
+def _draw_pair(
+    alpha_a: float, beta_a: float,
+    alpha_b: float, beta_b: float,
+    num_samples: int = 100000,
+    chunk_size: int = _CHUNK_SIZE,
+    seed: Seed = None,
+    tolerance: Optional[float] = None,
+    quantities: Tuple[MonteCarloQuantity, ...] = ("probability", "loss", "lift"),
+    credibility: float = 0.95,
+    sampler: Sampler = "pseudo",
+) -> _PairDraws:
+    """
+    Draw pairs from both posteriors once and reduce them.
+
+    Every Monte Carlo metric of ``analyze`` reads from the same draw, so
+    they are mutually consistent. Without ``tolerance`` exactly
+    ``num_samples`` pairs are drawn. With it, drawing stops as soon as the
+    standard error of every listed quantity is at most ``tolerance``
+    (percent units) or ``num_samples`` is reached. ``sampler="qmc"``
+    draws from scrambled Sobol sequences instead (see ``_draw_pair_qmc``).
+    """
+    if num_samples < 1:
+        raise ValueError("num_samples must be positive")
+    if tolerance is not None and tolerance <= 0:
+        raise ValueError("mc_tolerance must be positive")
+    if sampler == "qmc":
+        return _draw_pair_qmc(
+            alpha_a, beta_a, alpha_b, beta_b, num_samples, chunk_size, seed,
+            tolerance, quantities, credibility,
+        )
+
+    rng = make_rng(seed)
+    draws = _PairDraws()
+    n = chunk_size if tolerance is None else min(_ADAPTIVE_FIRST_CHUNK, chunk_size)
+    while draws.num_samples < num_samples:
+        n = min(n, num_samples - draws.num_samples)
+        draws.add(rng.beta(alpha_a, beta_a, n), rng.beta(alpha_b, beta_b, n))
+        if tolerance is not None:
+            errors = draws.standard_errors(quantities, credibility)
+            if max(errors.values(), default=0.0) <= tolerance:
+                break
+            n = min(draws.num_samples, chunk_size)
+    return draws
+
+
+def _resolve_num_samples(num_samples: Optional[int], sampler: Sampler) -> int:
+    if sampler not in _DEFAULT_SAMPLES:
+        raise ValueError(f"sampler must be 'pseudo' or 'qmc', got {sampler!r}")
+    return _DEFAULT_SAMPLES[sampler] if num_samples is None else num_samples
+
+
+def _sobol_engines(dimensions: int, seed: Seed) -> list:
+    """One independently scrambled Sobol engine per QMC replicate."""
+    from scipy.stats import qmc
+
+    rng = make_rng(seed)
+    return [qmc.Sobol(dimensions, scramble=True, seed=rng) for _ in range(_QMC_REPLICATES)]
+
+
+def _qmc_rounds(num_samples: int, tolerance: Optional[float]) -> List[int]:
+    """
+    Points per replicate after each round of a QMC run.
+
+    Every length is a power of two, which keeps the Sobol points balanced,
+    and the last one is the largest whose replicates fit in ``num_samples``.
+    """
+    cap = max(num_samples // _QMC_REPLICATES, 2)
+    last = 1 << (cap.bit_length() - 1)
+    points = last if tolerance is None else min(_ADAPTIVE_FIRST_QMC_POINTS, last)
+    rounds = [points]
+    while rounds[-1] < last:
+        rounds.append(2 * rounds[-1])
+    return rounds
+
+
+def _sobol_beta(engine, posteriors: List[Tuple[float, float]], n: int, chunk_size: int):
+    """Yield k x m blocks of Beta draws from the engine's next ``n`` points."""
+    alphas = np.array([a for a, _ in posteriors], dtype=float)[:, None]
+    betas = np.array([b for _, b in posteriors], dtype=float)[:, None]
+    while n > 0:
+        m = min(n, chunk_size)
+        yield betaincinv(alphas, betas, engine.random(m).T)
+        n -= m
+
+
+def _replicate_errors(estimates: List[Dict[str, object]]) -> Dict[str, float]:
+    """
+    Standard error of pooled estimates from independent QMC replicates.
+
+    Array-valued estimates (one per arm) report their largest error.
+    """
+    scale = 1 / math.sqrt(len(estimates))
+    return {
+        name: float(np.max(np.std([e[name] for e in estimates], axis=0, ddof=1))) * scale
+        for name in estimates[0]
+    }
+
+
+class _QMCPairDraws(_PairDraws):
+    """
+    ``_PairDraws`` pooled over independently scrambled Sobol replicates.
+
+    Estimates use every point. Standard errors come from the spread of the
+    per-replicate estimates, as the i.i.d. formulas overstate QMC error.
+    """
+
+    def __init__(self, replicates: int = _QMC_REPLICATES):
+        super().__init__()
+        self.replicates = [_PairDraws() for _ in range(replicates)]
+
+    def pool(self) -> None:
+        """Refresh the pooled sums after the replicates have grown."""
+        for name in ("num_samples", "_wins", "_total", "_total_sq", "_gain", "_gain_sq"):
+            setattr(self, name, sum(getattr(r, name) for r in self.replicates))
+        self._lift_chunks = [r.lift_percent for r in self.replicates]
+        self._lift = None
+
+    def standard_errors(
+        self,
+        quantities: Tuple[MonteCarloQuantity, ...] = ("probability", "loss", "lift"),
+        credibility: float = 0.95,
+    ) -> Dict[str, float]:
+        return _replicate_errors([r.estimates(quantities, credibility) for r in self.replicates])
+
+
+def _draw_pair_qmc(
+    alpha_a: float, beta_a: float,
+    alpha_b: float, beta_b: float,
+    num_samples: int,
+    chunk_size: int,
+    seed: Seed,
+    tolerance: Optional[float],
+    quantities: Tuple[MonteCarloQuantity, ...],
+    credibility: float,
+) -> _QMCPairDraws:
+    """
+    ``_draw_pair`` on randomized QMC points instead of pseudo-random draws.
+
+    Each scrambled 2-D Sobol sequence is mapped through both posteriors'
+    inverse CDFs. With ``tolerance`` the replicates double in length from
+    ``_ADAPTIVE_FIRST_QMC_POINTS`` until the errors are small enough.
+    """
+    engines = _sobol_engines(2, seed)
+    posteriors = [(alpha_a, beta_a), (alpha_b, beta_b)]
+    draws = _QMCPairDraws()
+    for points in _qmc_rounds(num_samples, tolerance):
+        for engine, replicate in zip(engines, draws.replicates):
+            for samples in _sobol_beta(engine, posteriors, points - replicate.num_samples, chunk_size):
+                replicate.add(samples[0], samples[1])
+        draws.pool()
+        if tolerance is not None:
+            if max(draws.standard_errors(quantities, credibility).values(), default=0.0) <= tolerance:
+                break
+    return draws
 
 
 def _expected_loss(
     alpha_a: float, beta_a: float,
     alpha_b: float, beta_b: float,
-    num_samples: int = 100000
+    method: ProbabilityMethod = "auto",
+    draws: Optional[_PairDraws] = None,
 ) -> Tuple[float, float]:
     """
     Calculate expected loss for choosing each variant.
 
     Expected loss of choosing A = E[max(0, B - A)]
     This is the expected conversion rate you lose if A is actually worse.
-    """
-    samples_a = np.random.beta(alpha_a, beta_a, num_samples)
-    samples_b = np.random.beta(alpha_b, beta_b, num_samples)
 
-    # Loss if we choose A but B is better
-    loss_choosing_a = float(np.mean(np.maximum(0, samples_b - samples_a)))
+    For Beta posteriors this has a closed form:
+        E[max(0, B - A)] = E[B] P(B+ > A) - E[A] P(B > A+)
+    where X+ is X with its alpha parameter increased by one (the
+    size-biased Beta). Both probabilities come from the same deterministic
+    method as P(B > A); for large counts the normal approximation is applied
+    to B - A directly. "monte_carlo" reads the losses from ``draws``.
 
-    # Loss if we choose B but A is better
-    loss_choosing_b = float(np.mean(np.maximum(0, samples_a - samples_b)))
+    Returns:
+        Tuple of (loss choosing A, loss choosing B)
+    """
+    if method == "monte_carlo":
+        if draws is None:
+            draws = _draw_pair(alpha_a, beta_a, alpha_b, beta_b)
+        return draws.loss_choosing_a, draws.loss_choosing_b
+
+    if method == "auto":
+        method = _select_probability_method(alpha_a, beta_a, alpha_b, beta_b)
+
+    mean_a = alpha_a / (alpha_a + beta_a)
+    mean_b = alpha_b / (alpha_b + beta_b)
+
+    if method == "normal":
+        # E[max(0, D)] for D ~ N(mu, sigma^2)
+        mu = mean_b - mean_a
+        sigma = math.sqrt(_beta_variance(alpha_a, beta_a) + _beta_variance(alpha_b, beta_b))
+        z = mu / sigma
+        gain = mu * normal_cdf(z) + sigma * math.exp(-0.5 * z * z) / math.sqrt(2 * math.pi)
+    else:
+        gain = (
+            mean_b * _probability_b_beats_a(alpha_a, beta_a, alpha_b + 1, beta_b, method=method)
+            - mean_a * _probability_b_beats_a(alpha_a + 1, beta_a, alpha_b, beta_b, method=method)
+        )
 
+    # max(0, A - B) = max(0, B - A) - (B - A)
+    loss_choosing_a = max(gain, 0.0)
+    loss_choosing_b = max(loss_choosing_a - (mean_b - mean_a), 0.0)
     return loss_choosing_a, loss_choosing_b
 
 
+# Gauss-Legendre nodes per panel for the k-arm integrals. Panels are cut at
+# the edges of every arm's posterior window, so each arm's density and CDF
+# transition is resolved by its own panels however narrow it is.
+_PANEL_NODES, _PANEL_WEIGHTS = np.polynomial.legendre.leggauss(64)
+
+
+def _best_arm_quadrature(posteriors: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    P(best) and expected loss for k Beta posteriors by 1-D quadrature.
+
+    P(arm i is best) = integral of pdf_i(x) * prod_{j != i} cdf_j(x) dx
+    E[max_j X_j]     = integral of (1 - prod_j cdf_j(x)) dx
+    loss_i           = E[max_j X_j] - E[X_i]
+
+    The last identity holds because max(0, max_{j != i} X_j - X_i) equals
+    max_j X_j - X_i. Only O(k + nodes) floats are held at any time.
+
+    Returns:
+        Tuple of (probabilities, expected losses) as arrays in arm order
+    """
+    alphas = np.array([a for a, _ in posteriors], dtype=float)
+    betas = np.array([b for _, b in posteriors], dtype=float)
+
+    # Every arm's window holds all but 1e-14 of its mass
+    edges = np.unique(betaincinv(alphas[:, None], betas[:, None], [1e-14, 1 - 1e-14]))
+    half_widths = 0.5 * np.diff(edges)
+    x = (half_widths[:, None] * _PANEL_NODES + 0.5 * (edges[1:] + edges[:-1])[:, None]).ravel()
+    w = (half_widths[:, None] * _PANEL_WEIGHTS).ravel()
+
+    # log prod_j cdf_j(x), accumulated one arm at a time
+    with np.errstate(divide="ignore"):
+        log_cdf_total = np.zeros_like(x)
+        for a, b in zip(alphas, betas):
+            log_cdf_total += np.log(betainc(a, b, x))
+
+        probabilities = np.empty(len(posteriors))
+        for i, (a, b) in enumerate(zip(alphas, betas)):
+            with np.errstate(invalid="ignore"):
+                others = np.exp(log_cdf_total - np.log(betainc(a, b, x)))
+            # -inf - -inf where this arm's CDF is 0 as well: nothing is best there
+            others[np.isnan(others)] = 0.0
+            pdf = np.exp(xlogy(a - 1, x) + xlog1py(b - 1, -x) - betaln(a, b))
+            probabilities[i] = np.dot(w, pdf * others)
+
+    # Below the first edge every CDF is ~0, so the max exceeds x there
+    expected_max = edges[0] + np.dot(w, 1 - np.exp(log_cdf_total))
+    losses = np.maximum(expected_max - alphas / (alphas + betas), 0.0)
+    return np.clip(probabilities, 0.0, 1.0), losses
+
+
+class _BestArmDraws:
+    """Running P(best) and expected-loss sums for k arms, fed by ``add``."""
+
+    def __init__(self, k: int):
+        self.num_samples = 0
+        self._wins = np.zeros(k, dtype=np.int64)
+        self._shortfall = np.zeros(k)      # sum of max_j X_j - X_i
+        self._shortfall_sq = np.zeros(k)
+
+    @classmethod
+    def pooled(cls, replicates: List["_BestArmDraws"]) -> "_BestArmDraws":
+        draws = cls(len(replicates[0]._wins))
+        for replicate in replicates:
+            draws.num_samples += replicate.num_samples
+            draws._wins += replicate._wins
+            draws._shortfall += replicate._shortfall
+            draws._shortfall_sq += replicate._shortfall_sq
+        return draws
+
+    def add(self, samples: np.ndarray) -> None:
+        """Fold in a k x n block of draws, which is overwritten."""
+        self._wins += np.bincount(np.argmax(samples, axis=0), minlength=len(self._wins))
+        samples -= samples.max(axis=0)
+        self._shortfall -= samples.sum(axis=1)
+        self._shortfall_sq += np.einsum("ij,ij->i", samples, samples)
+        self.num_samples += samples.shape[1]
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._wins / self.num_samples
+
+    @property
+    def losses(self) -> np.ndarray:
+        return self._shortfall / self.num_samples
+
+    def estimates(self) -> Dict[str, np.ndarray]:
+        return {"probabilities_best": 100 * self.probabilities, "expected_losses": 100 * self.losses}
+
+    def standard_errors(self) -> Dict[str, float]:
+        """Largest per-arm standard error, in percentage points."""
+        n = self.num_samples
+        p = self.probabilities
+        losses = self.losses
+        return {
+            "probabilities_best": 100 * float(np.sqrt(p * (1 - p) / n).max()),
+            "expected_losses": 100 * float(np.sqrt(
+                np.maximum(self._shortfall_sq / n - losses ** 2, 0.0) / n
+            ).max()),
+        }
+
+
+def _best_arm_monte_carlo(
+    posteriors: List[Tuple[float, float]],
+    num_samples: int = 100000,
+    chunk_size: int = _CHUNK_SIZE,
+    seed: Seed = None,
+    tolerance: Optional[float] = None,
+    sampler: Sampler = "pseudo",
+) -> Tuple[np.ndarray, np.ndarray, int, Dict[str, float]]:
+    """
+    P(best) and expected loss for k Beta posteriors by chunked sampling.
+
+    Uses loss_i = E[max_j X_j - X_i], so each chunk needs one k x chunk
+    draw and no per-arm copies. With ``tolerance``, drawing stops once the
+    largest standard error (percent units) is at most ``tolerance`` or
+    ``num_samples`` is reached, as in ``_draw_pair``. ``sampler="qmc"``
+    uses k-dimensional scrambled Sobol replicates as in ``_draw_pair_qmc``.
+
+    Returns:
+        Tuple of (probabilities, expected losses, samples drawn, standard
+        errors), the arrays in arm order
+    """
+    if num_samples < 1:
+        raise ValueError("num_samples must be positive")
+    if tolerance is not None and tolerance <= 0:
+        raise ValueError("mc_tolerance must be positive")
+
+    k = len(posteriors)
+    if sampler == "qmc":
+        engines = _sobol_engines(k, seed)
+        replicates = [_BestArmDraws(k) for _ in engines]
+        for points in _qmc_rounds(num_samples, tolerance):
+            for engine, replicate in zip(engines, replicates):
+                for samples in _sobol_beta(engine, posteriors, points - replicate.num_samples, chunk_size):
+                    replicate.add(samples)
+            errors = _replicate_errors([r.estimates() for r in replicates])
+            if tolerance is not None and max(errors.values()) <= tolerance:
+                break
+        draws = _BestArmDraws.pooled(replicates)
+    else:
+        rng = make_rng(seed)
+        draws = _BestArmDraws(k)
+        n = chunk_size if tolerance is None else min(_ADAPTIVE_FIRST_CHUNK, chunk_size)
+        while draws.num_samples < num_samples:
+            n = min(n, num_samples - draws.num_samples)
+            samples = np.empty((k, n))
+            for i, (alpha, beta) in enumerate(posteriors):
+                samples[i] = rng.beta(alpha, beta, n)
+            draws.add(samples)
+            errors = draws.standard_errors()
+            if tolerance is not None:
+                if max(errors.values()) <= tolerance:
+                    break
+                n = min(draws.num_samples, chunk_size)
+
+    return draws.probabilities, np.maximum(draws.losses, 0.0), draws.num_samples, errors
+
+
 def _credible_interval(alpha: float, beta: float, credibility: float = 0.95) -> Tuple[float, float]:
     """Calculate credible interval for Beta distribution."""
     lower = (1 - credibility) / 2
     upper = 1 - lower
     return (
-        scipy_stats.beta.ppf(lower, alpha, beta),
-        scipy_stats.beta.ppf(upper, alpha, beta)
+        float(betaincinv(alpha, beta, lower)),
+        float(betaincinv(alpha, beta, upper)),
     )
 
 
-def _lift_credible_interval(
-    alpha_a: float, beta_a: float,
-    alpha_b: float, beta_b: float,
-    credibility: float = 0.95,
-    num_samples: int = 100000
-) -> Tuple[float, float]:
+def _lift_credible_interval(draws: _PairDraws, credibility: float = 0.95) -> Tuple[float, float]:
     """Calculate credible interval for lift (B - A) / A."""
-    samples_a = np.random.beta(alpha_a, beta_a, num_samples)
-    samples_b = np.random.beta(alpha_b, beta_b, num_samples)
-
-    # Calculate relative lift for each sample
-    # Avoid division by zero
-    with np.errstate(divide='ignore', invalid='ignore'):
-        lift_samples = np.where(
-            samples_a > 0,
-            (samples_b - samples_a) / samples_a * 100,
-            0
-        )
-
     lower = (1 - credibility) / 2
     upper = 1 - lower
-
-    return (
-        float(np.percentile(lift_samples, lower * 100)),
-        float(np.percentile(lift_samples, upper * 100))
-    )
+    low, high = np.percentile(draws.lift_percent, [lower * 100, upper * 100])
+    return float(low), float(high)
 
 
 def analyze(
@@ -175,6 +823,12 @@ def analyze(
     prior_beta: float = 1,
     confidence_threshold: float = 0.95,
     credibility: float = 0.95,
+    explain: bool = True,
+    probability_method: ProbabilityMethod = "auto",
+    num_samples: Optional[int] = None,
+    seed: Seed = None,
+    mc_tolerance: Optional[float] = None,
+    sampler: Optional[Sampler] = None,
 ) -> BayesianTestResult:
     """
     Analyze an A/B test using Bayesian methods.
@@ -191,6 +845,34 @@ def analyze(
         prior_beta: Beta parameter for Beta prior (default 1 for uniform)
         confidence_threshold: Probability threshold to declare a winner (default 0.95)
         credibility: Credibility level for intervals (default 0.95)
+        explain: Generate the recommendation text (default True); pass
+            False when only the numbers are needed
+        probability_method: How P(variant > control) and the expected
+            losses are computed: "auto" (default) picks the exact sum,
+            quadrature or the large-count normal approximation by cost;
+            "monte_carlo" restores sampling
+        num_samples: Posterior draws shared by the Monte Carlo metrics
+            (lift interval and, with "monte_carlo", the probability and
+            losses); default 100,000, or 16,384 with ``sampler="qmc"``
+        seed: Seed for the posterior draws (int, SeedSequence or
+            np.random.Generator); None draws fresh entropy
+        mc_tolerance: Draw adaptively until the Monte Carlo standard error
+            of every sampled field is at most this (in the field's percent
+            units), with ``num_samples`` as the cap; None always draws
+            ``num_samples``. The achieved errors are reported in
+            ``monte_carlo_error``
+        sampler: "pseudo" draws from the posteriors directly; "qmc" maps
+            scrambled Sobol points through the Beta inverse CDF, reaching
+            the same lift-interval accuracy with far fewer points. QMC
+            points come in power-of-two replicates, so up to half of
+            ``num_samples`` may go unused. None (default) samples only
+            when "monte_carlo", ``num_samples`` or ``mc_tolerance`` asks
+            for it, and otherwise computes the lift interval
+            deterministically: by Cornish-Fisher expansion of
+            log(variant/control) once every posterior parameter
+            (conversions or non-conversions plus the prior) is at least
+            100, where it is within ~0.002 percentage points of the exact
+            quantile, and by exact quadrature below that
 
     Returns:
         BayesianTestResult with probabilities and recommendations
@@ -212,6 +894,15 @@ def analyze(
         raise ValueError("Control conversions cannot exceed control visitors")
     if variant_conversions > variant_visitors:
         raise ValueError("Variant conversions cannot exceed variant visitors")
+    sample = (
+        probability_method == "monte_carlo"
+        or sampler is not None
+        or num_samples is not None
+        or mc_tolerance is not None
+    )
+    if sample:
+        sampler = "pseudo" if sampler is None else sampler
+        num_samples = _resolve_num_samples(num_samples, sampler)
 
     # Calculate observed rates
     control_rate = control_conversions / control_visitors
@@ -221,17 +912,45 @@ def analyze(
     alpha_c, beta_c = _beta_posterior(control_conversions, control_visitors, prior_alpha, prior_beta)
     alpha_v, beta_v = _beta_posterior(variant_conversions, variant_visitors, prior_alpha, prior_beta)
 
+    # Sampling is opt-in: one posterior draw then feeds every Monte Carlo
+    # metric below. Without it every quantity is deterministic.
+    draws, num_drawn, mc_error = None, 0, {}
+    if sample:
+        sampled = ("lift",) if probability_method != "monte_carlo" else ("probability", "loss", "lift")
+        with stage("bayesian.posterior_sampling"):
+            draws = _draw_pair(
+                alpha_c, beta_c, alpha_v, beta_v, num_samples, seed=seed,
+                tolerance=mc_tolerance, quantities=sampled, credibility=credibility,
+                sampler=sampler,
+            )
+            num_drawn = draws.num_samples
+            mc_error = draws.standard_errors(sampled, credibility)
+
     # Calculate probability variant is better
-    prob_variant_better = _probability_b_beats_a(alpha_c, beta_c, alpha_v, beta_v)
+    with stage("bayesian.probability_better"):
+        prob_variant_better = _probability_b_beats_a(
+            alpha_c, beta_c, alpha_v, beta_v, method=probability_method, draws=draws
+        )
     prob_control_better = 1 - prob_variant_better
 
     # Calculate expected losses
-    loss_control, loss_variant = _expected_loss(alpha_c, beta_c, alpha_v, beta_v)
+    with stage("bayesian.expected_loss"):
+        loss_control, loss_variant = _expected_loss(
+            alpha_c, beta_c, alpha_v, beta_v, method=probability_method, draws=draws
+        )
 
     # Calculate credible intervals
-    ci_control = _credible_interval(alpha_c, beta_c, credibility)
-    ci_variant = _credible_interval(alpha_v, beta_v, credibility)
-    ci_lift = _lift_credible_interval(alpha_c, beta_c, alpha_v, beta_v, credibility)
+    with stage("bayesian.credible_intervals"):
+        ci_control = _credible_interval(alpha_c, beta_c, credibility)
+        ci_variant = _credible_interval(alpha_v, beta_v, credibility)
+        if draws is not None:
+            ci_lift = _lift_credible_interval(draws, credibility)
+        else:
+            lower = (1 - credibility) / 2
+            ci_lift = tuple(
+                math.expm1(float(_log_ratio_quantile(alpha_c, beta_c, alpha_v, beta_v, q))) * 100
+                for q in (lower, 1 - lower)
+            )
 
     # Calculate lift
     lift_absolute = variant_rate - control_rate
@@ -249,19 +968,22 @@ def analyze(
         winner = "control"
 
     # Generate recommendation
-    recommendation = _generate_recommendation(
-        prob_variant_better=prob_variant_better,
-        prob_control_better=prob_control_better,
-        loss_variant=loss_variant,
-        loss_control=loss_control,
-        control_rate=control_rate,
-        variant_rate=variant_rate,
-        lift_percent=lift_percent,
-        ci_lift=ci_lift,
-        has_winner=has_winner,
-        winner=winner,
-        confidence_threshold=confidence_threshold,
-    )
+    recommendation = ""
+    if explain:
+        with stage("bayesian.recommendation"):
+            recommendation = _generate_recommendation(
+                prob_variant_better=prob_variant_better,
+                prob_control_better=prob_control_better,
+                loss_variant=loss_variant,
+                loss_control=loss_control,
+                control_rate=control_rate,
+                variant_rate=variant_rate,
+                lift_percent=lift_percent,
+                ci_lift=ci_lift,
+                has_winner=has_winner,
+                winner=winner,
+                confidence_threshold=confidence_threshold,
+            )
 
     return BayesianTestResult(
         control_visitors=control_visitors,
@@ -284,6 +1006,8 @@ def analyze(
         winner=winner,
         confidence_threshold=confidence_threshold * 100,
         recommendation=recommendation,
+        monte_carlo_samples=num_drawn,
+        monte_carlo_error=mc_error,
     )
 
 
@@ -354,7 +1078,12 @@ def analyze_multi(
     variants: List[dict],
     prior_alpha: float = 1,
     prior_beta: float = 1,
-    num_samples: int = 100000,
+    num_samples: Optional[int] = None,
+    explain: bool = True,
+    seed: Seed = None,
+    probability_method: ProbabilityMethod = "auto",
+    mc_tolerance: Optional[float] = None,
+    sampler: Sampler = "pseudo",
 ) -> BayesianMultiVariantResult:
     """
     Analyze multiple variants using Bayesian methods.
@@ -363,7 +1092,21 @@ def analyze_multi(
         variants: List of dicts with 'name', 'visitors', 'conversions'
         prior_alpha: Alpha parameter for Beta prior
         prior_beta: Beta parameter for Beta prior
-        num_samples: Number of Monte Carlo samples
+        num_samples: Number of Monte Carlo samples (only used with
+            probability_method="monte_carlo"); default 100,000, or 16,384
+            with ``sampler="qmc"``
+        explain: Generate the recommendation text (default True)
+        seed: Seed for the posterior draws (int, SeedSequence or
+            np.random.Generator); None draws fresh entropy
+        probability_method: With exactly two variants, probabilities and
+            expected losses use the same closed forms as ``analyze``; with
+            more, a 1-D integral over the product of posterior CDFs. Pass
+            "monte_carlo" to sample instead (default "auto")
+        mc_tolerance: With "monte_carlo", draw adaptively until every
+            probability and loss has a standard error of at most this (in
+            percentage points), with ``num_samples`` as the cap
+        sampler: With "monte_carlo", "pseudo" (default) or "qmc" for
+            scrambled Sobol points, as in ``analyze``
 
     Returns:
         BayesianMultiVariantResult with probabilities for each variant
@@ -379,6 +1122,7 @@ def analyze_multi(
     """
     if len(variants) < 2:
         raise ValueError("At least 2 variants required")
+    num_samples = _resolve_num_samples(num_samples, sampler)
 
     # Calculate posteriors
     posteriors = {}
@@ -389,30 +1133,29 @@ def analyze_multi(
         )
         posteriors[v["name"]] = (alpha, beta)
 
-    # Sample from all posteriors
-    samples = {}
-    for name, (alpha, beta) in posteriors.items():
-        samples[name] = np.random.beta(alpha, beta, num_samples)
-
-    # Stack samples for comparison
-    sample_matrix = np.vstack([samples[v["name"]] for v in variants])
     names = [v["name"] for v in variants]
-
-    # Find which variant is best in each sample
-    best_indices = np.argmax(sample_matrix, axis=0)
-
-    # Calculate probability each variant is best
-    probabilities_best = {}
-    for i, name in enumerate(names):
-        probabilities_best[name] = float(np.mean(best_indices == i)) * 100
-
-    # Calculate expected losses
-    expected_losses = {}
-    for i, name in enumerate(names):
-        # Loss = E[max(0, best_other - this)]
-        other_max = np.max(np.delete(sample_matrix, i, axis=0), axis=0)
-        loss = float(np.mean(np.maximum(0, other_max - sample_matrix[i])))
-        expected_losses[name] = loss * 100
+    mc_samples, mc_error = 0, {}
+    if len(variants) == 2 and probability_method != "monte_carlo":
+        # Closed forms for two arms; no sampling needed
+        (alpha_a, beta_a), (alpha_b, beta_b) = (posteriors[name] for name in names)
+        with stage("bayesian.probability_best"):
+            prob_b = _probability_b_beats_a(alpha_a, beta_a, alpha_b, beta_b, method=probability_method)
+            probabilities_best = {names[0]: (1 - prob_b) * 100, names[1]: prob_b * 100}
+
+        with stage("bayesian.expected_loss"):
+            loss_a, loss_b = _expected_loss(alpha_a, beta_a, alpha_b, beta_b, method=probability_method)
+            expected_losses = {names[0]: loss_a * 100, names[1]: loss_b * 100}
+    else:
+        arms = [posteriors[name] for name in names]
+        with stage("bayesian.probability_best"):
+            if probability_method == "monte_carlo":
+                probs, losses, mc_samples, mc_error = _best_arm_monte_carlo(
+                    arms, num_samples, seed=seed, tolerance=mc_tolerance, sampler=sampler
+                )
+            else:
+                probs, losses = _best_arm_quadrature(arms)
+        probabilities_best = {name: float(p) * 100 for name, p in zip(names, probs)}
+        expected_losses = {name: float(loss) * 100 for name, loss in zip(names, losses)}
 
     # Find best variant
     best_variant = max(probabilities_best, key=probabilities_best.get)
@@ -431,24 +1174,27 @@ def analyze_multi(
         })
 
     # Generate recommendation
-    sorted_variants = sorted(variant_info, key=lambda x: x["probability_best"], reverse=True)
-    top = sorted_variants[0]
-
-    if top["probability_best"] >= 95:
-        recommendation = (
-            f"**{top['name']}** is the clear winner with {top['probability_best']:.1f}% "
-            f"probability of being best. Implement it."
-        )
-    elif top["probability_best"] >= 80:
-        recommendation = (
-            f"**{top['name']}** is likely the best with {top['probability_best']:.1f}% probability. "
-            f"Consider implementing, or run longer for more confidence."
-        )
-    else:
-        recommendation = (
-            f"No clear winner yet. **{top['name']}** leads with only {top['probability_best']:.1f}% "
-            f"probability. Continue running the test."
-        )
+    recommendation = ""
+    if explain:
+        with stage("bayesian.recommendation"):
+            sorted_variants = sorted(variant_info, key=lambda x: x["probability_best"], reverse=True)
+            top = sorted_variants[0]
+
+            if top["probability_best"] >= 95:
+                recommendation = (
+                    f"**{top['name']}** is the clear winner with {top['probability_best']:.1f}% "
+                    f"probability of being best. Implement it."
+                )
+            elif top["probability_best"] >= 80:
+                recommendation = (
+                    f"**{top['name']}** is likely the best with {top['probability_best']:.1f}% probability. "
+                    f"Consider implementing, or run longer for more confidence."
+                )
+            else:
+                recommendation = (
+                    f"No clear winner yet. **{top['name']}** leads with only {top['probability_best']:.1f}% "
+                    f"probability. Continue running the test."
+                )
 
     return BayesianMultiVariantResult(
         variants=variant_info,
@@ -456,6 +1202,970 @@ def analyze_multi(
         expected_losses=expected_losses,
         best_variant=best_variant,
         recommendation=recommendation,
+        monte_carlo_samples=mc_samples,
+        monte_carlo_error=mc_error,
+    )
+
+
+class BayesianResultsFrame(frames.ResultsFrame):
+    """Columnar results of ``analyze_batch``, one row per test."""
+
+    _columns = (
+        "control_visitors",
+        "control_conversions",
+        "variant_visitors",
+        "variant_conversions",
+        "control_rate",
+        "variant_rate",
+        "probability_variant_better",
+        "probability_control_better",
+        "expected_loss_choosing_variant",
+        "expected_loss_choosing_control",
+        "control_credible_interval_lower",
+        "control_credible_interval_upper",
+        "variant_credible_interval_lower",
+        "variant_credible_interval_upper",
+        "lift_credible_interval_lower",
+        "lift_credible_interval_upper",
+        "lift_percent",
+        "lift_absolute",
+        "has_winner",
+        "confidence_threshold",
+    )
+    _derived = ("winner",)
+
+    @property
+    def winner(self) -> np.ndarray:
+        control_wins = np.where(self.has_winner, "control", "none")
+        decided = np.where(self.probability_variant_better >= self.confidence_threshold, "variant", control_wins)
+        return np.where(np.isnan(self.probability_variant_better), "invalid", decided)
+
+    def result(self, index: int) -> BayesianTestResult:
+        """Materialize one row as a full ``BayesianTestResult``."""
+        row = self[index].to_dict()
+        if math.isnan(row["probability_variant_better"]):
+            raise ValueError(f"Row {index} has invalid inputs; see frame.validation")
+        intervals = {
+            name: (row.pop(f"{name}_lower"), row.pop(f"{name}_upper"))
+            for name in ("control_credible_interval", "variant_credible_interval", "lift_credible_interval")
+        }
+        result = BayesianTestResult(
+            **row, **intervals,
+            probability_variant_best=row["probability_variant_better"],
+            recommendation="",
+        )
+        result.recommendation = _generate_recommendation(
+            prob_variant_better=result.probability_variant_better / 100,
+            prob_control_better=result.probability_control_better / 100,
+            loss_variant=result.expected_loss_choosing_variant / 100,
+            loss_control=result.expected_loss_choosing_control / 100,
+            control_rate=result.control_rate,
+            variant_rate=result.variant_rate,
+            lift_percent=result.lift_percent,
+            ci_lift=result.lift_credible_interval,
+            has_winner=result.has_winner,
+            winner=result.winner,
+            confidence_threshold=result.confidence_threshold / 100,
+        )
+        return result
+
+
+# Rows per block in analyze_batch, bounding the rows x nodes temporaries
+_BATCH_ROWS = 4_096
+
+
+def _pair_quadrature_array(
+    alpha_a: np.ndarray, beta_a: np.ndarray, alpha_b: np.ndarray, beta_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise P(B > A) and E[max(0, B - A)] on one Gauss-Legendre grid.
+
+    Each row integrates over the narrower posterior X (as
+    ``_quadrature_probability`` does) against the other arm Y. A single
+    betainc per node gives both P(Y <= x) = I_x(a, b) and, through
+    I_x(a + 1, b) = I_x(a, b) - x^a (1 - x)^b / (a B(a, b)), the partial
+    mean E[Y; Y <= x], so E[max(0, X - Y)] costs nothing extra. Rows whose
+    narrower posterior has a parameter below ``_GAUSS_MIN_PARAMETER`` use
+    the scalar methods.
+
+    Returns:
+        Tuple of (P(B > A), E[max(0, B - A)]) arrays
+    """
+    over_a = _beta_variance(alpha_a, beta_a) <= _beta_variance(alpha_b, beta_b)
+    x_alpha = np.where(over_a, alpha_a, alpha_b)
+    x_beta = np.where(over_a, beta_a, beta_b)
+    y_alpha = np.where(over_a, alpha_b, alpha_a)
+    y_beta = np.where(over_a, beta_b, beta_a)
+
+    y_below = np.empty(len(over_a))    # P(Y <= X)
+    x_excess = np.empty(len(over_a))   # E[max(0, X - Y)]
+    for start in range(0, len(over_a), _BATCH_ROWS):
+        rows = slice(start, start + _BATCH_ROWS)
+        a, b = x_alpha[rows, None], x_beta[rows, None]
+        c, d = y_alpha[rows, None], y_beta[rows, None]
+        lower, upper = betaincinv(a, b, [1e-14, 1 - 1e-14]).T
+        half_width = (0.5 * (upper - lower))[:, None]
+        x = half_width * _GAUSS_NODES + (0.5 * (upper + lower))[:, None]
+        weights = half_width * _GAUSS_WEIGHTS * np.exp(xlogy(a - 1, x) + xlog1py(b - 1, -x) - betaln(a, b))
+
+        cdf = betainc(c, d, x)
+        partial_mean = c / (c + d) * (cdf - np.exp(xlogy(c, x) + xlog1py(d, -x) - np.log(c) - betaln(c, d)))
+        y_below[rows] = np.einsum("ij,ij->i", weights, cdf)
+        x_excess[rows] = np.einsum("ij,ij->i", weights, x * cdf - partial_mean)
+
+    mean_a = alpha_a / (alpha_a + beta_a)
+    mean_b = alpha_b / (alpha_b + beta_b)
+    # With X = A: P(B > A) = 1 - P(B <= A), E[max(0, B - A)] = E[max(0, A - B)] + E[B] - E[A]
+    probability = np.where(over_a, 1 - y_below, y_below)
+    gain = np.where(over_a, x_excess + (mean_b - mean_a), x_excess)
+
+    for i in np.flatnonzero(np.minimum(x_alpha, x_beta) < _GAUSS_MIN_PARAMETER):
+        probability[i] = _probability_b_beats_a(alpha_a[i], beta_a[i], alpha_b[i], beta_b[i])
+        gain[i], _ = _expected_loss(alpha_a[i], beta_a[i], alpha_b[i], beta_b[i])
+    return np.clip(probability, 0.0, 1.0), np.maximum(gain, 0.0)
+
+
+# Smallest posterior parameter for which the Cornish-Fisher lift quantile is
+# used; from here up it is within ~0.002 percentage points of the exact
+# quantile, while at single-digit counts it can be off by several percent
+_CORNISH_FISHER_MIN_PARAMETER = 100
+
+# Newton iterations for the exact lift quantile stop once every step is
+# below this (in log-ratio units, i.e. relative lift)
+_LOG_RATIO_XTOL = 1e-9
+_LOG_RATIO_MAX_ITERATIONS = 50
+
+
+def _log_ratio_quantile(
+    alpha_a: np.ndarray, beta_a: np.ndarray, alpha_b: np.ndarray, beta_b: np.ndarray, q
+) -> np.ndarray:
+    """
+    Quantile of log(B / A) for Beta posteriors.
+
+    Uses the Cornish-Fisher expansion when every posterior parameter is at
+    least ``_CORNISH_FISHER_MIN_PARAMETER`` and the exact quadrature
+    quantile otherwise, element by element.
+    """
+    params = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (alpha_a, beta_a, alpha_b, beta_b, q)))
+    value = np.array(_cornish_fisher_log_ratio_quantile(*params))
+    small = np.minimum.reduce(params[:4]) < _CORNISH_FISHER_MIN_PARAMETER
+    if small.any():
+        value[small] = _quadrature_log_ratio_quantile(*(p[small] for p in params), start=value[small])
+    return value
+
+
+def _cornish_fisher_log_ratio_quantile(
+    alpha_a: np.ndarray, beta_a: np.ndarray, alpha_b: np.ndarray, beta_b: np.ndarray, q
+) -> np.ndarray:
+    """
+    Quantile of log(B / A) for Beta posteriors by Cornish-Fisher expansion.
+
+    The cumulants of log X for X ~ Beta(a, b) are exact,
+    kappa_n = psi^(n-1)(a) - psi^(n-1)(a + b), and those of log B - log A
+    follow by independence. Four cumulants correct the Normal quantile for
+    the skew of moderate-count posteriors.
+    """
+    mean = (digamma(alpha_b) - digamma(alpha_b + beta_b)) - (digamma(alpha_a) - digamma(alpha_a + beta_a))
+    variance, third, fourth = (
+        (polygamma(n, alpha_b) - polygamma(n, alpha_b + beta_b))
+        + (-1) ** (n + 1) * (polygamma(n, alpha_a) - polygamma(n, alpha_a + beta_a))
+        for n in (1, 2, 3)
+    )
+    sd = np.sqrt(variance)
+    skew = third / sd ** 3
+    kurtosis = fourth / variance ** 2
+    z = ndtri(q)
+    w = z + (z ** 2 - 1) * skew / 6 + (z ** 3 - 3 * z) * kurtosis / 24 - (2 * z ** 3 - 5 * z) * skew ** 2 / 36
+    return mean + sd * w
+
+
+def _quadrature_log_ratio_quantile(
+    alpha_a: np.ndarray, beta_a: np.ndarray, alpha_b: np.ndarray, beta_b: np.ndarray, q: np.ndarray,
+    start: np.ndarray,
+) -> np.ndarray:
+    """
+    Exact quantile of log(B / A) for 1-D arrays of Beta posteriors.
+
+    P(log(B / A) <= r) = E[I_B(e^r A)] is a Gauss-Legendre sum over the
+    narrower posterior's quantiles (1 - E[I_A(e^-r B)] when that is B), so
+    the other arm's CDF is smooth across the nodes. Its derivative in r is
+    the same sum over the other arm's density, and Newton's method from
+    ``start`` converges in a few steps; steps that leave the bracket of
+    points already evaluated fall back to bisection.
+    """
+    narrow_a = _beta_variance(alpha_a, beta_a) <= _beta_variance(alpha_b, beta_b)
+    sign = np.where(narrow_a, 1.0, -1.0)
+    nodes = betaincinv(
+        np.where(narrow_a, alpha_a, alpha_b)[:, None], np.where(narrow_a, beta_a, beta_b)[:, None],
+        _GAUSS_PROBABILITIES,
+    )
+    alpha_o = np.where(narrow_a, alpha_b, alpha_a)[:, None]
+    beta_o = np.where(narrow_a, beta_b, beta_a)[:, None]
+    log_norm = betaln(alpha_o, beta_o)
+
+    # Bracket holding all but 1e-15 of each posterior's mass
+    lower = np.log(betaincinv(alpha_b, beta_b, 1e-15)) - np.log(betaincinv(alpha_a, beta_a, 1 - 1e-15))
+    upper = np.log(betaincinv(alpha_b, beta_b, 1 - 1e-15)) - np.log(betaincinv(alpha_a, beta_a, 1e-15))
+    r = np.clip(start, lower, upper)
+    active = np.arange(r.size)
+    for _ in range(_LOG_RATIO_MAX_ITERATIONS):
+        x = np.exp(sign[active] * r[active])[:, None] * nodes[active]
+        inside = x < 1
+        x = np.minimum(x, 1.0)
+        a, b = alpha_o[active], beta_o[active]
+        mass = betainc(a, b, x) @ _GAUSS_HALF_WEIGHTS
+        with np.errstate(divide="ignore", invalid="ignore"):
+            density = np.where(inside, np.exp(xlogy(a, x) + xlog1py(b - 1, -x) - log_norm[active]), 0.0)
+            excess = np.where(narrow_a[active], mass, 1 - mass) - q[active]
+            below = excess < 0
+            lower[active] = np.where(below, r[active], lower[active])
+            upper[active] = np.where(below, upper[active], r[active])
+            step = r[active] - excess / (density @ _GAUSS_HALF_WEIGHTS)
+        bracketed = (step > lower[active]) & (step < upper[active])
+        step = np.where(bracketed, step, 0.5 * (lower[active] + upper[active]))
+        moved = np.abs(step - r[active])
+        r[active] = step
+        active = active[moved > _LOG_RATIO_XTOL]
+        if not active.size:
+            break
+    return r
+
+
+def analyze_batch(
+    control_visitors,
+    control_conversions,
+    variant_visitors,
+    variant_conversions,
+    prior_alpha=1,
+    prior_beta=1,
+    confidence_threshold=0.95,
+    credibility=0.95,
+    strict: bool = False,
+) -> BayesianResultsFrame:
+    """
+    Analyze many A/B tests at once.
+
+    Arguments broadcast like NumPy arrays. Every quantity is computed for
+    all rows together with ``scipy.special``, with no sampling:
+
+    - P(variant > control) and the expected losses use the same quadrature
+      as ``analyze`` (its result to ~1e-10)
+    - credible intervals for each rate are exact Beta quantiles
+    - the lift interval is the deterministic quantile of ``analyze``:
+      a Cornish-Fisher expansion of log(variant / control) with exact
+      cumulants (polygamma) once every posterior parameter is at least
+      100, and exact quadrature for low-count rows
+
+    Use ``frame.result(i)`` for a full ``BayesianTestResult`` with its
+    recommendation text.
+
+    Rows with invalid counts do not abort the batch: their statistics are
+    NaN, their winner is "invalid" and ``frame.validation`` lists them by
+    reason.
+
+    Args:
+        control_visitors: Visitors in control, per test
+        control_conversions: Conversions in control, per test
+        variant_visitors: Visitors in variant, per test
+        variant_conversions: Conversions in variant, per test
+        prior_alpha: Alpha parameter for the Beta prior (default 1)
+        prior_beta: Beta parameter for the Beta prior (default 1)
+        confidence_threshold: Probability threshold to declare a winner (default 0.95)
+        credibility: Credibility level for intervals (default 0.95)
+        strict: Raise ValueError if any row is invalid (default False)
+
+    Returns:
+        BayesianResultsFrame with the fields of ``BayesianTestResult``
+        (intervals split into _lower / _upper columns)
+
+    Example:
+        >>> frame = bayesian.analyze_batch(10000, 500, [10000, 10000], [550, 480])
+        >>> frame.probability_variant_better.round(1)
+        array([94.3, 25.6])
+    """
+    (control_visitors, control_conversions, variant_visitors, variant_conversions,
+     prior_alpha, prior_beta, confidence_threshold, credibility) = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v)) for v in (
+            control_visitors, control_conversions, variant_visitors, variant_conversions,
+            prior_alpha, prior_beta, confidence_threshold, credibility,
+        ))
+    )
+    report = validate_visitors_array(
+        control_visitors, control_conversions, "control_visitors", "control_conversions"
+    ).merge(validate_visitors_array(
+        variant_visitors, variant_conversions, "variant_visitors", "variant_conversions"
+    ))
+    if strict:
+        report.raise_if_invalid()
+
+    # Invalid rows are computed on placeholder counts and blanked afterwards
+    n_c, c_c = report.where_valid(control_visitors, 1), report.where_valid(control_conversions, 0)
+    n_v, c_v = report.where_valid(variant_visitors, 1), report.where_valid(variant_conversions, 0)
+    control_rate = c_c / n_c
+    variant_rate = c_v / n_v
+    alpha_c, beta_c = (np.asarray(p, dtype=float) for p in _beta_posterior(c_c, n_c, prior_alpha, prior_beta))
+    alpha_v, beta_v = (np.asarray(p, dtype=float) for p in _beta_posterior(c_v, n_v, prior_alpha, prior_beta))
+
+    with stage("bayesian.probability_better"):
+        prob_variant_better, loss_control = _pair_quadrature_array(alpha_c, beta_c, alpha_v, beta_v)
+
+    with stage("bayesian.expected_loss"):
+        # max(0, A - B) = max(0, B - A) - (B - A)
+        mean_c = alpha_c / (alpha_c + beta_c)
+        mean_v = alpha_v / (alpha_v + beta_v)
+        loss_variant = np.maximum(loss_control - (mean_v - mean_c), 0.0)
+
+    with stage("bayesian.credible_intervals"):
+        lower = (1 - credibility) / 2
+        upper = 1 - lower
+        lift_lower, lift_upper = (np.expm1(_log_ratio_quantile(alpha_c, beta_c, alpha_v, beta_v, q)) * 100
+                                  for q in (lower, upper))
+
+    lift_absolute = variant_rate - control_rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lift_percent = np.where(control_rate > 0, lift_absolute / control_rate * 100, 0.0)
+
+    def blank(values):
+        return report.where_valid(values, np.nan)
+
+    has_winner = (prob_variant_better >= confidence_threshold) | (1 - prob_variant_better >= confidence_threshold)
+    frame = BayesianResultsFrame(
+        control_visitors=control_visitors,
+        control_conversions=control_conversions,
+        variant_visitors=variant_visitors,
+        variant_conversions=variant_conversions,
+        control_rate=blank(control_rate),
+        variant_rate=blank(variant_rate),
+        probability_variant_better=blank(prob_variant_better * 100),
+        probability_control_better=blank((1 - prob_variant_better) * 100),
+        expected_loss_choosing_variant=blank(loss_variant * 100),
+        expected_loss_choosing_control=blank(loss_control * 100),
+        control_credible_interval_lower=blank(betaincinv(alpha_c, beta_c, lower)),
+        control_credible_interval_upper=blank(betaincinv(alpha_c, beta_c, upper)),
+        variant_credible_interval_lower=blank(betaincinv(alpha_v, beta_v, lower)),
+        variant_credible_interval_upper=blank(betaincinv(alpha_v, beta_v, upper)),
+        lift_credible_interval_lower=blank(lift_lower),
+        lift_credible_interval_upper=blank(lift_upper),
+        lift_percent=blank(lift_percent),
+        lift_absolute=blank(lift_absolute),
+        has_winner=report.where_valid(has_winner, False),
+        confidence_threshold=confidence_threshold * 100,
+    )
+    frame.validation = report
+    return frame
+
+
+def _posterior_drift(old: Tuple[float, float], new: Tuple[float, float]) -> float:
+    """
+    How far a Beta posterior moved, in units of its old standard deviation.
+
+    The larger of the shift in mean and the relative change in spread.
+    """
+    old_mean = old[0] / (old[0] + old[1])
+    new_mean = new[0] / (new[0] + new[1])
+    old_sd = math.sqrt(_beta_variance(*old))
+    new_sd = math.sqrt(_beta_variance(*new))
+    return max(abs(new_mean - old_mean) / old_sd, abs(new_sd / old_sd - 1))
+
+
+class BayesianState:
+    """
+    Incrementally updated Beta posteriors for a test that is polled often.
+
+    Holds the counts of both arms, accepts deltas through ``update`` and
+    caches every derived quantity together with the posterior parameters it
+    was computed from. A cached value is reused while each posterior it
+    depends on has drifted by at most ``tolerance`` standard deviations
+    since (see ``_posterior_drift``); the default of 0 reuses values only
+    while the counts are unchanged. Per-arm intervals depend on one arm
+    only, so an update to the variant leaves the control interval cached.
+
+    Everything is deterministic: P(better) and the expected losses share
+    one quadrature (as in ``analyze_batch``), intervals are Beta quantiles
+    and the lift interval is the deterministic quantile shared with
+    ``analyze`` and ``analyze_batch``.
+
+    Example:
+        >>> state = bayesian.BayesianState(10000, 500, 10000, 550, tolerance=0.05)
+        >>> state.probability_variant_better()
+        94.3...
+        >>> state.update(control_visitors=200, control_conversions=9,
+        ...              variant_visitors=200, variant_conversions=12)
+        >>> result = state.result()  # reuses whatever is still within tolerance
+    """
+
+    def __init__(
+        self,
+        control_visitors: int = 0,
+        control_conversions: int = 0,
+        variant_visitors: int = 0,
+        variant_conversions: int = 0,
+        prior_alpha: float = 1,
+        prior_beta: float = 1,
+        confidence_threshold: float = 0.95,
+        credibility: float = 0.95,
+        tolerance: float = 0.0,
+    ):
+        if tolerance < 0:
+            raise ValueError("tolerance cannot be negative")
+        self.control_visitors = 0
+        self.control_conversions = 0
+        self.variant_visitors = 0
+        self.variant_conversions = 0
+        self.prior_alpha = prior_alpha
+        self.prior_beta = prior_beta
+        self.confidence_threshold = confidence_threshold
+        self.credibility = credibility
+        self.tolerance = tolerance
+        self._cache: Dict[str, Tuple[Tuple[Tuple[float, float], ...], object]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.update(control_visitors, control_conversions, variant_visitors, variant_conversions)
+
+    def update(
+        self,
+        control_visitors: int = 0,
+        control_conversions: int = 0,
+        variant_visitors: int = 0,
+        variant_conversions: int = 0,
+    ) -> "BayesianState":
+        """
+        Add newly observed visitors and conversions to each arm.
+
+        Returns:
+            The state itself, so calls can be chained
+        """
+        if min(control_visitors, control_conversions, variant_visitors, variant_conversions) < 0:
+            raise ValueError("Count deltas cannot be negative")
+        if self.control_conversions + control_conversions > self.control_visitors + control_visitors:
+            raise ValueError("Control conversions cannot exceed control visitors")
+        if self.variant_conversions + variant_conversions > self.variant_visitors + variant_visitors:
+            raise ValueError("Variant conversions cannot exceed variant visitors")
+        self.control_visitors += control_visitors
+        self.control_conversions += control_conversions
+        self.variant_visitors += variant_visitors
+        self.variant_conversions += variant_conversions
+        return self
+
+    @property
+    def control_posterior(self) -> Tuple[float, float]:
+        """(alpha, beta) of the control posterior."""
+        return _beta_posterior(self.control_conversions, self.control_visitors, self.prior_alpha, self.prior_beta)
+
+    @property
+    def variant_posterior(self) -> Tuple[float, float]:
+        """(alpha, beta) of the variant posterior."""
+        return _beta_posterior(self.variant_conversions, self.variant_visitors, self.prior_alpha, self.prior_beta)
+
+    def _cached(self, name: str, posteriors: Tuple[Tuple[float, float], ...], compute: Callable[[], object]):
+        entry = self._cache.get(name)
+        if entry is not None:
+            cached_posteriors, value = entry
+            if cached_posteriors == posteriors or (
+                self.tolerance > 0
+                and max(map(_posterior_drift, cached_posteriors, posteriors)) <= self.tolerance
+            ):
+                self.hits += 1
+                return value
+        self.misses += 1
+        value = compute()
+        self._cache[name] = (posteriors, value)
+        return value
+
+    def _comparison(self) -> Tuple[float, float, float]:
+        """P(variant > control) and the losses of choosing control / variant, as fractions."""
+        control, variant = self.control_posterior, self.variant_posterior
+
+        def compute():
+            alpha_c, beta_c, alpha_v, beta_v = (np.array([p], dtype=float) for p in (*control, *variant))
+            probability, gain = _pair_quadrature_array(alpha_c, beta_c, alpha_v, beta_v)
+            mean_shift = alpha_v / (alpha_v + beta_v) - alpha_c / (alpha_c + beta_c)
+            return float(probability[0]), float(gain[0]), float(max(gain[0] - mean_shift[0], 0.0))
+
+        return self._cached("comparison", (control, variant), compute)
+
+    def probability_variant_better(self) -> float:
+        """P(variant > control), in percent."""
+        with stage("bayesian.probability_better"):
+            return self._comparison()[0] * 100
+
+    def expected_losses(self) -> Tuple[float, float]:
+        """Expected loss of choosing control and of choosing variant, in percentage points."""
+        with stage("bayesian.expected_loss"):
+            _, loss_control, loss_variant = self._comparison()
+        return loss_control * 100, loss_variant * 100
+
+    def credible_intervals(self) -> Dict[str, Tuple[float, float]]:
+        """Credible intervals keyed "control", "variant" (rates) and "lift" (percent)."""
+        lower = (1 - self.credibility) / 2
+        upper = 1 - lower
+        control, variant = self.control_posterior, self.variant_posterior
+        with stage("bayesian.credible_intervals"):
+            return {
+                "control": self._cached("control_interval", (control,), lambda: _credible_interval(*control, self.credibility)),
+                "variant": self._cached("variant_interval", (variant,), lambda: _credible_interval(*variant, self.credibility)),
+                "lift": self._cached("lift_interval", (control, variant), lambda: tuple(
+                    math.expm1(float(_log_ratio_quantile(*control, *variant, q))) * 100 for q in (lower, upper)
+                )),
+            }
+
+    def result(self, explain: bool = True) -> BayesianTestResult:
+        """
+        Assemble a ``BayesianTestResult`` from the cached quantities.
+
+        Args:
+            explain: Generate the recommendation text (default True)
+        """
+        if self.control_visitors <= 0 or self.variant_visitors <= 0:
+            raise ValueError("Visitors must be positive")
+
+        prob_variant_better = self.probability_variant_better() / 100
+        prob_control_better = 1 - prob_variant_better
+        loss_control, loss_variant = self.expected_losses()
+        intervals = self.credible_intervals()
+
+        control_rate = self.control_conversions / self.control_visitors
+        variant_rate = self.variant_conversions / self.variant_visitors
+        lift_absolute = variant_rate - control_rate
+        lift_percent = (lift_absolute / control_rate * 100) if control_rate > 0 else 0
+
+        has_winner = False
+        winner = "none"
+        if prob_variant_better >= self.confidence_threshold:
+            has_winner = True
+            winner = "variant"
+        elif prob_control_better >= self.confidence_threshold:
+            has_winner = True
+            winner = "control"
+
+        recommendation = ""
+        if explain:
+            with stage("bayesian.recommendation"):
+                recommendation = _generate_recommendation(
+                    prob_variant_better=prob_variant_better,
+                    prob_control_better=prob_control_better,
+                    loss_variant=loss_variant / 100,
+                    loss_control=loss_control / 100,
+                    control_rate=control_rate,
+                    variant_rate=variant_rate,
+                    lift_percent=lift_percent,
+                    ci_lift=intervals["lift"],
+                    has_winner=has_winner,
+                    winner=winner,
+                    confidence_threshold=self.confidence_threshold,
+                )
+
+        return BayesianTestResult(
+            control_visitors=self.control_visitors,
+            control_conversions=self.control_conversions,
+            variant_visitors=self.variant_visitors,
+            variant_conversions=self.variant_conversions,
+            control_rate=control_rate,
+            variant_rate=variant_rate,
+            probability_variant_better=prob_variant_better * 100,
+            probability_control_better=prob_control_better * 100,
+            probability_variant_best=prob_variant_better * 100,
+            expected_loss_choosing_variant=loss_variant,
+            expected_loss_choosing_control=loss_control,
+            control_credible_interval=intervals["control"],
+            variant_credible_interval=intervals["variant"],
+            lift_credible_interval=intervals["lift"],
+            lift_percent=lift_percent,
+            lift_absolute=lift_absolute,
+            has_winner=has_winner,
+            winner=winner,
+            confidence_threshold=self.confidence_threshold * 100,
+            recommendation=recommendation,
+        )
+
+    def cache_info(self) -> Dict[str, int]:
+        """Cache hits and misses since the state was created."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache)}
+
+
+ContinuousModel = Literal["normal", "lognormal"]
+
+# Gauss-Legendre rule mapped onto probability space: E[f(X)] is the weighted
+# sum of f at X's quantiles of these probabilities
+_GAUSS_PROBABILITIES = 0.5 * (_GAUSS_NODES + 1)
+_GAUSS_HALF_WEIGHTS = 0.5 * _GAUSS_WEIGHTS
+_GAUSS_NORMAL_QUANTILES = ndtri(_GAUSS_PROBABILITIES)
+
+# Posterior mass at or below zero above which a relative lift is undefined
+_POSITIVE_MASS_TOLERANCE = 1e-9
+
+
+@lru_cache(maxsize=256)
+def _t_quantile_nodes(df: float) -> np.ndarray:
+    return stdtrit(df, _GAUSS_PROBABILITIES)
+
+
+@dataclass(frozen=True)
+class _StudentT:
+    """Student-t posterior of a group mean."""
+    df: float
+    loc: float
+    scale: float
+
+    def scaled(self, factor: float = 1.0, shift: float = 0.0) -> "_StudentT":
+        """Distribution of factor * X + shift, for factor > 0."""
+        return _StudentT(self.df, factor * self.loc + shift, factor * self.scale)
+
+    def cdf(self, x):
+        return stdtr(self.df, (x - self.loc) / self.scale)
+
+    def ppf(self, q):
+        return self.loc + self.scale * stdtrit(self.df, q)
+
+    def nodes(self) -> np.ndarray:
+        """Quantiles at ``_GAUSS_PROBABILITIES``."""
+        return self.loc + self.scale * _t_quantile_nodes(self.df)
+
+    def partial_expectations(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """E[max(0, X - x)] and E[max(0, x - X)]; needs df > 1."""
+        nu = self.df
+        z = (x - self.loc) / self.scale
+        pdf = np.exp(-0.5 * (nu + 1) * np.log1p(z * z / nu) - 0.5 * math.log(nu) - betaln(0.5, 0.5 * nu))
+        cdf = stdtr(nu, z)
+        tail = (nu + z * z) / (nu - 1) * pdf
+        return self.scale * (tail - z * (1 - cdf)), self.scale * (tail + z * cdf)
+
+
+def _normal_inverse_gamma_posterior(
+    n: int, mean: float, std: float, prior_mean: float = 0.0, prior_strength: float = 0.0
+) -> _StudentT:
+    """
+    Marginal posterior of a group mean under a Normal-Inverse-Gamma model.
+
+    Conjugate update from summary statistics:
+    Prior: mu | sigma^2 ~ N(prior_mean, sigma^2 / prior_strength),
+           p(sigma^2) proportional to 1 / sigma^2
+    Posterior: sigma^2 ~ InvGamma(n / 2, rate), so mu ~ t_n(loc, scale)
+    with scale = sqrt(rate / (n / 2 * kappa))
+
+    With prior_strength = 0 (default) the mean has no prior density and
+    this is the reference prior p(mu, sigma^2) proportional to 1 / sigma^2:
+    the shape drops to (n - 1) / 2, giving t_{n-1} with loc = mean and
+    scale = std / sqrt(n).
+    """
+    kappa = prior_strength + n
+    loc = (prior_strength * prior_mean + n * mean) / kappa
+    shape = n / 2 if prior_strength > 0 else (n - 1) / 2
+    rate = 0.5 * (n - 1) * std ** 2 + prior_strength * n * (mean - prior_mean) ** 2 / (2 * kappa)
+    return _StudentT(2 * shape, loc, math.sqrt(rate / (shape * kappa)))
+
+
+def _t_probability(a: _StudentT, b: _StudentT) -> float:
+    """P(B > A) for independent t posteriors, integrating over the narrower one."""
+    if b.scale <= a.scale:
+        return float(np.dot(_GAUSS_HALF_WEIGHTS, a.cdf(b.nodes())))
+    return float(np.dot(_GAUSS_HALF_WEIGHTS, 1 - b.cdf(a.nodes())))
+
+
+def _t_expected_loss(a: _StudentT, b: _StudentT) -> Tuple[float, float]:
+    """
+    Expected loss for each choice under independent t posteriors.
+
+    E[max(0, B - A)] integrates the closed-form partial expectation of the
+    wider posterior over the narrower one.
+
+    Returns:
+        Tuple of (loss choosing A, loss choosing B)
+    """
+    if a.scale <= b.scale:
+        upper, _ = b.partial_expectations(a.nodes())
+        gain = float(np.dot(_GAUSS_HALF_WEIGHTS, upper))
+    else:
+        _, lower = a.partial_expectations(b.nodes())
+        gain = float(np.dot(_GAUSS_HALF_WEIGHTS, lower))
+    return max(gain, 0.0), max(gain - (b.loc - a.loc), 0.0)
+
+
+def _log_mean_posterior(n: int, mean: float, std: float) -> Tuple[float, float]:
+    """
+    Approximate Normal posterior (loc, scale) of log E[X] for log-normal data.
+
+    The log-scale variance comes from the raw mean and std by the method of
+    moments, sigma^2 = log(1 + (std / mean)^2). Under the reference
+    Normal-Inverse-Gamma prior on the log scale, mu + sigma^2 / 2 is close
+    to Normal with variance sigma^2 / n + sigma^4 / (2 (n - 1)) (Cox's
+    method), centred on log(mean).
+    """
+    sigma_sq = math.log1p((std / mean) ** 2)
+    return math.log(mean), math.sqrt(sigma_sq / n + sigma_sq ** 2 / (2 * (n - 1)))
+
+
+def _log_normal_difference_cdf(a: Tuple[float, float], b: Tuple[float, float], d: float) -> float:
+    """P(exp(B) - exp(A) <= d) for independent Normal log means A and B."""
+    (loc_a, scale_a), (loc_b, scale_b) = a, b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if scale_a <= scale_b:
+            bound = np.exp(loc_a + scale_a * _GAUSS_NORMAL_QUANTILES) + d
+            inner = np.where(bound > 0, ndtr((np.log(bound) - loc_b) / scale_b), 0.0)
+        else:
+            bound = np.exp(loc_b + scale_b * _GAUSS_NORMAL_QUANTILES) - d
+            inner = np.where(bound > 0, ndtr((loc_a - np.log(bound)) / scale_a), 1.0)
+    return float(np.dot(_GAUSS_HALF_WEIGHTS, inner))
+
+
+def _root_quantile(cdf: Callable[[float], float], q: float, guess: float, step: float) -> float:
+    """Solve cdf(x) = q with brentq, widening the bracket around ``guess``."""
+    from scipy.optimize import brentq
+
+    lower, upper = guess - step, guess + step
+    for _ in range(60):
+        if cdf(lower) <= q:
+            break
+        lower -= upper - lower
+    for _ in range(60):
+        if cdf(upper) >= q:
+            break
+        upper += upper - lower
+    return brentq(lambda x: cdf(x) - q, lower, upper, xtol=1e-12 * max(abs(guess), step))
+
+
+def analyze_continuous(
+    control_visitors: int,
+    control_mean: float,
+    control_std: float,
+    variant_visitors: int,
+    variant_mean: float,
+    variant_std: float,
+    model: ContinuousModel = "normal",
+    prior_mean: float = 0.0,
+    prior_strength: float = 0.0,
+    confidence_threshold: float = 0.95,
+    credibility: float = 0.95,
+    explain: bool = True,
+) -> BayesianContinuousResult:
+    """
+    Analyze a continuous metric (revenue, order value, time on site) with
+    conjugate Bayesian models on summary statistics.
+
+    Takes the same inputs as ``MagnitudeEffect.analyze``. No raw data or
+    resampling is needed: every quantity is a closed form or a 1-D
+    quadrature.
+
+    Models:
+    - "normal": Normal-Inverse-Gamma conjugate model per group, whose
+      marginal posterior for the mean is a Student t
+    - "lognormal": for positive, right-skewed metrics; the group mean
+      E[X] = exp(mu + sigma^2 / 2) gets an approximately log-normal
+      posterior from log-scale moments (see ``_log_mean_posterior``)
+
+    Args:
+        control_visitors: Number of observations in control (at least 3)
+        control_mean: Sample mean in control
+        control_std: Sample standard deviation in control
+        variant_visitors: Number of observations in variant (at least 3)
+        variant_mean: Sample mean in variant
+        variant_std: Sample standard deviation in variant
+        model: "normal" (default) or "lognormal"
+        prior_mean: Prior guess for each group's mean ("normal" only)
+        prior_strength: Weight of ``prior_mean`` in pseudo-observations;
+            0 (default) is the non-informative reference prior ("normal" only)
+        confidence_threshold: Probability threshold to declare a winner (default 0.95)
+        credibility: Credibility level for intervals (default 0.95)
+        explain: Generate the recommendation text (default True)
+
+    Returns:
+        BayesianContinuousResult. Expected losses and the difference
+        interval are in the metric's units; the lift interval is in percent
+        and is (nan, nan) when either mean has posterior mass at or below
+        zero, where a relative lift is undefined
+
+    Example:
+        >>> result = bayesian.analyze_continuous(
+        ...     control_visitors=5000, control_mean=52.0, control_std=38.0,
+        ...     variant_visitors=5000, variant_mean=54.1, variant_std=40.0,
+        ...     model="lognormal",
+        ... )
+        >>> print(f"{result.probability_variant_better:.1f}% chance variant is better")
+        99.7% chance variant is better
+    """
+    if model not in ("normal", "lognormal"):
+        raise ValueError(f"model must be 'normal' or 'lognormal', got {model!r}")
+    if control_visitors < 3 or variant_visitors < 3:
+        raise ValueError("Visitors must be at least 3")
+    if control_std <= 0 or variant_std <= 0:
+        raise ValueError("Standard deviation must be positive")
+    if prior_strength < 0:
+        raise ValueError("prior_strength cannot be negative")
+    if model == "lognormal":
+        if control_mean <= 0 or variant_mean <= 0:
+            raise ValueError("Means must be positive for the lognormal model")
+        if prior_strength:
+            raise ValueError("prior_strength is only supported with model='normal'")
+
+    lower = (1 - credibility) / 2
+    upper = 1 - lower
+    z = float(ndtri(upper))
+
+    if model == "normal":
+        post_c = _normal_inverse_gamma_posterior(control_visitors, control_mean, control_std, prior_mean, prior_strength)
+        post_v = _normal_inverse_gamma_posterior(variant_visitors, variant_mean, variant_std, prior_mean, prior_strength)
+
+        with stage("bayesian.probability_better"):
+            prob_variant_better = _t_probability(post_c, post_v)
+
+        with stage("bayesian.expected_loss"):
+            loss_control, loss_variant = _t_expected_loss(post_c, post_v)
+
+        with stage("bayesian.credible_intervals"):
+            ci_control = tuple(float(x) for x in post_c.ppf([lower, upper]))
+            ci_variant = tuple(float(x) for x in post_v.ppf([lower, upper]))
+
+            # P(B - A <= d) = 1 - P(B > A + d)
+            spread = math.hypot(post_c.scale, post_v.scale)
+            center = post_v.loc - post_c.loc
+            ci_difference = tuple(
+                _root_quantile(lambda d: 1 - _t_probability(post_c.scaled(shift=d), post_v), q, center, z * spread)
+                for q in (lower, upper)
+            )
+
+            # For positive means, P(B / A <= e^r) = 1 - P(B > e^r * A)
+            if max(post_c.cdf(0.0), post_v.cdf(0.0)) > _POSITIVE_MASS_TOLERANCE:
+                ci_lift = (math.nan, math.nan)
+            else:
+                center = math.log(post_v.loc / post_c.loc)
+                step = z * math.hypot(post_c.scale / post_c.loc, post_v.scale / post_v.loc)
+                ci_lift = tuple(
+                    math.expm1(_root_quantile(
+                        lambda r: 1 - _t_probability(post_c.scaled(factor=math.exp(r)), post_v), q, center, step,
+                    )) * 100
+                    for q in (lower, upper)
+                )
+    else:
+        loc_c, scale_c = _log_mean_posterior(control_visitors, control_mean, control_std)
+        loc_v, scale_v = _log_mean_posterior(variant_visitors, variant_mean, variant_std)
+        scale = math.hypot(scale_c, scale_v)
+
+        with stage("bayesian.probability_better"):
+            prob_variant_better = float(ndtr((loc_v - loc_c) / scale))
+
+        with stage("bayesian.expected_loss"):
+            # E[max(0, e^B - e^A)] for Normal A, B (Margrabe's exchange formula)
+            mean_c = math.exp(loc_c + scale_c ** 2 / 2)
+            mean_v = math.exp(loc_v + scale_v ** 2 / 2)
+            gain = (
+                mean_v * float(ndtr((loc_v - loc_c + scale_v ** 2) / scale))
+                - mean_c * float(ndtr((loc_v - loc_c - scale_c ** 2) / scale))
+            )
+            loss_control = max(gain, 0.0)
+            loss_variant = max(gain - (mean_v - mean_c), 0.0)
+
+        with stage("bayesian.credible_intervals"):
+            ci_control = (math.exp(loc_c - z * scale_c), math.exp(loc_c + z * scale_c))
+            ci_variant = (math.exp(loc_v - z * scale_v), math.exp(loc_v + z * scale_v))
+            ci_lift = (math.expm1(loc_v - loc_c - z * scale) * 100, math.expm1(loc_v - loc_c + z * scale) * 100)
+            center = variant_mean - control_mean
+            step = z * math.hypot(control_mean * scale_c, variant_mean * scale_v)
+            ci_difference = tuple(
+                _root_quantile(
+                    lambda d: _log_normal_difference_cdf((loc_c, scale_c), (loc_v, scale_v), d), q, center, step,
+                )
+                for q in (lower, upper)
+            )
+    prob_control_better = 1 - prob_variant_better
+
+    lift_absolute = variant_mean - control_mean
+    lift_percent = (lift_absolute / control_mean * 100) if control_mean != 0 else 0
+
+    has_winner = False
+    winner = "none"
+    if prob_variant_better >= confidence_threshold:
+        has_winner = True
+        winner = "variant"
+    elif prob_control_better >= confidence_threshold:
+        has_winner = True
+        winner = "control"
+
+    recommendation = ""
+    if explain:
+        with stage("bayesian.recommendation"):
+            recommendation = _continuous_recommendation(
+                prob_variant_better=prob_variant_better,
+                loss_variant=loss_variant,
+                loss_control=loss_control,
+                control_mean=control_mean,
+                variant_mean=variant_mean,
+                lift_percent=lift_percent,
+                ci_difference=ci_difference,
+                has_winner=has_winner,
+                winner=winner,
+                confidence_threshold=confidence_threshold,
+            )
+
+    return BayesianContinuousResult(
+        model=model,
+        control_visitors=control_visitors,
+        control_mean=control_mean,
+        control_std=control_std,
+        variant_visitors=variant_visitors,
+        variant_mean=variant_mean,
+        variant_std=variant_std,
+        probability_variant_better=prob_variant_better * 100,
+        probability_control_better=prob_control_better * 100,
+        expected_loss_choosing_variant=loss_variant,
+        expected_loss_choosing_control=loss_control,
+        control_credible_interval=ci_control,
+        variant_credible_interval=ci_variant,
+        difference_credible_interval=ci_difference,
+        lift_credible_interval=ci_lift,
+        lift_percent=lift_percent,
+        lift_absolute=lift_absolute,
+        has_winner=has_winner,
+        winner=winner,
+        confidence_threshold=confidence_threshold * 100,
+        recommendation=recommendation,
+    )
+
+
+def _continuous_recommendation(
+    prob_variant_better: float,
+    loss_variant: float,
+    loss_control: float,
+    control_mean: float,
+    variant_mean: float,
+    lift_percent: float,
+    ci_difference: Tuple[float, float],
+    has_winner: bool,
+    winner: str,
+    confidence_threshold: float,
+) -> str:
+    """Generate human-readable recommendation for a continuous metric."""
+    results = (
+        f"- Control: {control_mean:,.4g} average\n"
+        f"- Variant: {variant_mean:,.4g} average\n"
+        f"- Lift: {lift_percent:+.1f}% (difference {ci_difference[0]:+,.4g} to {ci_difference[1]:+,.4g})\n\n"
+        f"### Risk Analysis\n"
+        f"- Expected loss if choosing variant: {loss_variant:,.4g} per visitor\n"
+        f"- Expected loss if choosing control: {loss_control:,.4g} per visitor\n\n"
+    )
+    if has_winner and winner == "variant":
+        return (
+            f"## Variant Wins!\n\n"
+            f"**{prob_variant_better*100:.1f}%** probability that the variant has the higher mean.\n\n"
+            f"### Results\n{results}"
+            f"**Recommendation:** Implement the variant. The probability of improvement is "
+            f"above your {confidence_threshold*100:.0f}% threshold."
+        )
+    elif has_winner and winner == "control":
+        return (
+            f"## Control Wins!\n\n"
+            f"**{(1 - prob_variant_better)*100:.1f}%** probability that control has the higher mean.\n\n"
+            f"### Results\n{results}"
+            f"**Recommendation:** Keep the control. The variant performs worse."
+        )
+    leading = "Variant" if prob_variant_better > 0.5 else "Control"
+    leading_prob = max(prob_variant_better, 1 - prob_variant_better) * 100
+    return (
+        f"## No Clear Winner Yet\n\n"
+        f"**{leading}** is currently leading with {leading_prob:.1f}% probability of being better, "
+        f"but this is below your {confidence_threshold*100:.0f}% threshold.\n\n"
+        f"### Current Results\n{results}"
+        f"**Recommendation:** Continue running the test to gather more data, "
+        f"or lower your confidence threshold if you're comfortable with more risk."
     )
 
 
@@ -524,7 +2234,12 @@ def summarize(result: BayesianTestResult, test_name: str = "Bayesian A/B Test")
 __all__ = [
     "BayesianTestResult",
     "BayesianMultiVariantResult",
+    "BayesianContinuousResult",
+    "BayesianResultsFrame",
+    "BayesianState",
     "analyze",
     "analyze_multi",
+    "analyze_batch",
+    "analyze_continuous",
     "summarize",
 ]
@@ -0,0 +1,358 @@
+"""
+Always-Valid Sequential Testing Module (mixture SPRT).
+
+``sequential.analyze`` needs a planned sample size and controls the false
+positive rate only at its scheduled looks. The mixture sequential probability
+ratio test (mSPRT) drops both: the p-value and confidence sequence it reports
+are valid at every moment, however often the test is checked and whenever it
+is stopped.
+
+Each engine keeps the sufficient statistics of both arms in a small state
+object. ``update`` folds in an event or a mini-batch in O(1) (O(batch) for raw
+values) and refreshes the running p-value and confidence sequence, so a
+monitoring service can check many experiments without recomputing from
+totals.
+
+The test is on the difference variant - control. With estimate D, variance V
+and a normal mixture N(null_difference, tau^2) over the true difference, the
+mixture likelihood ratio is
+
+    Lambda = sqrt(V / (V + tau^2)) * exp(tau^2 (D - null)^2 / (2 V (V + tau^2)))
+
+The always-valid p-value is the running minimum of 1 / Lambda, and the
+confidence sequence is the running intersection of the differences that
+Lambda does not reject at level alpha.
+
+References:
+- Johari et al. "Always Valid Inference: Continuous Monitoring of A/B Tests" (2022)
+- Robbins "Statistical Methods Related to the Law of the Iterated Logarithm" (1970)
+"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Literal, Tuple
+
+import numpy as np
+
+
+@dataclass
+class MSPRTResult:
+    """Snapshot of an always-valid test."""
+
+    control_n: int
+    variant_n: int
+    control_mean: float
+    variant_mean: float
+    difference: float  # variant - control
+    likelihood_ratio: float  # Mixture likelihood ratio at the latest update
+    p_value: float  # Always-valid p-value
+    confidence_lower: float  # Confidence sequence bounds for the difference
+    confidence_upper: float
+    alpha: float
+    can_stop: bool
+    decision: Literal["variant_wins", "control_wins", "keep_running"]
+
+
+class _MixtureSPRT(ABC):
+    """
+    Running mSPRT on the difference of two arm means.
+
+    Subclasses hold the per-arm sufficient statistics and provide
+    ``_estimate``; this class turns them into the likelihood ratio, the
+    running p-value and the running confidence sequence.
+    """
+
+    def __init__(self, mixture_sd: float, alpha: float, null_difference: float):
+        if mixture_sd <= 0:
+            raise ValueError("mixture_sd must be positive")
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.mixture_sd = mixture_sd
+        self.alpha = alpha
+        self.null_difference = null_difference
+        self.likelihood_ratio = 1.0
+        self.p_value = 1.0
+        self.confidence_lower = -math.inf
+        self.confidence_upper = math.inf
+        self._log_inverse_alpha = math.log(1 / alpha)
+
+    @abstractmethod
+    def _estimate(self) -> Tuple[float, float]:
+        """Difference estimate and its variance (0 while undefined)."""
+        pass
+
+    @abstractmethod
+    def _arms(self) -> Tuple[int, int, float, float]:
+        """Sample sizes and means of control and variant."""
+        pass
+
+    def _refresh(self) -> None:
+        difference, variance = self._estimate()
+        if variance <= 0 or not math.isfinite(variance):
+            return
+        tau2 = self.mixture_sd ** 2
+        total = variance + tau2
+        scale = variance * total / tau2
+        log_ratio = 0.5 * math.log(variance / total) + (difference - self.null_difference) ** 2 / (2 * scale)
+        self.likelihood_ratio = math.exp(min(log_ratio, 700.0))
+        self.p_value = min(self.p_value, math.exp(-log_ratio) if log_ratio > 0 else 1.0)
+        half_width = math.sqrt(scale * (2 * self._log_inverse_alpha + math.log(total / variance)))
+        self.confidence_lower = max(self.confidence_lower, difference - half_width)
+        self.confidence_upper = min(self.confidence_upper, difference + half_width)
+
+    @property
+    def decision(self) -> Literal["variant_wins", "control_wins", "keep_running"]:
+        """Which side of the null difference the confidence sequence excludes, if any."""
+        if self.confidence_lower > self.null_difference:
+            return "variant_wins"
+        if self.confidence_upper < self.null_difference:
+            return "control_wins"
+        return "keep_running"
+
+    def result(self) -> MSPRTResult:
+        """
+        Current state of the test.
+
+        The confidence sequence excludes the null difference exactly when the
+        p-value has reached alpha, so either can serve as the stopping rule.
+
+        Returns:
+            MSPRTResult
+        """
+        control_n, variant_n, control_mean, variant_mean = self._arms()
+        decision = self.decision
+        return MSPRTResult(
+            control_n=control_n,
+            variant_n=variant_n,
+            control_mean=control_mean,
+            variant_mean=variant_mean,
+            difference=variant_mean - control_mean,
+            likelihood_ratio=self.likelihood_ratio,
+            p_value=self.p_value,
+            confidence_lower=self.confidence_lower,
+            confidence_upper=self.confidence_upper,
+            alpha=self.alpha,
+            can_stop=decision != "keep_running",
+            decision=decision,
+        )
+
+
+class ProportionMSPRT(_MixtureSPRT):
+    """
+    Always-valid comparison of two conversion rates.
+
+    The variance of the rate difference is the plug-in
+    p_c (1 - p_c) / n_c + p_v (1 - p_v) / n_v, so nothing is reported until
+    both arms have seen a conversion and a non-conversion.
+
+    Args:
+        mixture_sd: Standard deviation of the normal mixture over the rate
+            difference; set it near the effect you expect (default 0.01, one
+            percentage point)
+        alpha: Significance level (default 0.05)
+        null_difference: Rate difference under the null (default 0)
+
+    Example:
+        >>> test = msprt.ProportionMSPRT(mixture_sd=0.01)
+        >>> test.update(control_visitors=1000, control_conversions=50,
+        ...             variant_visitors=1000, variant_conversions=65)
+        >>> test.p_value, (test.confidence_lower, test.confidence_upper)
+    """
+
+    def __init__(self, mixture_sd: float = 0.01, alpha: float = 0.05, null_difference: float = 0.0):
+        super().__init__(mixture_sd, alpha, null_difference)
+        self.control_visitors = 0
+        self.control_conversions = 0
+        self.variant_visitors = 0
+        self.variant_conversions = 0
+
+    def update(
+        self,
+        control_visitors: int = 0,
+        control_conversions: int = 0,
+        variant_visitors: int = 0,
+        variant_conversions: int = 0,
+    ) -> "ProportionMSPRT":
+        """
+        Add newly observed visitors and conversions to each arm.
+
+        Returns:
+            The test itself, so calls can be chained
+        """
+        if min(control_visitors, control_conversions, variant_visitors, variant_conversions) < 0:
+            raise ValueError("Count deltas cannot be negative")
+        if self.control_conversions + control_conversions > self.control_visitors + control_visitors:
+            raise ValueError("Control conversions cannot exceed control visitors")
+        if self.variant_conversions + variant_conversions > self.variant_visitors + variant_visitors:
+            raise ValueError("Variant conversions cannot exceed variant visitors")
+        self.control_visitors += control_visitors
+        self.control_conversions += control_conversions
+        self.variant_visitors += variant_visitors
+        self.variant_conversions += variant_conversions
+        self._refresh()
+        return self
+
+    def _arms(self) -> Tuple[int, int, float, float]:
+        control_rate = self.control_conversions / self.control_visitors if self.control_visitors else 0.0
+        variant_rate = self.variant_conversions / self.variant_visitors if self.variant_visitors else 0.0
+        return self.control_visitors, self.variant_visitors, control_rate, variant_rate
+
+    def _estimate(self) -> Tuple[float, float]:
+        if not (self.control_visitors and self.variant_visitors):
+            return 0.0, 0.0
+        _, _, p_c, p_v = self._arms()
+        variance = p_c * (1 - p_c) / self.control_visitors + p_v * (1 - p_v) / self.variant_visitors
+        if p_c in (0.0, 1.0) or p_v in (0.0, 1.0):
+            variance = 0.0
+        return p_v - p_c, variance
+
+
+class MeanMSPRT(_MixtureSPRT):
+    """
+    Always-valid comparison of two means (revenue, time on site, ...).
+
+    Each arm keeps its count, mean and sum of squared deviations, merged
+    with Chan's parallel update, so summaries of a mini-batch fold in with
+    O(1) work. The variance of the difference uses the sample variances.
+
+    Args:
+        mixture_sd: Standard deviation of the normal mixture over the
+            difference in means, in the metric's units; set it near the
+            effect you expect
+        alpha: Significance level (default 0.05)
+        null_difference: Difference in means under the null (default 0)
+
+    Example:
+        >>> test = msprt.MeanMSPRT(mixture_sd=2.0)
+        >>> test.update(control_values=[48.2, 51.0, 47.5], variant_values=[53.1, 49.8])
+        >>> test.update_summary(control_count=500, control_mean=50.1, control_std=12.0,
+        ...                     variant_count=500, variant_mean=52.4, variant_std=12.5)
+        >>> test.result().decision
+    """
+
+    def __init__(self, mixture_sd: float, alpha: float = 0.05, null_difference: float = 0.0):
+        super().__init__(mixture_sd, alpha, null_difference)
+        # count, mean, sum of squared deviations
+        self._control = (0, 0.0, 0.0)
+        self._variant = (0, 0.0, 0.0)
+
+    @staticmethod
+    def _merge(arm: Tuple[int, float, float], count: int, mean: float, m2: float) -> Tuple[int, float, float]:
+        n, arm_mean, arm_m2 = arm
+        if count == 0:
+            return arm
+        total = n + count
+        delta = mean - arm_mean
+        return total, arm_mean + delta * count / total, arm_m2 + m2 + delta * delta * n * count / total
+
+    def update(self, control_values: Iterable[float] = (), variant_values: Iterable[float] = ()) -> "MeanMSPRT":
+        """
+        Add raw observations to each arm.
+
+        Returns:
+            The test itself, so calls can be chained
+        """
+        for name, values in (("_control", control_values), ("_variant", variant_values)):
+            values = np.asarray(values, dtype=float).ravel()
+            if values.size == 0:
+                continue
+            if not np.all(np.isfinite(values)):
+                raise ValueError("Values must be finite")
+            mean = float(values.mean())
+            m2 = float(np.sum((values - mean) ** 2))
+            setattr(self, name, self._merge(getattr(self, name), values.size, mean, m2))
+        self._refresh()
+        return self
+
+    def update_summary(
+        self,
+        control_count: int = 0,
+        control_mean: float = 0.0,
+        control_std: float = 0.0,
+        variant_count: int = 0,
+        variant_mean: float = 0.0,
+        variant_std: float = 0.0,
+    ) -> "MeanMSPRT":
+        """
+        Add a pre-aggregated mini-batch to each arm.
+
+        Args:
+            control_count: Observations in the control batch
+            control_mean: Mean of the control batch
+            control_std: Sample standard deviation of the control batch
+            variant_count: Observations in the variant batch
+            variant_mean: Mean of the variant batch
+            variant_std: Sample standard deviation of the variant batch
+
+        Returns:
+            The test itself, so calls can be chained
+        """
+        if control_count < 0 or variant_count < 0:
+            raise ValueError("Counts cannot be negative")
+        if control_std < 0 or variant_std < 0:
+            raise ValueError("Standard deviations cannot be negative")
+        self._control = self._merge(self._control, control_count, control_mean,
+                                    control_std ** 2 * max(control_count - 1, 0))
+        self._variant = self._merge(self._variant, variant_count, variant_mean,
+                                    variant_std ** 2 * max(variant_count - 1, 0))
+        self._refresh()
+        return self
+
+    def _arms(self) -> Tuple[int, int, float, float]:
+        return self._control[0], self._variant[0], self._control[1], self._variant[1]
+
+    def _estimate(self) -> Tuple[float, float]:
+        (n_c, mean_c, m2_c), (n_v, mean_v, m2_v) = self._control, self._variant
+        if n_c < 2 or n_v < 2:
+            return 0.0, 0.0
+        variance = m2_c / ((n_c - 1) * n_c) + m2_v / ((n_v - 1) * n_v)
+        return mean_v - mean_c, variance
+
+
+def summarize(result: MSPRTResult, test_name: str = "Always-Valid A/B Test") -> str:
+    """
+    Generate a markdown summary of always-valid test results.
+
+    Args:
+        result: MSPRTResult from ProportionMSPRT.result() or MeanMSPRT.result()
+        test_name: Name of the test for the report
+
+    Returns:
+        Markdown-formatted summary string
+    """
+    lines = [f"## {test_name} - Always-Valid Analysis\n"]
+
+    if result.decision == "variant_wins":
+        lines.append("### **STOP - Variant Wins**\n")
+    elif result.decision == "control_wins":
+        lines.append("### **STOP - Control Wins**\n")
+    else:
+        lines.append("### **KEEP RUNNING**\n")
+
+    lines.append("### Current Results\n")
+    lines.append("| Metric | Control | Variant |")
+    lines.append("|--------|---------|---------|")
+    lines.append(f"| Sample size | {result.control_n:,} | {result.variant_n:,} |")
+    lines.append(f"| Mean | {result.control_mean:.4g} | {result.variant_mean:.4g} |")
+    lines.append("")
+
+    lines.append("### Key Metrics\n")
+    lines.append(f"- **Difference:** {result.difference:+.4g}")
+    lines.append(f"- **Always-valid p-value:** {result.p_value:.4f}")
+    lines.append(
+        f"- **{1 - result.alpha:.0%} confidence sequence:** "
+        f"[{result.confidence_lower:.4g}, {result.confidence_upper:.4g}]"
+    )
+    lines.append("")
+    lines.append("These results stay valid however often the test is checked.")
+
+    return "\n".join(lines)
+
+
+__all__ = [
+    "MSPRTResult",
+    "ProportionMSPRT",
+    "MeanMSPRT",
+    "summarize",
+]
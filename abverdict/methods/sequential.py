@@ -13,11 +13,28 @@ References:
 - Johari et al. "Peeking at A/B Tests" (2017)
 """
 
+import json
+import logging
 import math
+import os
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Literal, Optional, Tuple
-from scipy.stats import norm
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple, Union
 import numpy as np
+from scipy.special import ndtr
+
+from abverdict.utils import frames
+from abverdict.utils.math import normal_cdf, normal_sf
+from abverdict.utils.rng import Seed, spawn_rngs
+from abverdict.utils.stats import critical_z
+from abverdict.utils.validation import validate_visitors_array
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -66,40 +83,183 @@ class SequentialBoundaries:
     alpha_spent: float  # Cumulative alpha spent
 
 
-def _obrien_fleming_boundary(alpha: float, information_fraction: float) -> float:
-    """
-    Calculate O'Brien-Fleming spending function boundary.
+SpendingMethod = Literal["obrien-fleming", "pocock"]
+
+# Grid points per look for the recursive integration (odd, for Simpson's rule)
+_GRID_POINTS = 401
+
+# Continuation regions are truncated at |Z| = _Z_LIMIT; a look that would
+# need a larger boundary spends (almost) no alpha and gets an infinite one
+_Z_LIMIT = 8.5
+
+# Information fractions are rounded to this many decimals before they key
+# the boundary cache
+_FRACTION_DECIMALS = 3
 
-    This is a conservative boundary that spends very little alpha early
-    and more towards the end, making early stopping harder but final
-    conclusions more powerful.
+
+def _alpha_spending(alpha: float, method: SpendingMethod, information_fraction: float) -> float:
     """
-    if information_fraction <= 0:
-        return float('inf')
-    if information_fraction >= 1:
-        return norm.ppf(1 - alpha / 2)
+    Lan-DeMets spending function: two-sided alpha spent by information t.
 
-    # O'Brien-Fleming spending function
+    "obrien-fleming": 4 - 4 Phi(z_{alpha/4} / sqrt(t)), the one-sided
+    O'Brien-Fleming-type function at alpha/2 applied to each tail; it spends
+    very little alpha early and more towards the end.
+    "pocock": alpha * log(1 + (e - 1) t), spending it nearly evenly.
+    """
     t = information_fraction
-    alpha_spent = 2 * (1 - norm.cdf(norm.ppf(1 - alpha / 2) / math.sqrt(t)))
+    if t <= 0:
+        return 0.0
+    if t >= 1:
+        return alpha
+    if method == "obrien-fleming":
+        return 4 * normal_sf(critical_z(alpha / 2) / math.sqrt(t))
+    if method == "pocock":
+        return alpha * math.log1p((math.e - 1) * t)
+    raise ValueError("method must be 'obrien-fleming' or 'pocock'")
+
+
+def _simpson_grid(limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid over [-limit, limit] with Simpson's rule weights."""
+    grid = np.linspace(-limit, limit, _GRID_POINTS)
+    weights = np.full(_GRID_POINTS, 2.0)
+    weights[1::2] = 4.0
+    weights[[0, -1]] = 1.0
+    return grid, weights * (grid[1] - grid[0]) / 3
+
+
+@dataclass(frozen=True)
+class _LookState:
+    """Boundaries so far and the sub-density of Z at the last look on paths that have not stopped."""
+    boundaries: Tuple[float, ...]
+    grid: np.ndarray
+    mass: np.ndarray  # density times quadrature weight at each grid point
+
+
+# Integration states cached per (alpha, method, schedule prefix), least
+# recently used first. Only the requested schedule and the prefix before its
+# last look are kept, so one long schedule adds two entries, not one per look
+_LOOK_STATE_CACHE_SIZE = 1024
+_look_states: Dict[Tuple[float, str, Tuple[float, ...]], _LookState] = {}
+_look_states_lock = threading.Lock()
+
+
+def _next_look(
+    state: Optional[_LookState], alpha: float, method: SpendingMethod, previous: float, t: float
+) -> _LookState:
+    """Extend ``state`` (the looks up to ``previous``, or None) by a look at ``t``."""
+    from scipy.optimize import brentq
+
+    spent = _alpha_spending(alpha, method, t) - _alpha_spending(alpha, method, previous)
+
+    if state is None:
+        boundary = critical_z(spent) if spent > 0 else math.inf
+        grid, weights = _simpson_grid(min(boundary, _Z_LIMIT))
+        density = np.exp(-0.5 * grid ** 2) / math.sqrt(2 * math.pi)
+        return _LookState((boundary,), grid, density * weights)
+
+    step = math.sqrt(t - previous)
+    shift = state.grid * math.sqrt(previous)
+    root_t = math.sqrt(t)
+
+    def crossing(c: float) -> float:
+        return float(np.dot(state.mass, ndtr((-c * root_t - shift) / step) + ndtr((shift - c * root_t) / step)))
 
-    return norm.ppf(1 - alpha_spent / 2)
+    if spent <= 0 or crossing(_Z_LIMIT) >= spent:
+        boundary = math.inf
+    else:
+        boundary = brentq(lambda c: crossing(c) - spent, 0.0, _Z_LIMIT, xtol=1e-10)
+
+    grid, weights = _simpson_grid(min(boundary, _Z_LIMIT))
+    # f_k(z) = sum_j mass_j * phi((z sqrt(t_k) - u_j sqrt(t_{k-1})) / step) * sqrt(t_k) / step
+    kernel = np.exp(-0.5 * ((grid[:, None] * root_t - shift[None, :]) / step) ** 2)
+    density = kernel @ state.mass * root_t / (step * math.sqrt(2 * math.pi))
+    return _LookState(state.boundaries + (boundary,), grid, density * weights)
+
+
+def _look_state(alpha: float, method: SpendingMethod, schedule: Tuple[float, ...]) -> _LookState:
+    """
+    Exact boundaries for a look schedule by recursive numerical integration.
+
+    Armitage-McPherson-Rowe: under H0 the score process is Brownian motion in
+    information time, so Z_k sqrt(t_k) = Z_{k-1} sqrt(t_{k-1}) + N(0, t_k - t_{k-1}).
+    Each boundary c_k solves
 
+        P(|Z_j| < c_j for j < k, |Z_k| >= c_k) = spend(t_k) - spend(t_{k-1})
 
-def _pocock_boundary(alpha: float, information_fraction: float, num_looks: int = 5) -> float:
+    with the probability integrated over the previous look's continuation
+    density. The looks are walked iteratively from the longest cached
+    prefix, so schedules sharing their early looks share the work and the
+    number of looks is not bounded by the recursion limit.
     """
-    Calculate Pocock spending function boundary.
+    with _look_states_lock:
+        for done in range(len(schedule), 0, -1):
+            state = _look_states.pop((alpha, method, schedule[:done]), None)
+            if state is not None:
+                _look_states[alpha, method, schedule[:done]] = state
+                break
+        else:
+            done, state = 0, None
+    if done == len(schedule):
+        return state
+
+    for k in range(done, len(schedule)):
+        if k == len(schedule) - 1 and k > done:
+            _cache_look_state(alpha, method, schedule[:k], state)
+        state = _next_look(state, alpha, method, schedule[k - 1] if k else 0.0, schedule[k])
+    _cache_look_state(alpha, method, schedule, state)
+    return state
+
+
+def _cache_look_state(alpha: float, method: SpendingMethod, schedule: Tuple[float, ...], state: _LookState) -> None:
+    with _look_states_lock:
+        _look_states[alpha, method, schedule] = state
+        while len(_look_states) > _LOOK_STATE_CACHE_SIZE:
+            del _look_states[next(iter(_look_states))]
+
 
-    This uses a constant boundary across all looks, making early stopping
-    easier but requiring adjustment for multiple comparisons.
+def boundary_table(
+    look_fractions: Sequence[float],
+    alpha: float = 0.05,
+    method: SpendingMethod = "obrien-fleming",
+) -> Tuple[SequentialBoundaries, ...]:
     """
-    if information_fraction <= 0:
-        return float('inf')
+    Exact Lan-DeMets group-sequential boundaries for a schedule of looks.
+
+    Boundaries come from recursive numerical integration (see
+    ``_look_state``) and are cached per (alpha, method, schedule), so
+    repeated calls are table lookups. When a ``BoundaryStore`` is configured
+    (see ``set_boundary_store``), tables are also read from and written to
+    it, so other processes reuse them.
 
-    # Pocock uses constant boundaries, adjusted for number of looks
-    # Approximate adjustment
-    adjusted_alpha = alpha / (1 + 0.5 * (num_looks - 1))
-    return norm.ppf(1 - adjusted_alpha / 2)
+    Args:
+        look_fractions: Information fraction of each look, increasing, in (0, 1]
+        alpha: Two-sided significance level (default 0.05)
+        method: Spending function, "obrien-fleming" or "pocock"
+
+    Returns:
+        One SequentialBoundaries per look; alpha_spent is cumulative
+
+    Example:
+        >>> [round(b.upper, 3) for b in sequential.boundary_table([0.2, 0.4, 0.6, 0.8, 1.0])]
+        [4.877, 3.357, 2.68, 2.29, 2.031]
+    """
+    schedule = tuple(round(float(t), 6) for t in look_fractions)
+    if not schedule:
+        raise ValueError("look_fractions cannot be empty")
+    if schedule[0] <= 0 or schedule[-1] > 1 or any(b <= a for a, b in zip(schedule, schedule[1:])):
+        raise ValueError("look_fractions must be increasing and within (0, 1]")
+    if not 0 < alpha < 1:
+        raise ValueError("alpha must be between 0 and 1")
+    _alpha_spending(alpha, method, 0.5)  # validates method
+
+    return tuple(
+        SequentialBoundaries(
+            upper=c,
+            lower=-c,  # Symmetric boundaries
+            alpha_spent=_alpha_spending(alpha, method, t),
+        )
+        for c, t in zip(_boundary_uppers(float(alpha), method, schedule), schedule)
+    )
 
 
 def _calculate_z_statistic(p1: float, n1: int, p2: float, n2: int) -> float:
@@ -117,6 +277,13 @@ def _calculate_z_statistic(p1: float, n1: int, p2: float, n2: int) -> float:
     return (p2 - p1) / se
 
 
+def _look_schedule(information_fraction: float, num_planned_looks: int) -> Tuple[float, ...]:
+    """Planned equally spaced looks before the current one, then the current one."""
+    t = min(round(information_fraction, _FRACTION_DECIMALS), 1.0)
+    looks = [k / num_planned_looks for k in range(1, num_planned_looks)]
+    return tuple(look for look in looks if look < t - 0.5 * 10 ** -_FRACTION_DECIMALS) + (t,)
+
+
 def get_boundaries(
     information_fraction: float,
     alpha: float = 0.05,
@@ -126,6 +293,10 @@ def get_boundaries(
     """
     Get stopping boundaries for the current information fraction.
 
+    The boundary is exact for a look at ``information_fraction`` (rounded
+    to 0.001) that follows the equally spaced planned looks before it, and
+    comes from the cached ``boundary_table``.
+
     Args:
         information_fraction: Proportion of planned sample collected (0-1)
         alpha: Significance level (default 0.05)
@@ -135,19 +306,264 @@ def get_boundaries(
     Returns:
         SequentialBoundaries with upper and lower boundaries
     """
-    if method == "obrien-fleming":
-        boundary = _obrien_fleming_boundary(alpha, information_fraction)
-        # O'Brien-Fleming alpha spending
-        alpha_spent = 2 * (1 - norm.cdf(boundary)) if boundary < float('inf') else 0
-    else:  # pocock
-        boundary = _pocock_boundary(alpha, information_fraction, num_planned_looks)
-        alpha_spent = alpha * information_fraction
-
-    return SequentialBoundaries(
-        upper=boundary,
-        lower=-boundary,  # Symmetric boundaries
-        alpha_spent=min(alpha_spent, alpha),
-    )
+    if num_planned_looks < 1:
+        raise ValueError("num_planned_looks must be at least 1")
+    if round(information_fraction, _FRACTION_DECIMALS) <= 0:
+        _alpha_spending(alpha, method, 0.5)  # validates method
+        return SequentialBoundaries(upper=math.inf, lower=-math.inf, alpha_spent=0.0)
+    return boundary_table(_look_schedule(information_fraction, num_planned_looks), alpha, method)[-1]
+
+
+# Environment variable naming the SQLite file used as the default BoundaryStore
+BOUNDARY_STORE_ENV = "ABVERDICT_BOUNDARY_STORE"
+
+# Seconds a process waits for another one's write lock
+_STORE_TIMEOUT = 60.0
+
+# Bump when the boundary computation changes in a way _GRID_POINTS and
+# _Z_LIMIT do not capture; stores written under another version are rebuilt
+_STORE_FORMAT = 1
+
+
+def _store_version() -> int:
+    """Version stamped into a store's ``PRAGMA user_version``."""
+    return zlib.crc32(f"{_STORE_FORMAT}:{_GRID_POINTS}:{_Z_LIMIT}".encode()) & 0x7FFFFFFF
+
+
+class BoundaryStore:
+    """
+    SQLite file of computed boundary tables, shared between processes.
+
+    Rows are keyed by (alpha, method, schedule) and never change once written,
+    so any number of workers can point at the same file: the first one to
+    need a design computes it and the rest read it back. The database runs
+    in WAL mode, so readers never wait for a writer. The file is stamped
+    with the boundary algorithm's version; a file written by another
+    version is emptied on open rather than served.
+
+    Args:
+        path: Database file; created with its table if missing
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        self.path = os.fspath(path)
+        conn = sqlite3.connect(self.path, timeout=_STORE_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")  # Persistent; cannot run inside a transaction
+        finally:
+            conn.close()
+        version = _store_version()
+        with self._connection(immediate=True) as conn:
+            (found,) = conn.execute("PRAGMA user_version").fetchone()
+            if found != version:
+                if found:
+                    logger.warning("Boundary store %s was written by another version; rebuilding it", self.path)
+                conn.execute("DROP TABLE IF EXISTS boundaries")
+                conn.execute("DROP TABLE IF EXISTS warming")
+                conn.execute(f"PRAGMA user_version = {version}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS boundaries ("
+                "alpha REAL NOT NULL, method TEXT NOT NULL, schedule TEXT NOT NULL, upper TEXT NOT NULL, "
+                "PRIMARY KEY (alpha, method, schedule)) WITHOUT ROWID"
+            )
+            # Designs a warm_boundary_store call has claimed
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS warming ("
+                "alpha REAL NOT NULL, method TEXT NOT NULL, looks INTEGER NOT NULL, "
+                "PRIMARY KEY (alpha, method, looks)) WITHOUT ROWID"
+            )
+
+    @contextmanager
+    def _connection(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections are safe across threads and forked workers
+        conn = sqlite3.connect(self.path, timeout=_STORE_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(schedule: Tuple[float, ...]) -> str:
+        return ",".join(f"{t:.6f}" for t in schedule)
+
+    def get(self, alpha: float, method: str, schedule: Tuple[float, ...]) -> Optional[Tuple[float, ...]]:
+        """Stored upper boundaries for a design, or None."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT upper FROM boundaries WHERE alpha = ? AND method = ? AND schedule = ?",
+                (alpha, method, self._key(schedule)),
+            ).fetchone()
+        return None if row is None else tuple(json.loads(row[0]))
+
+    def put(self, alpha: float, method: str, schedule: Tuple[float, ...], upper: Sequence[float]) -> None:
+        """Store the upper boundaries for a design (a no-op if already present)."""
+        with self._connection() as conn:
+            self._insert(conn, [(alpha, method, schedule, upper)])
+
+    def _insert(self, conn: sqlite3.Connection, rows: Iterable[Tuple[float, str, Tuple[float, ...], Sequence[float]]]) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO boundaries VALUES (?, ?, ?, ?)",
+            [(alpha, method, self._key(schedule), json.dumps([float(c) for c in upper]))
+             for alpha, method, schedule, upper in rows],
+        )
+
+    def _claim(self, alpha: float, method: str, looks: int) -> bool:
+        """Claim a design for warming; False if another call already has."""
+        with self._connection(immediate=True) as conn:
+            return conn.execute(
+                "INSERT OR IGNORE INTO warming VALUES (?, ?, ?)", (alpha, method, looks),
+            ).rowcount == 1
+
+    def _release(self, alpha: float, method: str, looks: int) -> None:
+        with self._connection(immediate=True) as conn:
+            conn.execute("DELETE FROM warming WHERE alpha = ? AND method = ? AND looks = ?", (alpha, method, looks))
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM boundaries").fetchone()[0]
+
+
+_UNSET = object()
+_store = _UNSET
+
+
+def set_boundary_store(path: Optional[Union[str, "os.PathLike[str]"]]) -> Optional[BoundaryStore]:
+    """
+    Use a SQLite file as the persistent boundary store for this process.
+
+    By default the store is the file named by the ``ABVERDICT_BOUNDARY_STORE``
+    environment variable, or none when it is unset.
+
+    Args:
+        path: Database file, or None to keep tables in memory only
+
+    Returns:
+        The new BoundaryStore, or None
+    """
+    global _store
+    _store = None if path is None else BoundaryStore(path)
+    _boundary_uppers.cache_clear()
+    return _store
+
+
+def get_boundary_store() -> Optional[BoundaryStore]:
+    """
+    The boundary store in use, opening the environment default on first call.
+
+    A default file that cannot be opened (bad path, read-only volume, not a
+    SQLite database) is logged once and boundaries are kept in memory.
+    """
+    if _store is _UNSET:
+        path = os.environ.get(BOUNDARY_STORE_ENV) or None
+        try:
+            set_boundary_store(path)
+        except sqlite3.Error:
+            logger.warning("Cannot open boundary store %s; keeping boundaries in memory", path, exc_info=True)
+            set_boundary_store(None)
+    return _store
+
+
+@lru_cache(maxsize=4096)
+def _boundary_uppers(alpha: float, method: SpendingMethod, schedule: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Upper boundaries for a design: memory, then the store, then integration."""
+    store = get_boundary_store()
+    if store is not None:
+        try:
+            upper = store.get(alpha, method, schedule)
+        except sqlite3.Error:
+            logger.warning("Boundary store %s is unreadable; computing the boundaries", store.path, exc_info=True)
+            store = None
+        else:
+            if upper is not None:
+                return upper
+    upper = tuple(float(c) for c in _look_state(alpha, method, schedule).boundaries)
+    if store is not None:
+        try:
+            store.put(alpha, method, schedule, upper)
+        except sqlite3.Error:
+            logger.warning("Could not write boundaries to %s", store.path, exc_info=True)
+    return upper
+
+
+def warm_boundary_store(
+    alphas: Sequence[float] = (0.05,),
+    methods: Sequence[SpendingMethod] = ("obrien-fleming", "pocock"),
+    num_planned_looks: Sequence[int] = (5,),
+    store: Optional[BoundaryStore] = None,
+) -> int:
+    """
+    Precompute the boundaries ``get_boundaries`` can ask for.
+
+    Fills the store with every look schedule at information fractions
+    0.001, 0.002, ..., 1.0 for each design. Run it at service startup.
+    Each design is claimed in the store before it is computed, so when
+    several workers warm the same file at once each design is computed by
+    exactly one of them. The integration runs outside any transaction and
+    each design's rows are committed as one short batch, so readers and
+    ``get_boundaries`` never wait on it. A design whose claim was taken by
+    a worker that died is computed lazily by ``get_boundaries`` instead.
+
+    Args:
+        alphas: Significance levels to warm
+        methods: Spending functions to warm
+        num_planned_looks: Planned look counts to warm
+        store: Store to fill (default: ``get_boundary_store()``)
+
+    Returns:
+        Number of tables this call computed (0 when the store was already
+        warm or other workers claimed every design)
+
+    Example:
+        >>> sequential.set_boundary_store("/var/cache/abverdict/boundaries.db")
+        >>> sequential.warm_boundary_store()
+        2000
+    """
+    store = store if store is not None else get_boundary_store()
+    if store is None:
+        raise ValueError(f"No boundary store configured; call set_boundary_store() or set {BOUNDARY_STORE_ENV}")
+
+    for alpha in alphas:
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+    for method in methods:
+        _alpha_spending(0.05, method, 0.5)  # validates method
+    if any(looks < 1 for looks in num_planned_looks):
+        raise ValueError("num_planned_looks must be at least 1")
+
+    steps = 10 ** _FRACTION_DECIMALS
+    computed = 0
+    for alpha in alphas:
+        for method in methods:
+            for looks in num_planned_looks:
+                if not store._claim(float(alpha), method, looks):
+                    continue
+                with store._connection() as conn:
+                    present = {key for (key,) in conn.execute(
+                        "SELECT schedule FROM boundaries WHERE alpha = ? AND method = ?", (float(alpha), method),
+                    )}
+                rows: List[Tuple[float, str, Tuple[float, ...], Tuple[float, ...]]] = []
+                try:
+                    for step in range(1, steps + 1):
+                        schedule = tuple(round(t, 6) for t in _look_schedule(step / steps, looks))
+                        key = store._key(schedule)
+                        if key not in present:
+                            present.add(key)
+                            upper = _look_state(float(alpha), method, schedule).boundaries
+                            rows.append((float(alpha), method, schedule, upper))
+                except BaseException:
+                    store._release(float(alpha), method, looks)
+                    raise
+                if rows:
+                    with store._connection(immediate=True) as conn:
+                        store._insert(conn, rows)
+                computed += len(rows)
+    return computed
 
 
 def analyze(
@@ -159,6 +575,8 @@ def analyze(
     alpha: float = 0.05,
     method: Literal["obrien-fleming", "pocock"] = "obrien-fleming",
     min_visitors_per_variant: int = 100,
+    explain: bool = True,
+    num_planned_looks: int = 5,
 ) -> SequentialTestResult:
     """
     Analyze an A/B test using sequential methods.
@@ -176,6 +594,9 @@ def analyze(
         alpha: Significance level (default 0.05 for 95% confidence)
         method: Boundary method - "obrien-fleming" (conservative) or "pocock" (aggressive)
         min_visitors_per_variant: Minimum visitors before allowing early stop
+        explain: Generate the recommendation text (default True)
+        num_planned_looks: Number of equally spaced interim analyses the
+            boundaries account for (default 5)
 
     Returns:
         SequentialTestResult with decision and statistics
@@ -216,11 +637,11 @@ def analyze(
     information_fraction = min(current_visitors / expected_visitors_per_variant, 1.0)
 
     # Get boundaries
-    boundaries = get_boundaries(information_fraction, alpha, method)
+    boundaries = get_boundaries(information_fraction, alpha, method, num_planned_looks)
 
     # Calculate test statistic
     z_stat = _calculate_z_statistic(p1, control_visitors, p2, variant_visitors)
-    p_value = 2 * (1 - norm.cdf(abs(z_stat)))
+    p_value = 2 * normal_sf(abs(z_stat))
 
     # Calculate confidence that each variant is better
     # Using approximate posterior probability
@@ -230,7 +651,7 @@ def analyze(
 
     if se_diff > 0:
         # Probability that variant is better than control
-        confidence_variant_better = norm.cdf(lift_absolute / se_diff)
+        confidence_variant_better = normal_cdf(lift_absolute / se_diff)
         confidence_control_better = 1 - confidence_variant_better
     else:
         confidence_variant_better = 0.5
@@ -254,13 +675,9 @@ def analyze(
             can_stop = True
             decision = "control_wins"
         elif information_fraction >= 1.0:
+            # The final boundary already spends the remaining alpha
             can_stop = True
-            if abs(z_stat) < norm.ppf(1 - alpha / 2):
-                decision = "no_difference"
-            elif z_stat > 0:
-                decision = "variant_wins"
-            else:
-                decision = "control_wins"
+            decision = "no_difference"
 
     # Calculate remaining visitors needed
     remaining = None
@@ -268,17 +685,19 @@ def analyze(
         remaining = int((expected_visitors_per_variant - current_visitors) * 2)
 
     # Generate recommendation
-    recommendation = _generate_recommendation(
-        decision=decision,
-        can_stop=can_stop,
-        lift_percent=lift_percent,
-        confidence_variant_better=confidence_variant_better,
-        information_fraction=information_fraction,
-        control_rate=p1,
-        variant_rate=p2,
-        remaining_visitors=remaining,
-        alpha=alpha,
-    )
+    recommendation = ""
+    if explain:
+        recommendation = _generate_recommendation(
+            decision=decision,
+            can_stop=can_stop,
+            lift_percent=lift_percent,
+            confidence_variant_better=confidence_variant_better,
+            information_fraction=information_fraction,
+            control_rate=p1,
+            variant_rate=p2,
+            remaining_visitors=remaining,
+            alpha=alpha,
+        )
 
     return SequentialTestResult(
         control_visitors=control_visitors,
@@ -305,6 +724,190 @@ def analyze(
     )
 
 
+class SequentialTrajectory(frames.ResultsFrame):
+    """Columnar results of ``analyze_trajectory``, one row per look."""
+
+    _columns = (
+        "control_visitors",
+        "control_conversions",
+        "variant_visitors",
+        "variant_conversions",
+        "control_rate",
+        "variant_rate",
+        "lift_percent",
+        "lift_absolute",
+        "z_statistic",
+        "p_value",
+        "upper_boundary",
+        "lower_boundary",
+        "adjusted_alpha",
+        "information_fraction",
+        "confidence_variant_better",
+        "confidence_control_better",
+        "can_stop",
+        "decision",
+        "expected_visitors_per_variant",
+        "alpha",
+    )
+
+    @property
+    def first_crossing(self) -> Optional[int]:
+        """Index of the first look at which the test could stop, or None."""
+        stops = np.flatnonzero(self.can_stop)
+        return int(stops[0]) if stops.size else None
+
+    def result(self, index: int) -> SequentialTestResult:
+        """Materialize one look as the ``SequentialTestResult`` ``analyze`` returns."""
+        row = self[index].to_dict()
+        expected = row.pop("expected_visitors_per_variant")
+        alpha = row.pop("alpha")
+        current_visitors = (row["control_visitors"] + row["variant_visitors"]) / 2
+        remaining = None
+        if not row["can_stop"] and row["information_fraction"] < 1.0:
+            remaining = int((expected - current_visitors) * 2)
+        return SequentialTestResult(
+            **row,
+            recommendation=_generate_recommendation(
+                decision=row["decision"],
+                can_stop=row["can_stop"],
+                lift_percent=row["lift_percent"],
+                confidence_variant_better=row["confidence_variant_better"] / 100,
+                information_fraction=row["information_fraction"],
+                control_rate=row["control_rate"],
+                variant_rate=row["variant_rate"],
+                remaining_visitors=remaining,
+                alpha=alpha,
+            ),
+            current_statistic=row["z_statistic"],
+            estimated_remaining_visitors=remaining,
+        )
+
+
+def analyze_trajectory(
+    control_visitors,
+    control_conversions,
+    variant_visitors,
+    variant_conversions,
+    expected_visitors_per_variant: int,
+    alpha: float = 0.05,
+    method: Literal["obrien-fleming", "pocock"] = "obrien-fleming",
+    min_visitors_per_variant: int = 100,
+    num_planned_looks: int = 5,
+) -> SequentialTrajectory:
+    """
+    Analyze every interim look of a test in one vectorized pass.
+
+    Takes the cumulative counts at each look (e.g. one row per day) and
+    returns, for each look, what ``analyze`` would report there: z-statistic,
+    information fraction, boundaries and decision. Boundaries are looked up
+    once per distinct information fraction and no recommendation text is
+    built; ``SequentialTrajectory.result(i)`` materializes a full result for
+    one look when needed.
+
+    Args:
+        control_visitors: Cumulative control visitors at each look
+        control_conversions: Cumulative control conversions at each look
+        variant_visitors: Cumulative variant visitors at each look
+        variant_conversions: Cumulative variant conversions at each look
+        expected_visitors_per_variant: Planned sample size per variant
+        alpha: Significance level (default 0.05 for 95% confidence)
+        method: Boundary method - "obrien-fleming" (conservative) or "pocock" (aggressive)
+        min_visitors_per_variant: Minimum visitors before allowing early stop
+        num_planned_looks: Number of equally spaced interim analyses the
+            boundaries account for (default 5)
+
+    Returns:
+        SequentialTrajectory with one row per look; ``first_crossing`` is
+        the first look at which the test could stop
+
+    Example:
+        >>> trajectory = sequential.analyze_trajectory(
+        ...     control_visitors=[1000, 2000, 3000, 4000, 5000],
+        ...     control_conversions=[50, 100, 150, 200, 250],
+        ...     variant_visitors=[1000, 2000, 3000, 4000, 5000],
+        ...     variant_conversions=[60, 125, 195, 265, 340],
+        ...     expected_visitors_per_variant=10000,
+        ... )
+        >>> trajectory.first_crossing
+        4
+        >>> trajectory.z_statistic.round(2)
+        array([0.98, 1.72, 2.5 , 3.11, 3.82])
+    """
+    if expected_visitors_per_variant <= 0:
+        raise ValueError("Expected visitors must be positive")
+    counts = [np.atleast_1d(np.asarray(v)) for v in (
+        control_visitors, control_conversions, variant_visitors, variant_conversions,
+    )]
+    if any(c.ndim != 1 for c in counts) or len({c.size for c in counts}) > 1:
+        raise ValueError("Counts must be one-dimensional arrays with one entry per look")
+    validate_visitors_array(
+        counts[0], counts[1], "control_visitors", "control_conversions"
+    ).merge(validate_visitors_array(
+        counts[2], counts[3], "variant_visitors", "variant_conversions"
+    )).raise_if_invalid()
+    if any(np.any(np.diff(c) < 0) for c in counts):
+        raise ValueError("Counts must be cumulative (non-decreasing across looks)")
+    n1, c1, n2, c2 = (c.astype(float) for c in counts)
+
+    p1 = c1 / n1
+    p2 = c2 / n2
+    lift_absolute = p2 - p1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lift_percent = np.where(p1 > 0, lift_absolute / p1 * 100, 0.0)
+
+        # Pooled z-statistic, as in _calculate_z_statistic
+        pooled = (c1 + c2) / (n1 + n2)
+        se = np.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+        z_stat = np.where(se > 0, lift_absolute / se, 0.0)
+
+        se_diff = np.sqrt(p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2)
+        confidence_variant_better = np.where(se_diff > 0, ndtr(lift_absolute / se_diff), 0.5)
+    p_value = 2 * ndtr(-np.abs(z_stat))
+
+    information_fraction = np.minimum((n1 + n2) / 2 / expected_visitors_per_variant, 1.0)
+
+    # One boundary lookup per distinct (rounded) information fraction
+    fractions, inverse = np.unique(information_fraction.round(_FRACTION_DECIMALS), return_inverse=True)
+    unique_boundaries = [get_boundaries(t, alpha, method, num_planned_looks) for t in fractions]
+    upper = np.array([b.upper for b in unique_boundaries])[inverse]
+    lower = np.array([b.lower for b in unique_boundaries])[inverse]
+    adjusted_alpha = np.array([b.alpha_spent for b in unique_boundaries])[inverse]
+
+    # Same decision rules as analyze
+    has_min_sample = (n1 >= min_visitors_per_variant) & (n2 >= min_visitors_per_variant)
+    variant_wins = has_min_sample & (z_stat >= upper)
+    control_wins = has_min_sample & ~variant_wins & (z_stat <= lower)
+    finished = has_min_sample & (information_fraction >= 1.0)
+    decision = np.select(
+        [variant_wins, control_wins, finished],
+        ["variant_wins", "control_wins", "no_difference"],
+        default="keep_running",
+    )
+
+    return SequentialTrajectory(
+        control_visitors=counts[0],
+        control_conversions=counts[1],
+        variant_visitors=counts[2],
+        variant_conversions=counts[3],
+        control_rate=p1,
+        variant_rate=p2,
+        lift_percent=lift_percent,
+        lift_absolute=lift_absolute,
+        z_statistic=z_stat,
+        p_value=p_value,
+        upper_boundary=upper,
+        lower_boundary=lower,
+        adjusted_alpha=adjusted_alpha,
+        information_fraction=information_fraction,
+        confidence_variant_better=confidence_variant_better * 100,
+        confidence_control_better=(1 - confidence_variant_better) * 100,
+        can_stop=variant_wins | control_wins | finished,
+        decision=decision,
+        expected_visitors_per_variant=np.full(n1.size, expected_visitors_per_variant),
+        alpha=np.full(n1.size, alpha),
+    )
+
+
 def _generate_recommendation(
     decision: str,
     can_stop: bool,
@@ -383,7 +986,8 @@ def sample_size(
 
     Sequential tests typically require 20-30% more samples than fixed-horizon
     tests to maintain the same power, but can often stop earlier when effects
-    are large.
+    are large. The inflation factor is a rule of thumb; use ``simulate`` to
+    check the power and expected sample size of the resulting design.
 
     Args:
         baseline_rate: Expected conversion rate for control (e.g., 0.05 for 5%)
@@ -414,8 +1018,8 @@ def sample_size(
     p2 = baseline_rate * (1 + minimum_detectable_effect)
 
     # Standard sample size formula
-    z_alpha = norm.ppf(1 - alpha / 2)
-    z_beta = norm.ppf(power)
+    z_alpha = critical_z(alpha)
+    z_beta = critical_z(1 - power, two_sided=False)
 
     p_pooled = (p1 + p2) / 2
 
@@ -446,6 +1050,164 @@ def sample_size(
     }
 
 
+@dataclass
+class OperatingCharacteristics:
+    """Simulated behaviour of a sequential design."""
+
+    num_trials: int
+    control_rate: float
+    variant_rate: float
+    look_visitors: Tuple[int, ...]  # Visitors per variant at each look
+    upper_boundaries: Tuple[float, ...]
+
+    # Decisions
+    rejection_rate: float  # Type I error when the rates are equal, power otherwise
+    rejection_rate_error: float  # Monte Carlo standard error of rejection_rate
+    variant_win_rate: float
+    control_win_rate: float
+
+    # Sample size
+    expected_visitors_per_variant: float
+    stopping_probabilities: Tuple[float, ...]  # P(test ends at each look)
+
+
+# Trials simulated per task; each task gets its own RNG stream, so results
+# depend on the seed but not on how many workers run the tasks
+_SIMULATION_CHUNK = 50_000
+
+
+def _simulate_chunk(
+    rng: np.random.Generator,
+    trials: int,
+    look_visitors: np.ndarray,
+    rates: Tuple[float, float],
+    boundaries: np.ndarray,
+    min_visitors_per_variant: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Count trials first crossing the upper and lower boundary at each look."""
+    increments = np.diff(look_visitors, prepend=0)
+    control = np.cumsum(rng.binomial(increments, rates[0], size=(trials, len(increments))), axis=1)
+    variant = np.cumsum(rng.binomial(increments, rates[1], size=(trials, len(increments))), axis=1)
+
+    # Pooled two-proportion z, as in _calculate_z_statistic, with equal arms
+    pooled = (control + variant) / (2 * look_visitors)
+    se = np.sqrt(pooled * (1 - pooled) * (2 / look_visitors))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(se > 0, (variant - control) / look_visitors / se, 0.0)
+
+    active = look_visitors >= min_visitors_per_variant
+    upper = (z >= boundaries) & active
+    lower = (z <= -boundaries) & active
+    crossed = upper | lower
+    stopped = crossed.any(axis=1)
+    first = np.argmax(crossed, axis=1)[stopped]
+    wins = upper[stopped, first]
+
+    looks = len(look_visitors)
+    return (
+        np.bincount(first[wins], minlength=looks),
+        np.bincount(first[~wins], minlength=looks),
+    )
+
+
+def simulate(
+    baseline_rate: float,
+    visitors_per_variant: int,
+    relative_lift: float = 0.0,
+    alpha: float = 0.05,
+    method: Literal["obrien-fleming", "pocock"] = "obrien-fleming",
+    num_planned_looks: int = 5,
+    min_visitors_per_variant: int = 100,
+    num_trials: int = 100_000,
+    seed: Seed = None,
+    workers: Optional[int] = 1,
+) -> OperatingCharacteristics:
+    """
+    Simulate a sequential design to check its error rates and sample size.
+
+    Each trial draws cumulative binomial conversions for both arms at the
+    ``num_planned_looks`` equally spaced looks and stops at the first look
+    where ``analyze`` would: the pooled z-statistic crosses the boundary from
+    ``get_boundaries`` once both arms have ``min_visitors_per_variant``.
+    Trials run in chunks of 50,000 with independent streams from
+    ``spawn_rngs``, optionally across a process pool.
+
+    Args:
+        baseline_rate: Control conversion rate (e.g., 0.05)
+        visitors_per_variant: Planned visitors per variant at the final look
+        relative_lift: True relative lift of the variant (default 0, which
+            makes rejection_rate the type I error)
+        alpha: Significance level (default 0.05)
+        method: Boundary method ("obrien-fleming" or "pocock")
+        num_planned_looks: Number of equally spaced looks
+        min_visitors_per_variant: Minimum visitors before allowing early stop
+        num_trials: Number of simulated trials
+        seed: Seed for reproducible results (same seed, same result for any
+            number of workers)
+        workers: Processes to use; 1 runs in this process, None uses
+            every CPU
+
+    Returns:
+        OperatingCharacteristics with rejection rates and stopping times
+
+    Example:
+        >>> design = sequential.sample_size(0.05, 0.10)
+        >>> oc = sequential.simulate(0.05, design["visitors_per_variant"], relative_lift=0.10,
+        ...                          num_trials=200_000, seed=1, workers=None)
+        >>> oc.rejection_rate  # power
+        0.80...
+    """
+    variant_rate = baseline_rate * (1 + relative_lift)
+    if not 0 < baseline_rate < 1 or not 0 < variant_rate < 1:
+        raise ValueError("baseline_rate and the lifted variant rate must be between 0 and 1")
+    if visitors_per_variant < num_planned_looks:
+        raise ValueError("visitors_per_variant must be at least num_planned_looks")
+    if num_planned_looks < 1:
+        raise ValueError("num_planned_looks must be at least 1")
+    if num_trials < 1:
+        raise ValueError("num_trials must be positive")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be positive")
+
+    look_visitors = np.array([
+        round(visitors_per_variant * k / num_planned_looks) for k in range(1, num_planned_looks + 1)
+    ])
+    boundaries = np.array([
+        get_boundaries(n / visitors_per_variant, alpha, method, num_planned_looks).upper for n in look_visitors
+    ])
+
+    chunks = [min(_SIMULATION_CHUNK, num_trials - start) for start in range(0, num_trials, _SIMULATION_CHUNK)]
+    args = [
+        (rng, trials, look_visitors, (baseline_rate, variant_rate), boundaries, min_visitors_per_variant)
+        for rng, trials in zip(spawn_rngs(seed, len(chunks)), chunks)
+    ]
+    if workers == 1 or len(chunks) == 1:
+        counts = [_simulate_chunk(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(_simulate_chunk, *zip(*args)))
+
+    upper = sum(c[0] for c in counts)
+    lower = sum(c[1] for c in counts)
+    stopping = (upper + lower) / num_trials
+    stopping[-1] = 1 - stopping[:-1].sum()  # Trials that never cross end at the final look
+    rejection_rate = float((upper.sum() + lower.sum()) / num_trials)
+
+    return OperatingCharacteristics(
+        num_trials=num_trials,
+        control_rate=baseline_rate,
+        variant_rate=variant_rate,
+        look_visitors=tuple(int(n) for n in look_visitors),
+        upper_boundaries=tuple(float(b) for b in boundaries),
+        rejection_rate=rejection_rate,
+        rejection_rate_error=math.sqrt(rejection_rate * (1 - rejection_rate) / num_trials),
+        variant_win_rate=float(upper.sum() / num_trials),
+        control_win_rate=float(lower.sum() / num_trials),
+        expected_visitors_per_variant=float(stopping @ look_visitors),
+        stopping_probabilities=tuple(float(p) for p in stopping),
+    )
+
+
 def summarize(result: SequentialTestResult, test_name: str = "Sequential A/B Test") -> str:
     """
     Generate a markdown summary of sequential test results.
@@ -504,7 +1266,16 @@ __all__ = [
     "SequentialTestResult",
     "SequentialBoundaries",
     "analyze",
+    "analyze_trajectory",
+    "SequentialTrajectory",
     "sample_size",
+    "simulate",
+    "OperatingCharacteristics",
     "get_boundaries",
+    "boundary_table",
+    "BoundaryStore",
+    "set_boundary_store",
+    "get_boundary_store",
+    "warm_boundary_store",
     "summarize",
 ]
@@ -5,15 +5,20 @@ Tools to help plan A/B tests before you run them:
 - Minimum Detectable Effect (MDE) calculator
 - Test duration recommendations
 - Traffic allocation optimization
+- Sample-size grids for heatmaps
 """
 
-from abverdict.planning.mde import (
-    minimum_detectable_effect,
-    MDEResult,
-)
-from abverdict.planning.duration import (
-    recommend_duration,
-    DurationRecommendation,
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "minimum_detectable_effect": "abverdict.planning.mde",
+        "MDEResult": "abverdict.planning.mde",
+        "recommend_duration": "abverdict.planning.duration",
+        "DurationRecommendation": "abverdict.planning.duration",
+        "sample_size_grid": "abverdict.planning.grid",
+    },
 )
 
 __all__ = [
@@ -21,4 +26,5 @@ __all__ = [
     "MDEResult",
     "recommend_duration",
     "DurationRecommendation",
+    "sample_size_grid",
 ]
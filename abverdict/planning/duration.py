@@ -11,7 +11,9 @@ Helps determine how long to run an A/B test, considering:
 import math
 from dataclasses import dataclass
 from typing import Optional, List, Literal
-from scipy.stats import norm
+
+from abverdict.utils.math import normal_cdf
+from abverdict.utils.stats import z_alpha as get_z_alpha, z_beta as get_z_beta
 
 
 @dataclass
@@ -82,11 +84,8 @@ def recommend_duration(
         minimum_detectable_effect = minimum_detectable_effect / 100
 
     # Calculate required sample size
-    alpha = 1 - confidence / 100
-    beta = 1 - power / 100
-
-    z_alpha = norm.ppf(1 - alpha / 2)
-    z_beta = norm.ppf(1 - beta)
+    z_alpha = get_z_alpha(confidence)
+    z_beta = get_z_beta(power)
 
     p1 = baseline_rate
     p2 = baseline_rate * (1 + minimum_detectable_effect)
@@ -141,7 +140,7 @@ def recommend_duration(
         if se <= 0:
             return 1.0
         z_effect = abs(p2 - p1) / se
-        return norm.cdf(z_effect - z_alpha) + norm.cdf(-z_effect - z_alpha)
+        return normal_cdf(z_effect - z_alpha) + normal_cdf(-z_effect - z_alpha)
 
     confidence_at_minimum = power_at_n(visitors_per_variant_per_day * minimum_days) * 100
     confidence_at_recommended = power_at_n(visitors_per_variant_per_day * recommended_days) * 100
@@ -0,0 +1,118 @@
+"""
+Sample Size Grid Planner.
+
+Answers the question: "How many users do I need across every combination of
+baseline, lift, confidence and power I'm considering?"
+
+Inputs are NumPy-broadcastable, so a sample-size heatmap is a single
+vectorized evaluation instead of thousands of ``sample_size`` calls.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from abverdict.utils.stats import sample_size_grid as _sample_size_grid
+
+
+def sample_size_grid(
+    baseline,
+    lift_percent,
+    confidence=95,
+    power=80,
+    num_variants=2,
+    metric_type: Literal["conversion", "continuous", "timing"] = "conversion",
+    baseline_std=None,
+    dropout_rate=0.1,
+    event_probability=1.0,
+    allocation_ratio=1.0,
+) -> np.ndarray:
+    """
+    Calculate required sample size per variant over a grid of scenarios.
+
+    Every numeric argument may be a scalar or an array; all of them are
+    broadcast together and the result has the broadcast shape. Each cell
+    matches the corresponding ``sample_size`` call of the conversion,
+    magnitude or timing module. Cells where that call would raise (zero lift,
+    expected rate outside 0-100%, medians too similar) are NaN.
+
+    Args:
+        baseline: Current conversion rate (conversion, e.g. 0.05 or 5),
+            current mean (continuous) or control median time (timing)
+        lift_percent: Relative change to detect (e.g., 10 for 10%); for
+            timing this is the change in median time-to-event
+        confidence: Confidence level (default 95)
+        power: Statistical power (default 80)
+        num_variants: Number of variants including control; more than two
+            applies the same Bonferroni correction as ``sample_size``
+            (not used for timing)
+        metric_type: "conversion", "continuous" or "timing"
+        baseline_std: Standard deviation (required for continuous metrics)
+        dropout_rate: Expected dropout fraction (timing only)
+        event_probability: Fraction of retained subjects expected to have the
+            event during follow-up (timing only)
+        allocation_ratio: Treatment-to-control allocation (timing only)
+
+    Returns:
+        Float ndarray of users per variant (subjects per group for timing)
+
+    Example:
+        >>> grid = sample_size_grid(0.05, [5, 10, 20], power=[[80], [90]])
+        >>> grid.shape
+        (2, 3)
+    """
+    baseline, lift = np.broadcast_arrays(
+        np.asarray(baseline, dtype=float), np.asarray(lift_percent, dtype=float)
+    )
+
+    if metric_type == "conversion":
+        # Handle percentage input, as ConversionEffect.sample_size does
+        current = np.where(baseline > 1, baseline / 100, baseline)
+        expected = current * (1 + lift / 100)
+        valid = (current > 0) & (current < 1) & (expected >= 0) & (expected <= 1)
+        n = _sample_size_grid(
+            "two_proportions",
+            p1=np.where(valid, current, np.nan),
+            p2=np.where(valid, expected, np.nan),
+            confidence=confidence,
+            power=power,
+            num_groups=num_variants,
+        )
+
+    elif metric_type == "continuous":
+        if baseline_std is None:
+            raise ValueError("baseline_std is required for continuous metrics")
+        n = _sample_size_grid(
+            "two_means",
+            effect_size=np.abs(baseline * lift / 100),
+            std=baseline_std,
+            confidence=confidence,
+            power=power,
+            num_groups=num_variants,
+        )
+
+    elif metric_type == "timing":
+        dropout_rate = np.asarray(dropout_rate, dtype=float)
+        event_probability = np.asarray(event_probability, dtype=float)
+        if np.any((dropout_rate < 0) | (dropout_rate >= 1)):
+            raise ValueError("dropout_rate must be between 0 and 1")
+        if np.any((event_probability <= 0) | (event_probability > 1)):
+            raise ValueError("event_probability must be in (0, 1]")
+
+        treatment = baseline * (1 + lift / 100)
+        valid = (baseline > 0) & (treatment > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hr = np.where(valid, baseline / treatment, np.nan)
+        events = _sample_size_grid(
+            "survival",
+            hr=hr,
+            confidence=confidence,
+            power=power,
+            allocation_ratio=allocation_ratio,
+        )
+        n = np.ceil(events / ((1 - dropout_rate) * event_probability))
+
+    else:
+        raise ValueError("metric_type must be 'conversion', 'continuous' or 'timing'")
+
+    return n
@@ -12,7 +12,8 @@ This is crucial for test planning because it tells you:
 import math
 from dataclasses import dataclass
 from typing import Optional, Literal
-from scipy.stats import norm
+
+from abverdict.utils.stats import z_alpha as get_z_alpha, z_beta as get_z_beta
 
 
 @dataclass
@@ -97,11 +98,8 @@ def minimum_detectable_effect(
         baseline_rate = baseline_rate / 100
 
     # Calculate critical values
-    alpha = 1 - confidence / 100
-    beta = 1 - power / 100
-
-    z_alpha = float(norm.ppf(1 - alpha / 2))
-    z_beta = float(norm.ppf(1 - beta))
+    z_alpha = get_z_alpha(confidence)
+    z_beta = get_z_beta(power)
 
     n = sample_size_per_variant
 
@@ -8,10 +8,15 @@ Tools to analyze A/B test results across user segments:
 - Statistical corrections for multiple comparisons
 """
 
-from abverdict.segments.analysis import (
-    analyze_segments,
-    SegmentResult,
-    SegmentAnalysisReport,
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "analyze_segments": "abverdict.segments.analysis",
+        "SegmentResult": "abverdict.segments.analysis",
+        "SegmentAnalysisReport": "abverdict.segments.analysis",
+    },
 )
 
 __all__ = [
@@ -14,8 +14,8 @@ Important considerations:
 import math
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple, Literal
-from scipy import stats as scipy_stats
-from scipy.stats import norm, chi2_contingency
+
+from abverdict.utils.stats import critical_z
 
 
 @dataclass
@@ -82,6 +82,7 @@ def analyze_segments(
     confidence: int = 95,
     correction_method: Literal["bonferroni", "holm", "none"] = "bonferroni",
     min_sample_per_segment: int = 100,
+    explain: bool = True,
 ) -> SegmentAnalysisReport:
     """
     Analyze A/B test results across multiple segments.
@@ -97,6 +98,8 @@ def analyze_segments(
         confidence: Confidence level (default 95)
         correction_method: Method for multiple comparison correction
         min_sample_per_segment: Minimum sample per segment for valid analysis
+        explain: Build per-segment interpretations and the overall
+            recommendation (default True)
 
     Returns:
         SegmentAnalysisReport with detailed segment-level analysis
@@ -140,14 +143,14 @@ def analyze_segments(
 
     for seg_data in segments_data:
         result = _analyze_single_segment(
-            seg_data, alpha, adjusted_alpha, min_sample_per_segment
+            seg_data, alpha, adjusted_alpha, min_sample_per_segment, explain
         )
         segment_results.append(result)
         p_values.append(result.p_value)
 
     # Apply Holm-Bonferroni correction if specified
     if correction_method == "holm":
-        segment_results = _apply_holm_correction(segment_results, alpha)
+        segment_results = _apply_holm_correction(segment_results, alpha, explain)
 
     # Calculate overall results
     total_control_visitors = sum(s["control_visitors"] for s in segments_data)
@@ -173,6 +176,8 @@ def analyze_segments(
         [total_control_conversions, total_control_visitors - total_control_conversions],
         [total_variant_conversions, total_variant_visitors - total_variant_conversions],
     ]
+    from scipy.stats import chi2_contingency
+
     try:
         _, overall_p_value, _, _ = chi2_contingency(contingency)
         overall_is_significant = overall_p_value < alpha
@@ -197,16 +202,18 @@ def analyze_segments(
     simpsons_paradox = _check_simpsons_paradox(segment_results, overall_lift)
 
     # Generate recommendation
-    recommendation = _generate_recommendation(
-        segment_results=segment_results,
-        overall_lift=overall_lift,
-        overall_is_significant=overall_is_significant,
-        best_segment=best_segment_name,
-        worst_segment=worst_segment_name,
-        heterogeneity=heterogeneity,
-        simpsons_paradox=simpsons_paradox,
-        correction_method=correction_method,
-    )
+    recommendation = ""
+    if explain:
+        recommendation = _generate_recommendation(
+            segment_results=segment_results,
+            overall_lift=overall_lift,
+            overall_is_significant=overall_is_significant,
+            best_segment=best_segment_name,
+            worst_segment=worst_segment_name,
+            heterogeneity=heterogeneity,
+            simpsons_paradox=simpsons_paradox,
+            correction_method=correction_method,
+        )
 
     return SegmentAnalysisReport(
         overall_lift=overall_lift,
@@ -228,6 +235,7 @@ def _analyze_single_segment(
     alpha: float,
     adjusted_alpha: float,
     min_sample: int,
+    explain: bool = True,
 ) -> SegmentResult:
     """Analyze a single segment."""
     segment_name = seg_data["segment_name"]
@@ -253,6 +261,8 @@ def _analyze_single_segment(
         [v_conversions, v_visitors - v_conversions],
     ]
 
+    from scipy.stats import chi2_contingency
+
     try:
         _, p_value, _, _ = chi2_contingency(contingency)
     except ValueError:
@@ -263,7 +273,7 @@ def _analyze_single_segment(
     se_v = math.sqrt(v_rate * (1 - v_rate) / v_visitors) if v_visitors > 0 and 0 < v_rate < 1 else 0
     se_diff = math.sqrt(se_c**2 + se_v**2)
 
-    z_crit = norm.ppf(1 - alpha / 2)
+    z_crit = critical_z(alpha)
     diff = v_rate - c_rate
     diff_lower = diff - z_crit * se_diff
     diff_upper = diff + z_crit * se_diff
@@ -291,10 +301,12 @@ def _analyze_single_segment(
     sample_adequate = min_visitors >= min_sample
 
     # Generate interpretation
-    interpretation = _interpret_segment(
-        segment_name, segment_value, lift, is_significant,
-        is_significant_uncorrected, sample_adequate, p_value
-    )
+    interpretation = ""
+    if explain:
+        interpretation = _interpret_segment(
+            segment_name, segment_value, lift, is_significant,
+            is_significant_uncorrected, sample_adequate, p_value
+        )
 
     return SegmentResult(
         segment_name=segment_name,
@@ -320,6 +332,7 @@ def _analyze_single_segment(
 def _apply_holm_correction(
     results: List[SegmentResult],
     alpha: float,
+    explain: bool = True,
 ) -> List[SegmentResult]:
     """Apply Holm-Bonferroni correction to segment results."""
     n = len(results)
@@ -334,11 +347,13 @@ def _apply_holm_correction(
         is_significant = result.p_value < adjusted_alpha
         # Create new result with updated significance
         new_winner = result.winner if is_significant else "no_difference"
-        new_interpretation = _interpret_segment(
-            result.segment_name, result.segment_value, result.lift_percent,
-            is_significant, result.is_significant_uncorrected,
-            result.sample_size_adequate, result.p_value,
-        )
+        new_interpretation = ""
+        if explain:
+            new_interpretation = _interpret_segment(
+                result.segment_name, result.segment_value, result.lift_percent,
+                is_significant, result.is_significant_uncorrected,
+                result.sample_size_adequate, result.p_value,
+            )
         results[idx] = SegmentResult(
             segment_name=result.segment_name,
             segment_value=result.segment_value,
@@ -362,11 +377,13 @@ def _apply_holm_correction(
         if not is_significant:
             for remaining_idx in sorted_indices[rank:]:
                 r = results[remaining_idx]
-                rem_interpretation = _interpret_segment(
-                    r.segment_name, r.segment_value, r.lift_percent,
-                    False, r.is_significant_uncorrected,
-                    r.sample_size_adequate, r.p_value,
-                )
+                rem_interpretation = ""
+                if explain:
+                    rem_interpretation = _interpret_segment(
+                        r.segment_name, r.segment_value, r.lift_percent,
+                        False, r.is_significant_uncorrected,
+                        r.sample_size_adequate, r.p_value,
+                    )
                 results[remaining_idx] = SegmentResult(
                     segment_name=r.segment_name,
                     segment_value=r.segment_value,
@@ -1,39 +1,78 @@
-from abverdict.utils.validation import (
-    validate_rate,
-    validate_positive,
-    validate_alpha,
-    validate_power,
-    validate_sample_size,
-    validate_sidedness,
-    validate_allocation_ratio,
-)
-from abverdict.utils.math import (
-    pooled_proportion,
-    pooled_variance,
-    effect_size_cohens_h,
-    effect_size_cohens_d,
-    welch_degrees_of_freedom,
-)
-from abverdict.utils.stats import (
-    z_alpha,
-    z_beta,
-    t_critical,
-    welch_df,
-    sample_size_two_proportions,
-    sample_size_two_means,
-    sample_size_survival,
-    z_test_two_proportions,
-    welch_t_test,
-    proportion_ci,
-    mean_ci,
-    difference_ci,
-    proportion_difference_se,
-    mean_difference_se,
-    lift_calculations,
-    bonferroni_correction,
-    log_rank_statistic,
-    hazard_ratio_from_events,
-    rate_ratio,
+from abverdict._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        **dict.fromkeys(
+            [
+                "validate_rate",
+                "validate_positive",
+                "validate_alpha",
+                "validate_power",
+                "validate_sample_size",
+                "validate_sidedness",
+                "validate_allocation_ratio",
+                "validate_finite_array",
+                "validate_non_negative_array",
+                "validate_rate_array",
+                "validate_sample_size_array",
+                "validate_visitors_array",
+                "ValidationReport",
+            ],
+            "abverdict.utils.validation",
+        ),
+        **dict.fromkeys(
+            [
+                "pooled_proportion",
+                "pooled_variance",
+                "effect_size_cohens_h",
+                "effect_size_cohens_d",
+                "welch_degrees_of_freedom",
+            ],
+            "abverdict.utils.math",
+        ),
+        **dict.fromkeys(
+            [
+                "z_alpha",
+                "z_beta",
+                "t_critical",
+                "z_alpha_array",
+                "t_critical_array",
+                "critical_z",
+                "critical_t",
+                "welch_df",
+                "welch_df_array",
+                "sample_size_two_proportions",
+                "sample_size_two_means",
+                "sample_size_survival",
+                "sample_size_grid",
+                "z_test_two_proportions",
+                "z_test_two_proportions_array",
+                "welch_t_test",
+                "welch_t_test_array",
+                "TestStatisticArrays",
+                "proportion_ci",
+                "mean_ci",
+                "difference_ci",
+                "proportion_difference_se",
+                "mean_difference_se",
+                "proportion_difference_se_array",
+                "mean_difference_se_array",
+                "lift_calculations",
+                "lift_calculations_array",
+                "bonferroni_correction",
+                "log_rank_statistic",
+                "hazard_ratio_from_events",
+                "rate_ratio",
+            ],
+            "abverdict.utils.stats",
+        ),
+        **dict.fromkeys(["make_rng", "spawn_rngs"], "abverdict.utils.rng"),
+        **dict.fromkeys(
+            ["record_stages", "add_stage_callback", "remove_stage_callback"],
+            "abverdict.utils.profiling",
+        ),
+    },
 )
 
 __all__ = [
@@ -44,6 +83,12 @@ __all__ = [
     "validate_sample_size",
     "validate_sidedness",
     "validate_allocation_ratio",
+    "validate_finite_array",
+    "validate_non_negative_array",
+    "validate_rate_array",
+    "validate_sample_size_array",
+    "validate_visitors_array",
+    "ValidationReport",
     "pooled_proportion",
     "pooled_variance",
     "effect_size_cohens_h",
@@ -52,20 +97,37 @@ __all__ = [
     "z_alpha",
     "z_beta",
     "t_critical",
+    "z_alpha_array",
+    "t_critical_array",
+    "critical_z",
+    "critical_t",
     "welch_df",
+    "welch_df_array",
     "sample_size_two_proportions",
     "sample_size_two_means",
     "sample_size_survival",
+    "sample_size_grid",
     "z_test_two_proportions",
+    "z_test_two_proportions_array",
     "welch_t_test",
+    "welch_t_test_array",
+    "TestStatisticArrays",
     "proportion_ci",
     "mean_ci",
     "difference_ci",
     "proportion_difference_se",
     "mean_difference_se",
+    "proportion_difference_se_array",
+    "mean_difference_se_array",
     "lift_calculations",
+    "lift_calculations_array",
     "bonferroni_correction",
     "log_rank_statistic",
     "hazard_ratio_from_events",
     "rate_ratio",
+    "make_rng",
+    "spawn_rngs",
+    "record_stages",
+    "add_stage_callback",
+    "remove_stage_callback",
 ]
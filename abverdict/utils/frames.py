@@ -0,0 +1,128 @@
+"""
+Columnar (struct-of-arrays) result containers.
+
+Batch analysis paths return one ``ResultsFrame`` instead of a list of
+per-row dataclasses. Each field is stored once as a contiguous NumPy array,
+so 100k results cost a few arrays rather than 100k boxed objects with their
+own markdown strings. Rows are available as lightweight views, and
+``to_dict`` hands the underlying arrays out without copying (e.g. straight
+into ``pandas.DataFrame``).
+"""
+
+from typing import Any, ClassVar, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+class FrameRow:
+    """Read-only view of one row of a ``ResultsFrame``."""
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame: "ResultsFrame", index: int):
+        self._frame = frame
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        frame = self._frame
+        if name not in frame.columns and name not in frame._derived:
+            raise AttributeError(name)
+        return getattr(frame, name)[self._index].item()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row as a dict of Python scalars."""
+        names = self._frame.columns + self._frame._derived
+        return {name: getattr(self, name) for name in names}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{type(self._frame).__name__}Row({fields})"
+
+
+class ResultsFrame:
+    """
+    Struct-of-arrays container for batch results.
+
+    Subclasses declare their stored columns in ``_columns`` and any
+    properties computed from them in ``_derived``. Columns are exposed as
+    attributes (``frame.p_value`` is an ndarray), integer indexing returns a
+    ``FrameRow`` view and slices / boolean masks / index arrays return a new
+    frame over the selected rows (basic slices share memory).
+
+    Batch entry points set ``validation`` to the ``ValidationReport`` of
+    their inputs; rows it flags hold NaN. Frames taken from another frame
+    have no report, since its indices refer to the original rows.
+    """
+
+    _columns: ClassVar[Tuple[str, ...]] = ()
+    _derived: ClassVar[Tuple[str, ...]] = ()
+    validation: Optional[Any] = None  # ValidationReport of the batch inputs
+
+    def __init__(self, **columns: Any):
+        missing = set(self._columns) - set(columns)
+        unknown = set(columns) - set(self._columns)
+        if missing or unknown:
+            raise ValueError(
+                f"{type(self).__name__} expects columns {list(self._columns)}; "
+                f"missing {sorted(missing)}, unexpected {sorted(unknown)}"
+            )
+
+        # Already-contiguous arrays are stored as-is; broadcast views and
+        # sequences are packed into their own contiguous buffer.
+        data = {name: np.ascontiguousarray(np.atleast_1d(columns[name])) for name in self._columns}
+        if len({len(values) for values in data.values()}) > 1:
+            raise ValueError("All columns must have the same length")
+        self._data = data
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self._columns
+
+    def column(self, name: str) -> np.ndarray:
+        return self._data[name]
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Only reached when normal lookup fails, i.e. for column names.
+        data = self.__dict__.get("_data")
+        if data is not None and name in data:
+            return data[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __len__(self) -> int:
+        if not self._columns:
+            return 0
+        return len(self._data[self._columns[0]])
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._data[key]
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            index = int(key) + n if key < 0 else int(key)
+            if not 0 <= index < n:
+                raise IndexError(f"row index {key} out of range for {n} rows")
+            return FrameRow(self, index)
+        return self._take(key)
+
+    def __iter__(self) -> Iterator[FrameRow]:
+        for i in range(len(self)):
+            yield FrameRow(self, i)
+
+    def _take(self, key) -> "ResultsFrame":
+        frame = object.__new__(type(self))
+        frame._data = {name: values[key] for name, values in self._data.items()}
+        return frame
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Return the columns as a dict of arrays (no copy)."""
+        return dict(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self._data.values())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, columns={list(self._columns)})"
+
+
+__all__ = ["ResultsFrame", "FrameRow"]
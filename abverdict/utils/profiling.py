@@ -0,0 +1,190 @@
+"""
+Opt-in per-stage timing for the analysis functions.
+
+Analyzers wrap their expensive steps in ``stage("bayesian.credible_intervals")``
+blocks. Nothing is measured unless a recorder is active or a callback is
+registered, in which case each block reports its wall time (and, optionally,
+the net bytes allocated while it ran)::
+
+    >>> from abverdict.utils.profiling import record_stages
+    >>> with record_stages() as recorder:
+    ...     bayesian.analyze(10000, 500, 10000, 550)
+    >>> sorted(recorder.to_dict())
+    ['bayesian.credible_intervals', 'bayesian.expected_loss', 'bayesian.probability_better',
+     'bayesian.recommendation']
+
+Recorders are tracked in a ``ContextVar``, so concurrent requests (threads or
+asyncio tasks) each see only their own stages.
+"""
+
+import time
+import tracemalloc
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class StageTiming:
+    """One completed stage."""
+    name: str
+    seconds: float
+    allocated_bytes: Optional[int] = None  # Net traced allocation; None unless tracing memory
+
+
+StageCallback = Callable[[StageTiming], None]
+
+_recorder: ContextVar[Optional["StageRecorder"]] = ContextVar("abverdict_stage_recorder", default=None)
+_callbacks: List[StageCallback] = []
+_NOOP = nullcontext()
+
+
+@dataclass
+class StageRecorder:
+    """
+    Collects ``StageTiming`` records while active.
+
+    Use through ``record_stages()``. Recorders nest: the innermost active one
+    receives the records.
+
+    Attributes:
+        trace_memory: Also record net bytes allocated per stage (starts
+            ``tracemalloc`` if it is not already running, which slows Python
+            allocations noticeably while the recorder is active)
+        records: Completed stages in the order they finished
+    """
+    trace_memory: bool = False
+    records: List[StageTiming] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self) -> "StageRecorder":
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _recorder.set(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _recorder.reset(self._token)
+        self._token = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def seconds(self, name: str) -> np.ndarray:
+        """Wall times of every call to the named stage."""
+        return np.array([r.seconds for r in self.records if r.name == name])
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate the records per stage.
+
+        Returns:
+            Mapping of stage name to calls, total_s, mean_s, max_s and, when
+            tracing memory, allocated_bytes (summed over calls)
+        """
+        summary: Dict[str, Dict[str, float]] = {}
+        for record in self.records:
+            entry = summary.setdefault(record.name, {"calls": 0, "total_s": 0.0, "max_s": 0.0})
+            entry["calls"] += 1
+            entry["total_s"] += record.seconds
+            entry["max_s"] = max(entry["max_s"], record.seconds)
+            if record.allocated_bytes is not None:
+                entry["allocated_bytes"] = entry.get("allocated_bytes", 0) + record.allocated_bytes
+        for entry in summary.values():
+            entry["mean_s"] = entry["total_s"] / entry["calls"]
+        return summary
+
+    def histogram(self, bins=10) -> Dict[str, Dict[str, list]]:
+        """
+        Histogram of wall times per stage.
+
+        Args:
+            bins: Passed to ``numpy.histogram`` (count or explicit edges)
+
+        Returns:
+            Mapping of stage name to {"counts": [...], "edges": [...]}
+        """
+        result = {}
+        for name in dict.fromkeys(r.name for r in self.records):
+            counts, edges = np.histogram(self.seconds(name), bins=bins)
+            result[name] = {"counts": counts.tolist(), "edges": edges.tolist()}
+        return result
+
+
+class _Stage:
+    __slots__ = ("name", "recorder", "start", "memory")
+
+    def __init__(self, name: str, recorder: Optional[StageRecorder]):
+        self.name = name
+        self.recorder = recorder
+
+    def __enter__(self):
+        tracing = self.recorder is not None and self.recorder.trace_memory and tracemalloc.is_tracing()
+        self.memory = tracemalloc.get_traced_memory()[0] if tracing else None
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        allocated = None
+        if self.memory is not None:
+            allocated = tracemalloc.get_traced_memory()[0] - self.memory
+        record = StageTiming(self.name, seconds, allocated)
+        if self.recorder is not None:
+            self.recorder.records.append(record)
+        for callback in _callbacks:
+            callback(record)
+        return False
+
+
+def stage(name: str):
+    """
+    Context manager timing one stage of an analysis.
+
+    Returns a shared no-op context when no recorder is active and no callback
+    is registered, so instrumented code pays only a ContextVar lookup.
+    """
+    recorder = _recorder.get()
+    if recorder is None and not _callbacks:
+        return _NOOP
+    return _Stage(name, recorder)
+
+
+def record_stages(trace_memory: bool = False) -> StageRecorder:
+    """
+    Record the stages run inside a ``with`` block.
+
+    Args:
+        trace_memory: Also record net bytes allocated per stage
+
+    Returns:
+        StageRecorder to use as a context manager
+    """
+    return StageRecorder(trace_memory=trace_memory)
+
+
+def add_stage_callback(callback: StageCallback) -> None:
+    """Call ``callback(StageTiming)`` after every stage, process-wide."""
+    _callbacks.append(callback)
+
+
+def remove_stage_callback(callback: StageCallback) -> None:
+    """Unregister a callback added with ``add_stage_callback``."""
+    _callbacks.remove(callback)
+
+
+__all__ = [
+    "StageTiming",
+    "StageRecorder",
+    "stage",
+    "record_stages",
+    "add_stage_callback",
+    "remove_stage_callback",
+]
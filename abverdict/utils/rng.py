@@ -0,0 +1,75 @@
+"""
+Random number generation for the Monte Carlo code paths.
+
+Every function that samples accepts a ``seed`` argument, normalized here into
+an ``np.random.Generator`` backed by PCG64:
+
+- ``None``: fresh OS entropy (non-reproducible, the default)
+- an int or ``np.random.SeedSequence``: a reproducible stream
+- an existing ``np.random.Generator``: used as-is, so callers can thread one
+  generator through several calls
+
+Independent streams for parallel workers come from ``SeedSequence.spawn``
+rather than from offsetting integer seeds, so they never overlap.
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+Seed = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+
+def _seed_sequence(seed: Seed) -> np.random.SeedSequence:
+    if isinstance(seed, np.random.Generator):
+        bit_generator = seed.bit_generator
+        # Public as ``seed_seq`` from numpy 1.25; private before that
+        seed_seq = getattr(bit_generator, "seed_seq", None) or getattr(bit_generator, "_seed_seq", None)
+        if seed_seq is None:
+            raise ValueError("Cannot spawn streams from a generator without a SeedSequence")
+        return seed_seq
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, (int, np.integer))):
+        raise TypeError(f"seed must be None, an int, a SeedSequence or a Generator, got {type(seed).__name__}")
+    if seed is not None and seed < 0:
+        raise ValueError(f"seed must be non-negative, got {seed}")
+    return np.random.SeedSequence(seed)
+
+
+def make_rng(seed: Seed = None) -> np.random.Generator:
+    """
+    Build a PCG64 generator from a seed.
+
+    Args:
+        seed: None, int, SeedSequence or Generator (returned unchanged)
+
+    Returns:
+        np.random.Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.Generator(np.random.PCG64(_seed_sequence(seed)))
+
+
+def spawn_rngs(seed: Seed, n: int) -> List[np.random.Generator]:
+    """
+    Create ``n`` statistically independent generators.
+
+    The same seed always yields the same list of streams, and each stream
+    can be handed to a separate thread or process.
+
+    Args:
+        seed: None, int, SeedSequence or Generator to spawn from
+        n: Number of generators
+
+    Returns:
+        List of np.random.Generator
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+    return [np.random.Generator(np.random.PCG64(child)) for child in _seed_sequence(seed).spawn(n)]
+
+
+__all__ = ["Seed", "make_rng", "spawn_rngs"]
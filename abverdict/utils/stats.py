@@ -1,7 +1,11 @@
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
-from scipy.stats import norm, t, chi2
+import numpy as np
+from scipy.special import ndtr, stdtr, stdtrit
+
+from abverdict.utils.math import normal_ppf, normal_sf, t_cdf, chi2_sf_1df
 
 
 @dataclass
@@ -29,23 +33,96 @@ class TestStatisticResult:
     is_significant: bool
 
 
+@dataclass
+class TestStatisticArrays:
+    statistic: np.ndarray
+    p_value: np.ndarray
+    degrees_of_freedom: Optional[np.ndarray]
+    is_significant: np.ndarray
+
+
+def _as_float_arrays(*values) -> Tuple[np.ndarray, ...]:
+    return tuple(np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values)))
+
+
+# Critical values are served from one place. Integer confidence/power levels
+# come from a table built once at import (stdlib NormalDist, no scipy), other
+# normal quantiles and Student-t quantiles are memoized.
+# Beyond this many degrees of freedom the t quantile equals the normal one to
+# well below 1e-8, so large-sample callers share the normal memo.
+_T_NORMAL_DF = 1e9
+
+
+@lru_cache(maxsize=1024)
+def _normal_quantile(p: float) -> float:
+    return normal_ppf(p)
+
+
+@lru_cache(maxsize=4096)
+def _t_quantile(df: float, p: float) -> float:
+    return float(stdtrit(df, p))
+
+
+def _df_bucket(df: float) -> float:
+    if df >= _T_NORMAL_DF:
+        return float('inf')
+    # Ten significant digits: Welch df values that differ only in float noise
+    # share a cache slot. The t quantile is steep in df when df is small, so a
+    # coarser key would return visibly wrong critical values; at ten digits
+    # the quantile moves by less than 1e-9 for df >= 0.5 and the usual levels.
+    return float(f"{df:.10g}")
+
+
+_Z_TWO_SIDED = {level: _normal_quantile(1 - (1 - level / 100) / 2) for level in range(50, 100)}
+_Z_ONE_SIDED = {level: _normal_quantile(1 - (1 - level / 100)) for level in range(50, 100)}
+
+
+def critical_z(alpha: float, two_sided: bool = True) -> float:
+    return _normal_quantile(1 - alpha / 2 if two_sided else 1 - alpha)
+
+
+def critical_t(df: float, alpha: float, two_sided: bool = True) -> float:
+    p = 1 - alpha / 2 if two_sided else 1 - alpha
+    bucket = _df_bucket(df)
+    if bucket == float('inf'):
+        return _normal_quantile(p)
+    return _t_quantile(bucket, p)
+
+
 def z_alpha(confidence: int = 95, two_sided: bool = True) -> float:
-    alpha = 1 - confidence / 100
-    if two_sided:
-        return norm.ppf(1 - alpha / 2)
-    return norm.ppf(1 - alpha)
+    table = _Z_TWO_SIDED if two_sided else _Z_ONE_SIDED
+    if confidence in table:
+        return table[confidence]
+    return critical_z(1 - confidence / 100, two_sided)
 
 
 def z_beta(power: int = 80) -> float:
-    beta = 1 - power / 100
-    return norm.ppf(1 - beta)
+    if power in _Z_ONE_SIDED:
+        return _Z_ONE_SIDED[power]
+    return critical_z(1 - power / 100, two_sided=False)
 
 
 def t_critical(df: float, confidence: int = 95, two_sided: bool = True) -> float:
+    return critical_t(df, 1 - confidence / 100, two_sided)
+
+
+def _map_unique(func, values) -> np.ndarray:
+    # Grids repeat a handful of confidence/power levels many times; resolve each
+    # distinct value once through the scalar (table/memo) path.
+    values = np.asarray(values, dtype=float)
+    unique, inverse = np.unique(values, return_inverse=True)
+    return np.array([func(float(v)) for v in unique])[inverse].reshape(values.shape)
+
+
+def z_alpha_array(confidence, two_sided: bool = True) -> np.ndarray:
+    return _map_unique(lambda level: z_alpha(level, two_sided), confidence)
+
+
+def t_critical_array(df, confidence, two_sided: bool = True) -> np.ndarray:
+    df, confidence = _as_float_arrays(df, confidence)
     alpha = 1 - confidence / 100
-    if two_sided:
-        return t.ppf(1 - alpha / 2, df)
-    return t.ppf(1 - alpha, df)
+    tail = alpha / 2 if two_sided else alpha
+    return np.where(df >= _T_NORMAL_DF, z_alpha_array(confidence, two_sided), stdtrit(df, 1 - tail))
 
 
 def welch_df(var1: float, var2: float, n1: int, n2: int) -> float:
@@ -60,6 +137,18 @@ def welch_df(var1: float, var2: float, n1: int, n2: int) -> float:
     return numerator / denominator
 
 
+def welch_df_array(var1, var2, n1, n2) -> np.ndarray:
+    var1, var2, n1, n2 = _as_float_arrays(var1, var2, n1, n2)
+    se1_sq = var1 / n1
+    se2_sq = var2 / n2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        numerator = (se1_sq + se2_sq) ** 2
+        denominator = (se1_sq ** 2) / (n1 - 1) + (se2_sq ** 2) / (n2 - 1)
+        df = np.where(denominator == 0, np.inf, numerator / denominator)
+    small = (n1 <= 1) | (n2 <= 1)
+    return np.where(small, np.maximum(1.0, n1 + n2 - 2), df)
+
+
 def sample_size_two_proportions(
     p1: float,
     p2: float,
@@ -75,10 +164,8 @@ def sample_size_two_proportions(
         num_comparisons = num_groups * (num_groups - 1) // 2
         alpha = alpha / num_comparisons
 
-    beta = 1 - power / 100
-
-    za = norm.ppf(1 - alpha / 2)
-    zb = norm.ppf(1 - beta)
+    za = critical_z(alpha)
+    zb = z_beta(power)
 
     p_pooled = (p1 + p2) / 2
 
@@ -116,10 +203,8 @@ def sample_size_two_means(
         num_comparisons = num_groups * (num_groups - 1) // 2
         alpha = alpha / num_comparisons
     
-    beta = 1 - power / 100
-    
-    za = norm.ppf(1 - alpha / 2)
-    zb = norm.ppf(1 - beta)
+    za = critical_z(alpha)
+    zb = z_beta(power)
     
     n = math.ceil(2 * ((za + zb) * std / effect_size) ** 2)
     
@@ -143,10 +228,8 @@ def sample_size_survival(
     if hr <= 0:
         raise ValueError("Hazard ratio must be positive")
     alpha = 1 - confidence / 100
-    beta = 1 - power / 100
-
-    za = norm.ppf(1 - alpha / 2)
-    zb = norm.ppf(1 - beta)
+    za = critical_z(alpha)
+    zb = z_beta(power)
 
     log_hr = math.log(hr)
     if abs(log_hr) < 0.001:
@@ -165,6 +248,66 @@ def sample_size_survival(
     )
 
 
+def sample_size_grid(
+    design: str = "two_proportions",
+    *,
+    p1=None,
+    p2=None,
+    effect_size=None,
+    std=None,
+    hr=None,
+    confidence=95,
+    power=80,
+    num_groups=2,
+    allocation_ratio=1.0,
+) -> np.ndarray:
+    if design not in ("two_proportions", "two_means", "survival"):
+        raise ValueError("design must be 'two_proportions', 'two_means' or 'survival'")
+
+    if design == "survival":
+        if hr is None:
+            raise ValueError("survival design requires hr")
+        hr, confidence, power, k = _as_float_arrays(hr, confidence, power, allocation_ratio)
+        alpha = 1 - confidence / 100
+    else:
+        if design == "two_proportions":
+            if p1 is None or p2 is None:
+                raise ValueError("two_proportions design requires p1 and p2")
+            a, b, confidence, power, num_groups = _as_float_arrays(p1, p2, confidence, power, num_groups)
+        else:
+            if effect_size is None or std is None:
+                raise ValueError("two_means design requires effect_size and std")
+            a, b, confidence, power, num_groups = _as_float_arrays(
+                effect_size, std, confidence, power, num_groups
+            )
+        alpha = 1 - confidence / 100
+        num_comparisons = np.where(num_groups > 2, num_groups * (num_groups - 1) // 2, 1)
+        alpha = alpha / num_comparisons
+
+    za = _map_unique(critical_z, alpha)
+    zb = _map_unique(z_beta, power)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if design == "two_proportions":
+            p_pooled = (a + b) / 2
+            numerator = (
+                za * np.sqrt(2 * p_pooled * (1 - p_pooled)) +
+                zb * np.sqrt(a * (1 - a) + b * (1 - b))
+            ) ** 2
+            n = np.ceil(numerator / (b - a) ** 2)
+            undefined = (np.abs(b - a) < 1e-12) | (a < 0) | (a > 1) | (b < 0) | (b > 1)
+        elif design == "two_means":
+            n = np.ceil(2 * ((za + zb) * b / a) ** 2)
+            undefined = (np.abs(a) < 1e-12) | (b <= 0)
+        else:
+            log_hr = np.log(np.where(hr > 0, hr, np.nan))
+            events_needed = np.ceil(((za + zb) ** 2 * (1 + k) ** 2) / (k * log_hr ** 2))
+            n = np.ceil(events_needed / 2)
+            undefined = ~(hr > 0) | (np.abs(log_hr) < 0.001) | ~(k > 0)
+
+    return np.where(undefined | ~np.isfinite(n), np.nan, n)
+
+
 def z_test_two_proportions(
     p1: float,
     n1: int,
@@ -179,7 +322,7 @@ def z_test_two_proportions(
     
     if se_pooled > 0:
         z_stat = (p2 - p1) / se_pooled
-        p_value = 2 * (1 - norm.cdf(abs(z_stat)))
+        p_value = 2 * normal_sf(abs(z_stat))
     else:
         z_stat = 0
         p_value = 1.0
@@ -192,6 +335,31 @@ def z_test_two_proportions(
     )
 
 
+def z_test_two_proportions_array(
+    p1,
+    n1,
+    p2,
+    n2,
+    confidence=95,
+) -> TestStatisticArrays:
+    p1, n1, p2, n2 = _as_float_arrays(p1, n1, p2, n2)
+    alpha = 1 - np.asarray(confidence, dtype=float) / 100
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_pooled = (p1 * n1 + p2 * n2) / (n1 + n2)
+        se_pooled = np.sqrt(p_pooled * (1 - p_pooled) * (1 / n1 + 1 / n2))
+        has_se = se_pooled > 0
+        z_stat = np.where(has_se, (p2 - p1) / se_pooled, 0.0)
+    p_value = np.where(has_se, 2 * ndtr(-np.abs(z_stat)), 1.0)
+
+    return TestStatisticArrays(
+        statistic=z_stat,
+        p_value=p_value,
+        degrees_of_freedom=None,
+        is_significant=p_value < alpha,
+    )
+
+
 def welch_t_test(
     mean1: float,
     std1: float,
@@ -211,7 +379,7 @@ def welch_t_test(
     if se > 0:
         t_stat = (mean2 - mean1) / se
         df = welch_df(var1, var2, n1, n2)
-        p_value = 2 * (1 - t.cdf(abs(t_stat), df))
+        p_value = 2 * t_cdf(-abs(t_stat), df)
     else:
         t_stat = 0
         df = n1 + n2 - 2
@@ -225,6 +393,36 @@ def welch_t_test(
     )
 
 
+def welch_t_test_array(
+    mean1,
+    std1,
+    n1,
+    mean2,
+    std2,
+    n2,
+    confidence=95,
+) -> TestStatisticArrays:
+    mean1, std1, n1, mean2, std2, n2 = _as_float_arrays(mean1, std1, n1, mean2, std2, n2)
+    alpha = 1 - np.asarray(confidence, dtype=float) / 100
+
+    var1 = std1 ** 2
+    var2 = std2 ** 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = np.sqrt(var1 / n1 + var2 / n2)
+        has_se = se > 0
+        t_stat = np.where(has_se, (mean2 - mean1) / se, 0.0)
+    df = np.where(has_se, welch_df_array(var1, var2, n1, n2), n1 + n2 - 2)
+    p_value = np.where(has_se, 2 * stdtr(df, -np.abs(t_stat)), 1.0)
+
+    return TestStatisticArrays(
+        statistic=t_stat,
+        p_value=p_value,
+        degrees_of_freedom=df,
+        is_significant=p_value < alpha,
+    )
+
+
 def proportion_ci(
     successes: int,
     n: int,
@@ -232,8 +430,7 @@ def proportion_ci(
     method: str = "wilson",
 ) -> Tuple[float, float, float, float]:
     rate = successes / n
-    alpha = 1 - confidence / 100
-    z = norm.ppf(1 - alpha / 2)
+    z = z_alpha(confidence)
     
     if method == "wilson":
         denominator = 1 + z**2 / n
@@ -258,9 +455,8 @@ def mean_ci(
 ) -> Tuple[float, float, float, float]:
     if n <= 1:
         return mean, float('-inf'), float('inf'), float('inf')
-    alpha = 1 - confidence / 100
     se = std / math.sqrt(n)
-    t_crit = t.ppf(1 - alpha / 2, n - 1)
+    t_crit = t_critical(n - 1, confidence)
     margin = t_crit * se
 
     return mean, mean - margin, mean + margin, margin
@@ -272,8 +468,7 @@ def difference_ci(
     df: float,
     confidence: int = 95,
 ) -> Tuple[float, float, float]:
-    alpha = 1 - confidence / 100
-    t_crit = t.ppf(1 - alpha / 2, df) if df > 0 else norm.ppf(1 - alpha / 2)
+    t_crit = t_critical(df, confidence) if df > 0 else z_alpha(confidence)
     margin = t_crit * se
     
     return diff - margin, diff + margin, margin
@@ -293,6 +488,24 @@ def lift_calculations(baseline: float, variant: float) -> Tuple[float, float]:
     return absolute, relative
 
 
+def proportion_difference_se_array(p1, n1, p2, n2) -> np.ndarray:
+    p1, n1, p2, n2 = _as_float_arrays(p1, n1, p2, n2)
+    return np.sqrt(p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2)
+
+
+def mean_difference_se_array(std1, n1, std2, n2) -> np.ndarray:
+    std1, n1, std2, n2 = _as_float_arrays(std1, n1, std2, n2)
+    return np.sqrt(std1**2 / n1 + std2**2 / n2)
+
+
+def lift_calculations_array(baseline, variant) -> Tuple[np.ndarray, np.ndarray]:
+    baseline, variant = _as_float_arrays(baseline, variant)
+    absolute = variant - baseline
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = np.where(baseline != 0, absolute / baseline * 100, 0.0)
+    return absolute, relative
+
+
 def bonferroni_correction(p_value: float, num_comparisons: int) -> float:
     return min(1.0, p_value * num_comparisons)
 
@@ -306,7 +519,7 @@ def log_rank_statistic(
         return 0.0, 1.0
     
     chi2_stat = (observed - expected) ** 2 / variance
-    p_value = 1 - chi2.cdf(chi2_stat, df=1)
+    p_value = chi2_sf_1df(chi2_stat)
     
     return chi2_stat, p_value
 
@@ -333,8 +546,7 @@ def hazard_ratio_from_events(
     se_log_hr = math.sqrt(1/ctrl_events + 1/trt_events)
     log_hr = math.log(hr) if hr > 0 else 0
     
-    alpha = 1 - confidence / 100
-    z = norm.ppf(1 - alpha / 2)
+    z = z_alpha(confidence)
     ci_lower = math.exp(log_hr - z * se_log_hr)
     ci_upper = math.exp(log_hr + z * se_log_hr)
     
@@ -363,7 +575,7 @@ def rate_ratio(
     if ctrl_events > 0 and trt_events > 0:
         se_log_rr = math.sqrt(1/ctrl_events + 1/trt_events)
         log_rr = math.log(rr)
-        z = norm.ppf(1 - (1 - confidence/100) / 2)
+        z = z_alpha(confidence)
         rr_lower = math.exp(log_rr - z * se_log_rr)
         rr_upper = math.exp(log_rr + z * se_log_rr)
     else:
@@ -375,7 +587,7 @@ def rate_ratio(
     if expected_ctrl > 0 and expected_trt > 0:
         chi2_stat = ((ctrl_events - expected_ctrl) ** 2 / expected_ctrl + 
                      (trt_events - expected_trt) ** 2 / expected_trt)
-        p_value = 1 - chi2.cdf(chi2_stat, df=1)
+        p_value = chi2_sf_1df(chi2_stat)
     else:
         p_value = 1.0
     
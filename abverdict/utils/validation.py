@@ -7,7 +7,10 @@ before performing statistical calculations.
 
 import math
 import warnings
-from typing import Union, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Union, Optional, List
+
+import numpy as np
 
 
 class SmallSampleWarning(UserWarning):
@@ -374,3 +377,273 @@ def validate_rate_or_percentage(value: float, name: str = "rate") -> float:
         )
 
     return value
+
+
+# ---------------------------------------------------------------------------
+# Array validators
+#
+# The functions below check whole columns in a few vectorized passes. Instead
+# of raising on the first bad value they return a ValidationReport listing the
+# offending row indices per reason, so a batch over millions of rows can drop
+# or inspect dirty rows without aborting.
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ValidationReport:
+    """
+    Result of validating one or more columns.
+
+    Indices refer to positions in the flattened (broadcast) input arrays.
+
+    Attributes:
+        n_rows: Number of rows checked
+        issues: Mapping of reason to sorted row indices that fail it
+        warnings: Same as ``issues`` for soft problems (e.g. small samples)
+            that do not make a row invalid
+    """
+    n_rows: int
+    issues: Dict[str, np.ndarray] = field(default_factory=dict)
+    warnings: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+
+    @property
+    def invalid_indices(self) -> np.ndarray:
+        """Sorted indices of rows with at least one issue."""
+        if not self.issues:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(list(self.issues.values())))
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        """Boolean mask that is True for rows without issues."""
+        mask = np.ones(self.n_rows, dtype=bool)
+        mask[self.invalid_indices] = False
+        return mask
+
+    def where_valid(self, values, fill) -> np.ndarray:
+        """
+        Replace the entries of invalid rows.
+
+        Args:
+            values: Array with ``n_rows`` elements (any shape)
+            fill: Value for invalid rows (e.g. NaN for outputs, or a harmless
+                placeholder for inputs so the valid rows can be computed)
+
+        Returns:
+            Array of the same shape as ``values``
+        """
+        values = np.asarray(values)
+        if self.is_valid:
+            return values
+        return np.where(self.valid_mask.reshape(values.shape), values, fill)
+
+    def merge(self, other: "ValidationReport") -> "ValidationReport":
+        """Combine two reports over the same rows."""
+        if other.n_rows != self.n_rows:
+            raise ValueError(
+                f"Cannot merge reports over {self.n_rows} and {other.n_rows} rows"
+            )
+        return ValidationReport(
+            n_rows=self.n_rows,
+            issues=_merge_issues(self.issues, other.issues),
+            warnings=_merge_issues(self.warnings, other.warnings),
+        )
+
+    def summary(self, max_indices: int = 5) -> str:
+        """One line per reason with its row count and the first few indices."""
+        if self.is_valid and not self.warnings:
+            return f"All {self.n_rows} rows are valid"
+        lines = []
+        for label, group in (("", self.issues), ("warning: ", self.warnings)):
+            for reason, indices in group.items():
+                shown = ", ".join(str(i) for i in indices[:max_indices])
+                more = ", ..." if len(indices) > max_indices else ""
+                lines.append(f"{label}{reason}: {len(indices)} rows [{shown}{more}]")
+        return "\n".join(lines)
+
+    def raise_if_invalid(self) -> None:
+        """Raise ValueError describing every issue, if there are any."""
+        if self.issues:
+            invalid = ValidationReport(self.n_rows, self.issues)
+            raise ValueError(
+                f"{len(self.invalid_indices)} of {self.n_rows} rows are invalid:\n"
+                f"{invalid.summary()}"
+            )
+
+
+def _merge_issues(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    merged = dict(a)
+    for reason, indices in b.items():
+        if reason in merged:
+            indices = np.union1d(merged[reason], indices)
+        merged[reason] = indices
+    return merged
+
+
+def _as_float_array(values, name: str) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind not in "biuf":
+        try:
+            values = values.astype(float)
+        except (TypeError, ValueError):
+            raise TypeError(f"{name} must be numeric, got dtype {values.dtype}") from None
+    return values.ravel()
+
+
+def _collect(checks) -> Dict[str, np.ndarray]:
+    # Only reasons that actually flag a row end up in the report
+    issues = {}
+    for reason, mask in checks:
+        indices = np.flatnonzero(mask)
+        if indices.size:
+            issues[reason] = indices
+    return issues
+
+
+def _finite_checks(values: np.ndarray, name: str) -> list:
+    if values.dtype.kind != "f":
+        return []
+    return [
+        (f"{name} cannot be NaN", np.isnan(values)),
+        (f"{name} cannot be infinity", np.isinf(values)),
+    ]
+
+
+def validate_finite_array(values, name: str = "value") -> ValidationReport:
+    """
+    Validate that every value in a column is finite.
+
+    Args:
+        values: Array-like of numbers
+        name: Name of the column for messages
+
+    Returns:
+        ValidationReport flagging NaN and infinite rows
+
+    Raises:
+        TypeError: If values cannot be interpreted as numbers
+    """
+    values = _as_float_array(values, name)
+    return ValidationReport(values.size, _collect(_finite_checks(values, name)))
+
+
+def validate_rate_array(values, name: str = "rate") -> ValidationReport:
+    """
+    Validate that every value in a column is a rate between 0 and 1.
+
+    Args:
+        values: Array-like of rates
+        name: Name of the column for messages
+
+    Returns:
+        ValidationReport flagging non-finite and out-of-range rows
+
+    Raises:
+        TypeError: If values cannot be interpreted as numbers
+    """
+    values = _as_float_array(values, name)
+    # NaN compares False, so it is only reported as NaN
+    with np.errstate(invalid="ignore"):
+        checks = _finite_checks(values, name) + [
+            (f"{name} must be between 0 and 1", np.isfinite(values) & ((values < 0) | (values > 1))),
+        ]
+    return ValidationReport(values.size, _collect(checks))
+
+
+def validate_non_negative_array(values, name: str = "value") -> ValidationReport:
+    """
+    Validate that every value in a column is finite and non-negative.
+
+    Args:
+        values: Array-like of numbers (e.g. standard deviations)
+        name: Name of the column for messages
+
+    Returns:
+        ValidationReport flagging non-finite and negative rows
+
+    Raises:
+        TypeError: If values cannot be interpreted as numbers
+    """
+    values = _as_float_array(values, name)
+    with np.errstate(invalid="ignore"):
+        checks = _finite_checks(values, name) + [(f"{name} cannot be negative", values < 0)]
+    return ValidationReport(values.size, _collect(checks))
+
+
+def validate_sample_size_array(
+    n,
+    name: str = "sample_size",
+    min_recommended: Optional[int] = 30,
+) -> ValidationReport:
+    """
+    Validate a column of sample sizes.
+
+    Args:
+        n: Array-like of sample sizes
+        name: Name of the column for messages
+        min_recommended: Rows below this size are listed under ``warnings``
+            (None to skip the check)
+
+    Returns:
+        ValidationReport flagging non-finite and non-positive rows
+
+    Raises:
+        TypeError: If n cannot be interpreted as numbers
+    """
+    n = _as_float_array(n, name)
+    finite = np.isfinite(n) if n.dtype.kind == "f" else np.ones(n.size, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        issues = _collect(_finite_checks(n, name) + [(f"{name} must be positive", finite & (n <= 0))])
+        soft = []
+        if min_recommended is not None:
+            soft.append((
+                f"{name} is below the recommended minimum of {min_recommended}",
+                finite & (n > 0) & (n < min_recommended),
+            ))
+    return ValidationReport(n.size, issues, _collect(soft))
+
+
+def validate_visitors_array(
+    visitors,
+    conversions,
+    visitors_name: str = "visitors",
+    conversions_name: str = "conversions",
+) -> ValidationReport:
+    """
+    Validate columns of visitors and conversions for conversion analysis.
+
+    Values are truncated to integers before the range checks, as
+    ``validate_visitors`` does.
+
+    Args:
+        visitors: Array-like of visitor counts
+        conversions: Array-like of conversion counts (broadcast with visitors)
+        visitors_name: Name of the visitors column for messages
+        conversions_name: Name of the conversions column for messages
+
+    Returns:
+        ValidationReport flagging non-finite counts, visitors <= 0,
+        conversions < 0 and conversions > visitors
+
+    Raises:
+        TypeError: If inputs cannot be interpreted as numbers
+        ValueError: If the inputs cannot be broadcast together
+    """
+    visitors, conversions = np.broadcast_arrays(np.asarray(visitors), np.asarray(conversions))
+    visitors = _as_float_array(visitors, visitors_name)
+    conversions = _as_float_array(conversions, conversions_name)
+
+    checks = _finite_checks(visitors, visitors_name) + _finite_checks(conversions, conversions_name)
+    with np.errstate(invalid="ignore"):
+        v = np.trunc(visitors)
+        c = np.trunc(conversions)
+        checks += [
+            (f"{visitors_name} must be positive", v <= 0),
+            (f"{conversions_name} cannot be negative", c < 0),
+            (f"{conversions_name} cannot exceed {visitors_name}", c > v),
+        ]
+    return ValidationReport(visitors.size, _collect(checks))
@@ -0,0 +1,278 @@
+"""
+Benchmark suite for the public analysis entry points.
+
+Every case runs on a synthetic, seeded dataset at several scales and the
+timings are written to JSON so runs can be compared between releases.
+
+Usage:
+    python -m benchmarks.bench_analysis [--scale quick|full] [--filter TEXT]
+                                        [--output PATH] [--compare BASELINE]
+
+``--scale full`` adds the largest sizes (10^6 subjects, 10k segments).
+``--compare`` prints the ratio of each case against an earlier JSON file and
+exits with status 1 when any case is slower than ``--threshold``.
+The FastAPI routes are benchmarked through ``fastapi.testclient`` when the
+``api`` extra is installed and reported as skipped otherwise.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+import abverdict
+from abverdict import conversion, magnitude, timing
+from abverdict.business import check_guardrails
+from abverdict.methods import bayesian, sequential
+from abverdict.segments import analyze_segments
+
+
+SEED = 20240601
+
+SUBJECTS = {"quick": [1_000, 10_000, 100_000], "full": [1_000, 10_000, 100_000, 1_000_000]}
+SEGMENTS = {"quick": [10, 100, 1_000], "full": [10, 100, 1_000, 10_000]}
+VARIANTS = [2, 5, 20]
+
+
+@dataclass
+class Case:
+    name: str
+    size: int
+    setup: Callable[[np.random.Generator], Callable[[], object]]
+    group: str = "library"
+
+
+def _conversion_variants(rng, k):
+    visitors = rng.integers(5_000, 50_000, size=k)
+    conversions = rng.binomial(visitors, 0.05)
+    return [
+        {"name": f"v{i}", "visitors": int(n), "conversions": int(c)}
+        for i, (n, c) in enumerate(zip(visitors, conversions))
+    ]
+
+
+def _magnitude_variants(rng, k):
+    return [
+        {"name": f"v{i}", "visitors": int(rng.integers(1_000, 10_000)),
+         "mean": float(rng.normal(50, 2)), "std": float(rng.uniform(10, 20))}
+        for i in range(k)
+    ]
+
+
+def _timing_arms(rng, n):
+    # Whole days, as time-to-event data is usually recorded, so event times tie
+    control = np.ceil(rng.exponential(10.0, size=n))
+    treatment = np.ceil(rng.exponential(9.0, size=n))
+    return (
+        control.tolist(), (rng.random(n) < 0.8).astype(int).tolist(),
+        treatment.tolist(), (rng.random(n) < 0.8).astype(int).tolist(),
+    )
+
+
+def _segments(rng, k):
+    visitors = rng.integers(200, 5_000, size=(k, 2))
+    conversions = rng.binomial(visitors, [0.05, 0.055])
+    return [
+        {"segment_name": "segment", "segment_value": f"s{i}",
+         "control_visitors": int(visitors[i, 0]), "control_conversions": int(conversions[i, 0]),
+         "variant_visitors": int(visitors[i, 1]), "variant_conversions": int(conversions[i, 1])}
+        for i in range(k)
+    ]
+
+
+def _conversion_arrays(rng, k):
+    visitors = rng.integers(5_000, 50_000, size=(2, k))
+    conversions = rng.binomial(visitors, [[0.05], [0.055]])
+    return visitors[0], conversions[0], visitors[1], conversions[1]
+
+
+def _daily_counts(rng, days):
+    visitors = np.cumsum(rng.integers(100, 300, size=(2, days)), axis=1)
+    conversions = np.cumsum(rng.binomial(np.diff(visitors, prepend=0), [[0.05], [0.052]]), axis=1)
+    return visitors[0], conversions[0], visitors[1], conversions[1]
+
+
+def _guardrails(rng, n):
+    return [
+        {"name": "Page Load Time (ms)", "metric_type": "mean",
+         "control_data": rng.normal(1200, 150, size=n).tolist(),
+         "variant_data": rng.normal(1210, 150, size=n).tolist()},
+        {"name": "Error Rate", "metric_type": "proportion",
+         "control_data": {"count": int(n * 0.01), "total": n},
+         "variant_data": {"count": int(n * 0.011), "total": n}},
+    ]
+
+
+def library_cases(scale: str) -> List[Case]:
+    cases = [
+        Case("conversion.analyze", 1, lambda rng: lambda: conversion.analyze(10_000, 500, 10_000, 560)),
+        Case("sequential.analyze", 1, lambda rng: lambda: sequential.analyze(5_000, 250, 5_000, 290, 10_000)),
+        Case("bayesian.analyze", 1, lambda rng: lambda: bayesian.analyze(10_000, 500, 10_000, 560)),
+        Case("sequential.analyze_trajectory", 365, lambda rng: (
+            lambda a=_daily_counts(rng, 365): sequential.analyze_trajectory(*a, 365 * 200))),
+        Case("sequential.simulate", 100_000, lambda rng: lambda: sequential.simulate(
+            0.05, 30_000, relative_lift=0.1, num_trials=100_000, seed=SEED)),
+    ]
+    for k in VARIANTS:
+        cases += [
+            Case("conversion.analyze_multi", k, lambda rng, k=k: (
+                lambda v=_conversion_variants(rng, k): conversion.analyze_multi(v))),
+            Case("magnitude.analyze_multi", k, lambda rng, k=k: (
+                lambda v=_magnitude_variants(rng, k): magnitude.analyze_multi(v))),
+            Case("bayesian.analyze_multi", k, lambda rng, k=k: (
+                lambda v=_conversion_variants(rng, k): bayesian.analyze_multi(v))),
+        ]
+    for n in SUBJECTS[scale]:
+        cases += [
+            Case("timing.analyze", n, lambda rng, n=n: (
+                lambda a=_timing_arms(rng, n): timing.analyze(*a))),
+            Case("timing.survival_curve", n, lambda rng, n=n: (
+                lambda a=_timing_arms(rng, n): timing.survival_curve(a[0], a[1]))),
+            Case("check_guardrails", n, lambda rng, n=n: (
+                lambda g=_guardrails(rng, n): check_guardrails(g))),
+        ]
+    for k in SEGMENTS[scale]:
+        cases += [
+            Case("analyze_segments", k, lambda rng, k=k: (
+                lambda s=_segments(rng, k): analyze_segments(s))),
+            Case("bayesian.analyze_batch", k, lambda rng, k=k: (
+                lambda a=_conversion_arrays(rng, k): bayesian.analyze_batch(*a))),
+        ]
+    return cases
+
+
+def api_cases(scale: str) -> List[Case]:
+    try:
+        from fastapi.testclient import TestClient
+        from abverdict.api import app
+    except ImportError:
+        return []
+
+    client = TestClient(app)
+
+    def post(path, payload):
+        def call():
+            response = client.post(path, json=payload)
+            response.raise_for_status()
+            return response
+        return call
+
+    pair = {"control_visitors": 10_000, "control_conversions": 500,
+            "variant_visitors": 10_000, "variant_conversions": 560}
+    cases = [
+        Case("POST /api/conversion/analyze", 1, lambda rng: post("/api/conversion/analyze", pair), "api"),
+        Case("POST /api/bayesian/analyze", 1, lambda rng: post("/api/bayesian/analyze", pair), "api"),
+        Case("POST /api/sequential/analyze", 1, lambda rng: post(
+            "/api/sequential/analyze", {**pair, "expected_visitors_per_variant": 20_000}), "api"),
+    ]
+    for k in VARIANTS:
+        cases += [
+            Case("POST /api/conversion/analyze-multi", k, lambda rng, k=k: post(
+                "/api/conversion/analyze-multi", {"variants": _conversion_variants(rng, k)}), "api"),
+            Case("POST /api/magnitude/analyze-multi", k, lambda rng, k=k: post(
+                "/api/magnitude/analyze-multi", {"variants": _magnitude_variants(rng, k)}), "api"),
+        ]
+    for n in SUBJECTS[scale][:-1]:
+        cases.append(Case("POST /api/timing/analyze", n, lambda rng, n=n: post(
+            "/api/timing/analyze", dict(zip(
+                ["control_times", "control_events", "treatment_times", "treatment_events"],
+                _timing_arms(rng, n),
+            ))), "api"))
+    for k in SEGMENTS[scale][:-1]:
+        cases.append(Case("POST /api/segments/analyze", k, lambda rng, k=k: post(
+            "/api/segments/analyze", {"segments": _segments(rng, k)}), "api"))
+    return cases
+
+
+def measure(func: Callable[[], object], min_time: float, max_repeat: int) -> Dict[str, float]:
+    # Repeat until min_time has elapsed (at least three runs) so fast cases
+    # get enough samples and slow ones don't stall the suite.
+    samples = []
+    start = time.perf_counter()
+    while len(samples) < max_repeat and (len(samples) < 3 or time.perf_counter() - start < min_time):
+        t0 = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - t0)
+    return {
+        "min_s": min(samples),
+        "median_s": float(np.median(samples)),
+        "repeat": len(samples),
+    }
+
+
+def run(cases: List[Case], min_time: float, max_repeat: int) -> List[Dict[str, object]]:
+    results = []
+    for case in cases:
+        func = case.setup(np.random.default_rng(SEED))
+        func()  # warm-up: lazy imports, caches
+        timing_ = measure(func, min_time, max_repeat)
+        results.append({"name": case.name, "size": case.size, "group": case.group, **timing_})
+        print(f"{case.name:<40}{case.size:>10}{timing_['min_s'] * 1e3:>12.3f} ms"
+              f"{timing_['median_s'] * 1e3:>12.3f} ms  x{timing_['repeat']}")
+    return results
+
+
+def compare(results: List[Dict[str, object]], baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path) as fh:
+        baseline = {(r["name"], r["size"]): r for r in json.load(fh)["results"]}
+
+    regressed = False
+    print(f"\n{'case':<40}{'size':>10}{'baseline':>12}{'current':>12}{'ratio':>9}")
+    for r in results:
+        old = baseline.get((r["name"], r["size"]))
+        if old is None:
+            continue
+        ratio = r["min_s"] / old["min_s"]
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressed |= bool(flag)
+        print(f"{r['name']:<40}{r['size']:>10}{old['min_s'] * 1e3:>10.3f}ms"
+              f"{r['min_s'] * 1e3:>10.3f}ms{ratio:>8.2f}x{flag}")
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=["quick", "full"], default="quick")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains TEXT")
+    parser.add_argument("--output", default="benchmark-results.json", help="JSON file to write")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression (default 1.25)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to spend per case")
+    parser.add_argument("--max-repeat", type=int, default=1_000)
+    args = parser.parse_args(argv)
+
+    cases = library_cases(args.scale)
+    api = api_cases(args.scale)
+    if not api:
+        print("fastapi not installed; skipping API routes")
+    cases = [c for c in cases + api if args.filter in c.name]
+
+    results = run(cases, args.min_time, args.max_repeat)
+    report = {
+        "abverdict_version": abverdict.__version__,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "scale": args.scale,
+        "api_skipped": not api,
+        "results": results,
+    }
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
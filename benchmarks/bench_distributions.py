@@ -0,0 +1,46 @@
+"""
+Micro-benchmark for the scalar distribution functions in abverdict.utils.math.
+
+Compares the per-call cost of the fast scalar paths against the equivalent
+scipy.stats calls they replace.
+
+Usage:
+    python -m benchmarks.bench_distributions [--number N]
+"""
+
+import argparse
+import timeit
+
+from scipy.stats import chi2, norm, t
+
+from abverdict.utils.math import chi2_sf_1df, normal_cdf, normal_ppf, t_cdf, t_ppf
+
+
+CASES = [
+    ("normal_cdf", lambda: normal_cdf(1.3), lambda: norm.cdf(1.3)),
+    ("normal_ppf", lambda: normal_ppf(0.975), lambda: norm.ppf(0.975)),
+    ("t_cdf", lambda: t_cdf(1.3, 17.5), lambda: t.cdf(1.3, 17.5)),
+    ("t_ppf", lambda: t_ppf(0.975, 17.5), lambda: t.ppf(0.975, 17.5)),
+    ("chi2_sf_1df", lambda: chi2_sf_1df(3.2), lambda: chi2.sf(3.2, 1)),
+]
+
+
+def per_call_us(func, number: int) -> float:
+    # Best of five repeats to keep scheduler noise out of the figure.
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="calls per repeat")
+    args = parser.parse_args()
+
+    print(f"{'function':<14}{'fast (us)':>12}{'scipy.stats (us)':>18}{'speedup':>10}")
+    for name, fast, reference in CASES:
+        fast_us = per_call_us(fast, args.number)
+        ref_us = per_call_us(reference, args.number)
+        print(f"{name:<14}{fast_us:>12.3f}{ref_us:>18.3f}{ref_us / fast_us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
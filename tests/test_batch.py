@@ -0,0 +1,374 @@
+"""
+Tests for the array-in/array-out batch kernels.
+
+Each vectorized kernel must agree with its scalar counterpart element by
+element, broadcast like a NumPy ufunc and handle degenerate rows the same way.
+"""
+
+import pytest
+import numpy as np
+from abverdict import conversion, magnitude
+from abverdict.methods import bayesian
+from abverdict.utils import stats, validation
+
+
+@pytest.fixture
+def proportion_table():
+    rng = np.random.default_rng(7)
+    n1 = rng.integers(50, 50_000, size=200)
+    n2 = rng.integers(50, 50_000, size=200)
+    p1 = rng.uniform(0.01, 0.3, size=200)
+    p2 = np.clip(p1 * rng.uniform(0.8, 1.3, size=200), 0, 1)
+    return p1, n1, p2, n2
+
+
+@pytest.fixture
+def means_table():
+    rng = np.random.default_rng(11)
+    n1 = rng.integers(2, 5_000, size=200)
+    n2 = rng.integers(2, 5_000, size=200)
+    mean1 = rng.uniform(10, 100, size=200)
+    mean2 = mean1 * rng.uniform(0.9, 1.1, size=200)
+    std1 = rng.uniform(1, 50, size=200)
+    std2 = rng.uniform(1, 50, size=200)
+    return mean1, std1, n1, mean2, std2, n2
+
+
+class TestVectorizedKernels:
+    """Vectorized kernels must match the scalar implementations."""
+
+    def test_z_test_matches_scalar(self, proportion_table):
+        p1, n1, p2, n2 = proportion_table
+        batch = stats.z_test_two_proportions_array(p1, n1, p2, n2, confidence=95)
+
+        for i in range(len(p1)):
+            scalar = stats.z_test_two_proportions(p1[i], int(n1[i]), p2[i], int(n2[i]), 95)
+            assert batch.statistic[i] == pytest.approx(scalar.statistic, rel=1e-12)
+            assert batch.p_value[i] == pytest.approx(scalar.p_value, rel=1e-9, abs=1e-15)
+            assert bool(batch.is_significant[i]) == scalar.is_significant
+        assert batch.degrees_of_freedom is None
+
+    def test_welch_t_test_matches_scalar(self, means_table):
+        mean1, std1, n1, mean2, std2, n2 = means_table
+        batch = stats.welch_t_test_array(mean1, std1, n1, mean2, std2, n2, confidence=90)
+
+        for i in range(len(mean1)):
+            scalar = stats.welch_t_test(
+                mean1[i], std1[i], int(n1[i]), mean2[i], std2[i], int(n2[i]), 90
+            )
+            assert batch.statistic[i] == pytest.approx(scalar.statistic, rel=1e-12)
+            assert batch.p_value[i] == pytest.approx(scalar.p_value, rel=1e-8, abs=1e-15)
+            assert batch.degrees_of_freedom[i] == pytest.approx(scalar.degrees_of_freedom, rel=1e-12)
+            assert bool(batch.is_significant[i]) == scalar.is_significant
+
+    def test_helpers_match_scalar(self, proportion_table, means_table):
+        p1, n1, p2, n2 = proportion_table
+        se = stats.proportion_difference_se_array(p1, n1, p2, n2)
+        absolute, relative = stats.lift_calculations_array(p1, p2)
+        for i in range(len(p1)):
+            assert se[i] == pytest.approx(stats.proportion_difference_se(p1[i], n1[i], p2[i], n2[i]))
+            exp_abs, exp_rel = stats.lift_calculations(p1[i], p2[i])
+            assert absolute[i] == pytest.approx(exp_abs)
+            assert relative[i] == pytest.approx(exp_rel)
+
+        mean1, std1, n1, mean2, std2, n2 = means_table
+        se = stats.mean_difference_se_array(std1, n1, std2, n2)
+        df = stats.welch_df_array(std1**2, std2**2, n1, n2)
+        for i in range(len(mean1)):
+            assert se[i] == pytest.approx(stats.mean_difference_se(std1[i], n1[i], std2[i], n2[i]))
+            assert df[i] == pytest.approx(stats.welch_df(std1[i]**2, std2[i]**2, n1[i], n2[i]))
+
+    def test_broadcasting(self):
+        """A scalar control can be compared against a column of variants."""
+        p2 = np.array([0.05, 0.06, 0.07])
+        result = stats.z_test_two_proportions_array(0.05, 10_000, p2, 10_000)
+
+        assert result.statistic.shape == (3,)
+        assert result.statistic[0] == 0.0
+        assert result.p_value[0] == pytest.approx(1.0)
+        assert list(result.is_significant) == [False, True, True]
+
+    def test_per_row_confidence(self):
+        result = stats.z_test_two_proportions_array(
+            [0.05, 0.05], [20_000, 20_000], [0.0545, 0.0545], [20_000, 20_000],
+            confidence=[90, 99],
+        )
+        assert result.p_value[0] == result.p_value[1]
+        assert list(result.is_significant) == [True, False]
+
+    def test_degenerate_rows(self):
+        """Zero standard error yields a null statistic rather than NaN."""
+        z = stats.z_test_two_proportions_array([0.0, 1.0], [100, 100], [0.0, 1.0], [100, 100])
+        assert np.all(z.statistic == 0.0)
+        assert np.all(z.p_value == 1.0)
+        assert not z.is_significant.any()
+
+        t = stats.welch_t_test_array([10.0, 5.0], [0.0, 1.0], [1, 2], [10.0, 5.0], [0.0, 1.0], [1, 2])
+        assert t.statistic[0] == 0.0
+        assert t.p_value[0] == 1.0
+        assert t.degrees_of_freedom[0] == 0.0
+        assert t.degrees_of_freedom[1] == pytest.approx(2.0)
+
+    def test_zero_baseline_lift(self):
+        absolute, relative = stats.lift_calculations_array([0.0, 0.1], [0.05, 0.15])
+        assert relative[0] == 0.0
+        assert relative[1] == pytest.approx(50.0)
+        assert absolute[0] == pytest.approx(0.05)
+
+
+class TestSampleSizeGrid:
+    """sample_size_grid must agree with the scalar sample-size functions."""
+
+    def test_two_proportions(self):
+        p1 = np.array([0.01, 0.05, 0.2])[:, None]
+        p2 = p1 * np.array([1.05, 1.1, 1.5])
+        grid = stats.sample_size_grid("two_proportions", p1=p1, p2=p2, power=[70, 80, 95])
+        for i in range(3):
+            for j in range(3):
+                expected = stats.sample_size_two_proportions(
+                    float(p1[i, 0]), float(p2[i, j]), power=[70, 80, 95][j]
+                )
+                assert grid[i, j] == expected.n_per_group
+
+    def test_two_means_with_groups(self):
+        grid = stats.sample_size_grid(
+            "two_means", effect_size=[1.0, 2.5], std=10.0, confidence=97.5, num_groups=[[2], [4]]
+        )
+        for i, k in enumerate([2, 4]):
+            for j, effect in enumerate([1.0, 2.5]):
+                expected = stats.sample_size_two_means(effect, 10.0, confidence=97.5, num_groups=k)
+                assert grid[i, j] == expected.n_per_group
+
+    def test_survival(self):
+        grid = stats.sample_size_grid("survival", hr=[0.5, 0.8, 1.25], allocation_ratio=[1.0, 2.0, 1.0])
+        for hr, k, n in zip([0.5, 0.8, 1.25], [1.0, 2.0, 1.0], grid):
+            assert n == stats.sample_size_survival(hr, allocation_ratio=k).n_per_group
+
+    def test_undefined_cells(self):
+        grid = stats.sample_size_grid("two_proportions", p1=0.05, p2=[0.05, 1.2, 0.06])
+        assert np.isnan(grid[0]) and np.isnan(grid[1])
+        assert np.isfinite(grid[2])
+
+        grid = stats.sample_size_grid("survival", hr=[0.0, 1.0, 0.7])
+        assert np.isnan(grid[:2]).all()
+
+    def test_requires_design_inputs(self):
+        with pytest.raises(ValueError):
+            stats.sample_size_grid("two_means", effect_size=1.0)
+        with pytest.raises(ValueError, match="hr"):
+            stats.sample_size_grid("survival")
+        with pytest.raises(ValueError):
+            stats.sample_size_grid("ratio")
+
+
+class TestResultsFrames:
+    """Batch analysis returns columnar frames that agree with analyze()."""
+
+    def test_conversion_batch_matches_analyze(self):
+        rng = np.random.default_rng(3)
+        visitors = rng.integers(100, 20_000, size=(2, 50))
+        conversions = (visitors * rng.uniform(0.02, 0.2, size=(2, 50))).astype(int)
+        frame = conversion.analyze_batch(
+            visitors[0], conversions[0], visitors[1], conversions[1], confidence=90
+        )
+
+        assert len(frame) == 50
+        for i in range(50):
+            expected = conversion.analyze(
+                int(visitors[0, i]), int(conversions[0, i]),
+                int(visitors[1, i]), int(conversions[1, i]), confidence=90,
+            )
+            row = frame[i]
+            assert row.p_value == pytest.approx(expected.p_value, rel=1e-9, abs=1e-15)
+            assert row.confidence_interval_lower == pytest.approx(expected.confidence_interval_lower)
+            assert row.confidence_interval_upper == pytest.approx(expected.confidence_interval_upper)
+            assert row.lift_percent == pytest.approx(expected.lift_percent)
+            assert row.is_significant == expected.is_significant
+            assert row.winner == expected.winner
+            assert frame.result(i).recommendation == expected.recommendation
+
+    def test_magnitude_batch_matches_analyze(self, means_table):
+        mean1, std1, n1, mean2, std2, n2 = means_table
+        frame = magnitude.analyze_batch(n1, mean1, std1, n2, mean2, std2)
+
+        for i in range(len(frame)):
+            expected = magnitude.analyze(
+                int(n1[i]), mean1[i], std1[i], int(n2[i]), mean2[i], std2[i]
+            )
+            result = frame.result(i)
+            assert result.p_value == pytest.approx(expected.p_value, rel=1e-8, abs=1e-15)
+            assert result.confidence_interval_lower == pytest.approx(expected.confidence_interval_lower, rel=1e-7)
+            assert result.confidence_interval_upper == pytest.approx(expected.confidence_interval_upper, rel=1e-7)
+            assert result.winner == expected.winner
+            assert result.recommendation == expected.recommendation
+
+    def test_bayesian_batch_matches_analyze(self):
+        rng = np.random.default_rng(13)
+        visitors = rng.integers(100, 20_000, size=(2, 60))
+        conversions = (visitors * rng.uniform(0.0, 0.2, size=(2, 60))).astype(int)
+        conversions[:, :4] = [[0, 1, 2, 0], [0, 0, 5, 3]]  # steep posteriors take the scalar path
+        frame = bayesian.analyze_batch(visitors[0], conversions[0], visitors[1], conversions[1])
+
+        assert isinstance(frame, bayesian.BayesianResultsFrame)
+        for i in range(60):
+            expected = bayesian.analyze(
+                int(visitors[0, i]), int(conversions[0, i]),
+                int(visitors[1, i]), int(conversions[1, i]), num_samples=1_000, seed=i,
+            )
+            result = frame.result(i)
+            assert result.probability_variant_better == pytest.approx(expected.probability_variant_better, abs=1e-7)
+            assert result.expected_loss_choosing_control == pytest.approx(
+                expected.expected_loss_choosing_control, rel=1e-7, abs=1e-8)
+            assert result.expected_loss_choosing_variant == pytest.approx(
+                expected.expected_loss_choosing_variant, rel=1e-7, abs=1e-8)
+            assert result.control_credible_interval == pytest.approx(expected.control_credible_interval)
+            assert result.variant_credible_interval == pytest.approx(expected.variant_credible_interval)
+            assert result.winner == expected.winner
+            assert frame[i].winner == expected.winner
+
+    def test_bayesian_batch_lift_interval_matches_sampling(self):
+        visitors = np.array([[129, 4_352, 3_670, 10_000], [18_948, 122, 19_369, 10_000]])
+        conversions = np.array([[5, 111, 23, 500], [1_511, 14, 1_455, 550]])
+        frame = bayesian.analyze_batch(visitors[0], conversions[0], visitors[1], conversions[1])
+
+        rng = np.random.default_rng(0)
+        for i in range(4):
+            control = rng.beta(conversions[0, i] + 1, visitors[0, i] - conversions[0, i] + 1, 1_000_000)
+            variant = rng.beta(conversions[1, i] + 1, visitors[1, i] - conversions[1, i] + 1, 1_000_000)
+            expected = np.percentile((variant - control) / control * 100, [2.5, 97.5])
+            width = expected[1] - expected[0]
+            assert frame.lift_credible_interval_lower[i] == pytest.approx(expected[0], abs=0.01 * width)
+            assert frame.lift_credible_interval_upper[i] == pytest.approx(expected[1], abs=0.01 * width)
+
+        recommendation = frame.result(3).recommendation
+        assert recommendation == bayesian._generate_recommendation(
+            prob_variant_better=frame.probability_variant_better[3] / 100,
+            prob_control_better=frame.probability_control_better[3] / 100,
+            loss_variant=frame.expected_loss_choosing_variant[3] / 100,
+            loss_control=frame.expected_loss_choosing_control[3] / 100,
+            control_rate=0.05, variant_rate=0.055, lift_percent=frame.lift_percent[3],
+            ci_lift=(frame.lift_credible_interval_lower[3], frame.lift_credible_interval_upper[3]),
+            has_winner=False, winner="none", confidence_threshold=0.95,
+        )
+
+    def test_columns_are_contiguous_and_exported_without_copy(self):
+        frame = conversion.analyze_batch(10_000, 500, [10_000, 10_000, 10_000], [500, 560, 620])
+
+        columns = frame.to_dict()
+        assert set(columns) == set(frame.columns)
+        for name, values in columns.items():
+            assert values.flags.c_contiguous
+            assert values.shape == (3,)
+            assert values is frame.column(name)
+        assert np.shares_memory(columns["p_value"], frame.p_value)
+
+    def test_slicing_and_masks(self):
+        frame = conversion.analyze_batch(10_000, 500, [10_000] * 4, [500, 560, 620, 700])
+
+        head = frame[:2]
+        assert isinstance(head, conversion.ConversionResultsFrame)
+        assert len(head) == 2
+        assert np.shares_memory(head.p_value, frame.p_value)
+
+        significant = frame[frame.is_significant]
+        assert len(significant) == int(frame.is_significant.sum())
+        assert frame[-1].variant_conversions == 700
+        assert [row.variant_conversions for row in frame] == [500, 560, 620, 700]
+        with pytest.raises(IndexError):
+            frame[4]
+
+    def test_batch_validation_strict(self):
+        with pytest.raises(ValueError, match="cannot exceed"):
+            conversion.analyze_batch([100, 100], [10, 200], 100, 10, strict=True)
+        with pytest.raises(ValueError, match="positive"):
+            magnitude.analyze_batch([0, 10], 5.0, 1.0, 10, 5.0, 1.0, strict=True)
+        with pytest.raises(ValueError, match="cannot be negative"):
+            magnitude.analyze_batch(10, 5.0, [1.0, -1.0], 10, 5.0, 1.0, strict=True)
+        with pytest.raises(ValueError, match="cannot exceed"):
+            bayesian.analyze_batch([100, 100], [10, 200], 100, 10, strict=True)
+
+    def test_invalid_rows_do_not_abort_the_batch(self):
+        frames_ = [
+            conversion.analyze_batch([1000, 1000], [50, 2000], [1000, 1000], [60, 60]),
+            bayesian.analyze_batch([1000, 1000], [50, 2000], [1000, 1000], [60, 60]),
+            magnitude.analyze_batch([1000, 0], 50.0, 10.0, 1000, [52.0, 52.0], 10.0),
+        ]
+        for frame in frames_:
+            assert list(frame.validation.invalid_indices) == [1]
+            assert frame.winner[1] == "invalid"
+            assert frame.winner[0] != "invalid"
+            with pytest.raises(ValueError, match="invalid inputs"):
+                frame.result(1)
+
+        conv, bayes, mag = frames_
+        assert conv.p_value[0] == pytest.approx(conversion.analyze(1000, 50, 1000, 60).p_value)
+        assert np.isnan(conv.p_value[1]) and np.isnan(conv.confidence_interval_lower[1])
+        assert not conv.is_significant[1]
+        assert np.isnan(bayes.probability_variant_better[1])
+        assert np.isnan(mag.lift_percent[1])
+        assert conversion.analyze_batch(1000, 50, 1000, 60).validation.is_valid
+
+
+class TestArrayValidation:
+    """Array validators report every bad row instead of raising on the first."""
+
+    def test_visitors_report(self):
+        report = validation.validate_visitors_array(
+            [100, 0, 50, 100, np.nan], [10, 0, 60, -1, 5]
+        )
+        assert not report.is_valid
+        assert report.n_rows == 5
+        assert list(report.issues["visitors must be positive"]) == [1]
+        assert list(report.issues["conversions cannot exceed visitors"]) == [2]
+        assert list(report.issues["conversions cannot be negative"]) == [3]
+        assert list(report.issues["visitors cannot be NaN"]) == [4]
+        assert list(report.invalid_indices) == [1, 2, 3, 4]
+        assert list(report.valid_mask) == [True, False, False, False, False]
+
+    def test_agrees_with_scalar_validator(self):
+        rng = np.random.default_rng(5)
+        visitors = rng.integers(-5, 50, size=500)
+        conversions = rng.integers(-5, 60, size=500)
+        report = validation.validate_visitors_array(visitors, conversions)
+
+        for i in range(500):
+            try:
+                validation.validate_visitors(int(visitors[i]), int(conversions[i]))
+                scalar_valid = True
+            except ValueError:
+                scalar_valid = False
+            assert report.valid_mask[i] == scalar_valid
+
+    def test_rates_and_finite(self):
+        report = validation.validate_rate_array([0.0, 1.0, -0.1, 1.5, np.inf, np.nan])
+        assert list(report.issues["rate must be between 0 and 1"]) == [2, 3]
+        assert list(report.issues["rate cannot be infinity"]) == [4]
+        assert list(report.issues["rate cannot be NaN"]) == [5]
+
+        assert validation.validate_finite_array(np.arange(10)).is_valid
+        with pytest.raises(TypeError):
+            validation.validate_finite_array(["a", "b"])
+
+    def test_small_samples_are_warnings(self):
+        report = validation.validate_sample_size_array([10, 100, 0])
+        assert list(report.invalid_indices) == [2]
+        assert list(report.warnings["sample_size is below the recommended minimum of 30"]) == [0]
+        assert validation.validate_sample_size_array([10], min_recommended=None).warnings == {}
+
+    def test_summary_and_raise(self):
+        report = validation.validate_rate_array(np.full(10, 2.0), name="p")
+        assert "p must be between 0 and 1: 10 rows [0, 1, 2, 3, 4, ...]" in report.summary()
+        with pytest.raises(ValueError, match="10 of 10 rows are invalid"):
+            report.raise_if_invalid()
+
+        clean = validation.validate_rate_array([0.1, 0.2])
+        clean.raise_if_invalid()
+        assert clean.summary() == "All 2 rows are valid"
+
+    def test_merge(self):
+        a = validation.validate_rate_array([2.0, 0.5, 0.5])
+        b = validation.validate_rate_array([0.5, 0.5, 3.0])
+        merged = a.merge(b)
+        assert list(merged.issues["rate must be between 0 and 1"]) == [0, 2]
+        with pytest.raises(ValueError):
+            a.merge(validation.validate_rate_array([0.5]))
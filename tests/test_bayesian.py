@@ -386,3 +386,560 @@ class TestBayesianStatisticalProperties:
             assert result.expected_loss_choosing_variant <= result.expected_loss_choosing_control
         else:
             assert result.expected_loss_choosing_control <= result.expected_loss_choosing_variant
+
+
+class TestProbabilityMethods:
+    """Deterministic evaluation of P(variant > control)."""
+
+    @pytest.mark.parametrize("params", [
+        (501, 9501, 551, 9451),
+        (1, 1, 1, 1),
+        (3, 7, 5, 2),
+        (11, 990, 1, 1000),
+        (2.5, 3.5, 4.5, 1.5),
+        (1.5, 9.5, 3.5, 7.5),
+    ])
+    def test_exact_and_quadrature_agree(self, params):
+        from abverdict.methods.bayesian import _probability_b_beats_a
+
+        quadrature = _probability_b_beats_a(*params, method="quadrature")
+        if any(float(p).is_integer() for p in params):
+            assert _probability_b_beats_a(*params, method="exact") == pytest.approx(quadrature, abs=1e-9)
+        assert 0.0 <= quadrature <= 1.0
+
+    def test_known_values(self):
+        from abverdict.methods.bayesian import _probability_b_beats_a
+
+        # Uniform posteriors are symmetric; Beta(2,1) vs Beta(1,1): P = 2/3
+        assert _probability_b_beats_a(1, 1, 1, 1, method="exact") == pytest.approx(0.5)
+        assert _probability_b_beats_a(1, 1, 2, 1, method="exact") == pytest.approx(2 / 3)
+
+    def test_normal_approximation_for_large_counts(self):
+        from abverdict.methods.bayesian import _probability_b_beats_a, _select_probability_method
+
+        params = (50_001, 950_001, 50_501, 949_501)
+        assert _select_probability_method(*params) == "normal"
+        assert _probability_b_beats_a(*params) == pytest.approx(
+            _probability_b_beats_a(*params, method="quadrature"), abs=1e-5
+        )
+
+    def test_auto_selection(self):
+        from abverdict.methods.bayesian import _select_probability_method
+
+        assert _select_probability_method(501, 9501, 551, 9451) == "exact"
+        assert _select_probability_method(1.5, 9.5, 3.5, 7.5) == "quadrature"
+        assert _select_probability_method(3001, 97001, 3101, 96901) == "quadrature"
+
+    def test_analyze_is_deterministic_and_matches_monte_carlo(self):
+        first = analyze(10000, 500, 10000, 550)
+        second = analyze(10000, 500, 10000, 550)
+        assert first.probability_variant_better == second.probability_variant_better
+
+        sampled = analyze(10000, 500, 10000, 550, probability_method="monte_carlo")
+        assert sampled.probability_variant_better == pytest.approx(first.probability_variant_better, abs=0.5)
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError, match="method"):
+            analyze(1000, 50, 1000, 60, probability_method="simpson")
+
+
+class TestSharedPosteriorDraws:
+    """All Monte Carlo metrics come from one chunked posterior draw."""
+
+    def test_draw_reductions_match_full_arrays(self):
+        import numpy as np
+        from abverdict.methods.bayesian import _draw_pair
+
+        draws = _draw_pair(51, 951, 61, 941, num_samples=10_000, chunk_size=10_000, seed=3)
+        rng = np.random.default_rng(3)
+        a = rng.beta(51, 951, 10_000)
+        b = rng.beta(61, 941, 10_000)
+
+        assert draws.probability_b_better == np.mean(b > a)
+        assert draws.loss_choosing_a == pytest.approx(np.mean(np.maximum(0, b - a)), rel=1e-12)
+        assert draws.loss_choosing_b == pytest.approx(np.mean(np.maximum(0, a - b)), rel=1e-9)
+        np.testing.assert_allclose(draws.lift_percent, (b - a) / a * 100)
+
+    def test_chunking_covers_every_sample(self):
+        from abverdict.methods.bayesian import _draw_pair
+
+        draws = _draw_pair(51, 951, 61, 941, num_samples=1_001, chunk_size=100)
+        assert draws.lift_percent.shape == (1_001,)
+        assert (draws.lift_percent != 0).all()
+        assert 0 < draws.probability_b_better < 1
+
+    def test_num_samples(self):
+        result = analyze(1000, 50, 1000, 60, num_samples=2_000, probability_method="monte_carlo")
+        assert 0 < result.probability_variant_better < 100
+        assert result.lift_credible_interval[0] < result.lift_credible_interval[1]
+
+        with pytest.raises(ValueError, match="num_samples"):
+            analyze(1000, 50, 1000, 60, num_samples=0)
+
+    def test_monte_carlo_metrics_are_consistent(self):
+        result = analyze(10000, 500, 10000, 900, probability_method="monte_carlo", num_samples=5_000)
+        # Every draw favours the variant, so choosing it can lose nothing
+        assert result.probability_variant_better == 100
+        assert result.expected_loss_choosing_variant == 0
+        assert result.lift_credible_interval[0] > 0
+
+
+class TestSeeding:
+    """Monte Carlo paths are reproducible given a seed."""
+
+    def test_same_seed_same_result(self):
+        kwargs = dict(probability_method="monte_carlo", num_samples=5_000)
+        first = analyze(1000, 50, 1000, 60, seed=42, **kwargs)
+        second = analyze(1000, 50, 1000, 60, seed=42, **kwargs)
+        other = analyze(1000, 50, 1000, 60, seed=43, **kwargs)
+
+        assert first == second
+        assert first.lift_credible_interval != other.lift_credible_interval
+
+    def test_default_is_deterministic_without_sampling(self):
+        first = analyze(1000, 50, 1000, 60)
+        second = analyze(1000, 50, 1000, 60)
+
+        assert first == second
+        assert first.monte_carlo_samples == 0
+        assert first.monte_carlo_error == {}
+        sampled = analyze(1000, 50, 1000, 60, num_samples=1_000_000, seed=0)
+        assert first.lift_credible_interval == pytest.approx(sampled.lift_credible_interval, abs=0.5)
+
+    @pytest.mark.parametrize("counts", [(100, 0, 100, 0), (100, 1, 100, 3), (1000, 0, 1000, 5), (20, 19, 20, 20)])
+    def test_low_count_lift_interval_matches_sampling(self, counts):
+        from abverdict.methods.bayesian import BayesianState, analyze_batch
+
+        exact = analyze(*counts).lift_credible_interval
+        sampled = analyze(*counts, num_samples=2_000_000, seed=0).lift_credible_interval
+        assert exact == pytest.approx(sampled, rel=0.01)
+        assert BayesianState(*counts).credible_intervals()["lift"] == pytest.approx(exact)
+        batch = analyze_batch(*([value] for value in counts))
+        assert batch.result(0).lift_credible_interval == pytest.approx(exact)
+
+    def test_multi_accepts_generator(self):
+        import numpy as np
+        from abverdict.methods.bayesian import analyze_multi
+
+        variants = [
+            {"name": "a", "visitors": 1000, "conversions": 50},
+            {"name": "b", "visitors": 1000, "conversions": 60},
+            {"name": "c", "visitors": 1000, "conversions": 55},
+        ]
+        kwargs = dict(num_samples=5_000, probability_method="monte_carlo")
+        first = analyze_multi(variants, seed=np.random.default_rng(7), **kwargs)
+        second = analyze_multi(variants, seed=7, **kwargs)
+        assert first.probabilities_best == second.probabilities_best
+        assert first.expected_losses == second.expected_losses
+
+    def test_spawned_streams(self):
+        from abverdict.utils.rng import make_rng, spawn_rngs
+
+        streams = spawn_rngs(11, 3)
+        again = spawn_rngs(11, 3)
+        draws = [rng.random(4) for rng in streams]
+        assert all((d == rng.random(4)).all() for d, rng in zip(draws, again))
+        assert len({tuple(d) for d in draws}) == 3
+
+        rng = make_rng(5)
+        assert make_rng(rng) is rng
+        assert rng.bit_generator.__class__.__name__ == "PCG64"
+        assert len(spawn_rngs(rng, 2)) == 2
+
+    def test_invalid_seed(self):
+        from abverdict.utils.rng import make_rng
+
+        with pytest.raises(TypeError):
+            make_rng("42")
+        with pytest.raises(ValueError):
+            make_rng(-1)
+
+
+class TestAnalyticExpectedLoss:
+    """Closed-form E[max(0, B - A)] for Beta posteriors."""
+
+    @pytest.mark.parametrize("params", [
+        (501, 9501, 551, 9451),
+        (1.5, 9.5, 3.5, 7.5),
+        (11, 990, 1, 1000),
+        (50_001, 950_001, 50_501, 949_501),
+    ])
+    def test_matches_monte_carlo(self, params):
+        from abverdict.methods.bayesian import _draw_pair, _expected_loss
+
+        draws = _draw_pair(*params, num_samples=1_000_000, seed=1)
+        loss_a, loss_b = _expected_loss(*params)
+        assert loss_a == pytest.approx(draws.loss_choosing_a, rel=0.02, abs=1e-6)
+        assert loss_b == pytest.approx(draws.loss_choosing_b, rel=0.02, abs=1e-6)
+
+    def test_known_value_and_identity(self):
+        from abverdict.methods.bayesian import _expected_loss
+
+        # Two Beta(2, 2): E[max(0, B - A)] = 9/70
+        loss_a, loss_b = _expected_loss(2, 2, 2, 2)
+        assert loss_a == pytest.approx(9 / 70)
+        assert loss_b == pytest.approx(9 / 70)
+
+        # loss_a - loss_b = E[B] - E[A]
+        loss_a, loss_b = _expected_loss(51, 951, 61, 941, method="exact")
+        assert loss_a - loss_b == pytest.approx(61 / 1002 - 51 / 1002)
+
+    def test_analyze_multi_two_arms_matches_analyze(self):
+        from abverdict.methods.bayesian import analyze_multi
+
+        two = analyze_multi([
+            {"name": "control", "visitors": 10000, "conversions": 500},
+            {"name": "variant", "visitors": 10000, "conversions": 550},
+        ])
+        single = analyze(10000, 500, 10000, 550)
+        assert two.probabilities_best["variant"] == pytest.approx(single.probability_variant_better)
+        assert two.expected_losses["variant"] == pytest.approx(single.expected_loss_choosing_variant)
+        assert two.expected_losses["control"] == pytest.approx(single.expected_loss_choosing_control)
+
+
+class TestProbabilityBest:
+    """k-arm P(best) and expected loss without a k x N sample matrix."""
+
+    ARMS = [(51, 951), (61, 941), (56, 946), (9001, 160001)]
+
+    def test_quadrature_matches_monte_carlo(self):
+        from abverdict.methods.bayesian import _best_arm_monte_carlo, _best_arm_quadrature
+
+        probs, losses = _best_arm_quadrature(self.ARMS)
+        mc_probs, mc_losses, _, _ = _best_arm_monte_carlo(self.ARMS, num_samples=400_000, seed=2)
+
+        assert probs.sum() == pytest.approx(1.0, abs=1e-9)
+        assert probs == pytest.approx(mc_probs, abs=5e-3)
+        assert losses == pytest.approx(mc_losses, rel=0.02, abs=1e-5)
+
+    def test_monte_carlo_matches_full_matrix(self):
+        import numpy as np
+        from abverdict.methods.bayesian import _best_arm_monte_carlo
+
+        probs, losses, drawn, _ = _best_arm_monte_carlo(self.ARMS, num_samples=3_000, chunk_size=1_000, seed=4)
+        assert drawn == 3_000
+
+        # Reference: the original k x N formulation with per-arm deletion
+        rng = np.random.default_rng(4)
+        chunks = []
+        for _ in range(3):
+            chunks.append(np.vstack([rng.beta(a, b, 1_000) for a, b in self.ARMS]))
+        matrix = np.hstack(chunks)
+        expected_probs = np.bincount(np.argmax(matrix, axis=0), minlength=4) / 3_000
+        expected_losses = [
+            np.mean(np.maximum(0, np.delete(matrix, i, axis=0).max(axis=0) - matrix[i]))
+            for i in range(4)
+        ]
+        assert probs == pytest.approx(expected_probs)
+        assert losses == pytest.approx(expected_losses, abs=1e-12)
+
+    def test_symmetric_arms(self):
+        from abverdict.methods.bayesian import _best_arm_quadrature
+
+        probs, losses = _best_arm_quadrature([(2, 2)] * 3)
+        assert probs == pytest.approx([1 / 3] * 3, abs=1e-9)
+        assert losses[0] == pytest.approx(losses[2])
+
+    def test_twenty_arms(self):
+        import numpy as np
+        from abverdict.methods.bayesian import analyze_multi
+
+        rng = np.random.default_rng(9)
+        visitors = rng.integers(5_000, 20_000, size=20)
+        variants = [
+            {"name": f"v{i}", "visitors": int(n), "conversions": int(c)}
+            for i, (n, c) in enumerate(zip(visitors, rng.binomial(visitors, 0.05)))
+        ]
+        result = analyze_multi(variants, explain=False)
+        assert sum(result.probabilities_best.values()) == pytest.approx(100, abs=1e-6)
+        best = result.best_variant
+        assert result.expected_losses[best] == min(result.expected_losses.values())
+
+
+class TestAdaptiveMonteCarlo:
+    """mc_tolerance stops sampling once every sampled field is precise enough."""
+
+    def test_reported_errors_match_spread_across_seeds(self):
+        import numpy as np
+        from abverdict.methods.bayesian import _draw_pair
+
+        runs = [_draw_pair(51, 951, 61, 941, num_samples=4_000, seed=seed) for seed in range(200)]
+        reported = [r.standard_errors() for r in runs]
+        observed = {
+            "probability_variant_better": np.std([100 * r.probability_b_better for r in runs]),
+            "expected_loss_choosing_control": np.std([100 * r.loss_choosing_a for r in runs]),
+            "expected_loss_choosing_variant": np.std([100 * r.loss_choosing_b for r in runs]),
+            "lift_credible_interval_lower": np.std([np.percentile(r.lift_percent, 2.5) for r in runs]),
+            "lift_credible_interval_upper": np.std([np.percentile(r.lift_percent, 97.5) for r in runs]),
+        }
+        for name, spread in observed.items():
+            assert np.mean([r[name] for r in reported]) == pytest.approx(spread, rel=0.2), name
+
+    def test_clear_cut_stops_early(self):
+        result = analyze(
+            10000, 500, 10000, 900, probability_method="monte_carlo",
+            mc_tolerance=0.5, num_samples=1_000_000, seed=1,
+        )
+        assert result.monte_carlo_samples < 100_000
+        assert set(result.monte_carlo_error) == {
+            "probability_variant_better",
+            "expected_loss_choosing_control",
+            "expected_loss_choosing_variant",
+            "lift_credible_interval_lower",
+            "lift_credible_interval_upper",
+        }
+        assert max(result.monte_carlo_error.values()) <= 0.5
+
+    def test_close_calls_draw_more(self):
+        from abverdict.methods.bayesian import analyze_multi
+
+        def samples_needed(conversions):
+            result = analyze_multi(
+                [{"name": f"v{i}", "visitors": 1000, "conversions": c} for i, c in enumerate(conversions)],
+                probability_method="monte_carlo", mc_tolerance=0.5, num_samples=1_000_000, seed=3,
+            )
+            assert max(result.monte_carlo_error.values()) <= 0.5
+            return result.monte_carlo_samples
+
+        assert samples_needed([50, 52, 51]) > samples_needed([50, 120, 40])
+
+    def test_cap_and_fixed_mode(self):
+        capped = analyze(10000, 500, 10000, 520, mc_tolerance=1e-6, num_samples=10_000, seed=1)
+        assert capped.monte_carlo_samples == 10_000
+
+        fixed = analyze(10000, 500, 10000, 520, num_samples=7_000, seed=1)
+        assert fixed.monte_carlo_samples == 7_000
+        assert set(fixed.monte_carlo_error) == {"lift_credible_interval_lower", "lift_credible_interval_upper"}
+
+        with pytest.raises(ValueError, match="mc_tolerance"):
+            analyze(1000, 50, 1000, 60, mc_tolerance=0)
+
+
+class TestQuasiMonteCarlo:
+    """sampler="qmc" maps scrambled Sobol points through the Beta inverse CDF."""
+
+    def test_lift_interval_matches_reference_with_fewer_points(self):
+        reference = analyze(10000, 500, 10000, 550, num_samples=2 ** 18, sampler="qmc", seed=0)
+        result = analyze(10000, 500, 10000, 550, sampler="qmc", seed=1)
+        assert result.monte_carlo_samples == 16_384
+        for got, expected in zip(result.lift_credible_interval, reference.lift_credible_interval):
+            assert got == pytest.approx(expected, abs=0.15)
+        assert max(result.monte_carlo_error.values()) < 0.1
+
+    def test_points_are_power_of_two_replicates_within_cap(self):
+        result = analyze(1000, 50, 1000, 60, num_samples=10_000, sampler="qmc", seed=1)
+        assert result.monte_carlo_samples == 8_192
+
+    def test_seeded_runs_repeat(self):
+        first = analyze(1000, 50, 1000, 60, sampler="qmc", seed=5)
+        second = analyze(1000, 50, 1000, 60, sampler="qmc", seed=5)
+        other = analyze(1000, 50, 1000, 60, sampler="qmc", seed=6)
+        assert first.lift_credible_interval == second.lift_credible_interval
+        assert first.lift_credible_interval != other.lift_credible_interval
+
+    def test_adaptive_qmc_meets_tolerance(self):
+        result = analyze(
+            10000, 500, 10000, 550, probability_method="monte_carlo", sampler="qmc",
+            mc_tolerance=0.05, num_samples=1_000_000, seed=1,
+        )
+        assert result.monte_carlo_samples < 1_000_000
+        assert max(result.monte_carlo_error.values()) <= 0.05
+        exact = analyze(10000, 500, 10000, 550)
+        assert result.probability_variant_better == pytest.approx(exact.probability_variant_better, abs=0.2)
+
+    def test_multi_arm_qmc_matches_quadrature(self):
+        from abverdict.methods.bayesian import analyze_multi
+
+        variants = [{"name": f"v{i}", "visitors": 1000, "conversions": c} for i, c in enumerate([50, 60, 55])]
+        exact = analyze_multi(variants)
+        sampled = analyze_multi(variants, probability_method="monte_carlo", sampler="qmc", seed=2)
+        assert sampled.monte_carlo_samples == 16_384
+        assert set(sampled.monte_carlo_error) == {"probabilities_best", "expected_losses"}
+        for name in exact.probabilities_best:
+            assert sampled.probabilities_best[name] == pytest.approx(exact.probabilities_best[name], abs=0.5)
+            assert sampled.expected_losses[name] == pytest.approx(exact.expected_losses[name], abs=0.01)
+
+    def test_unknown_sampler(self):
+        with pytest.raises(ValueError, match="sampler"):
+            analyze(1000, 50, 1000, 60, sampler="sobol")
+
+
+class TestContinuousModels:
+    """Conjugate models for continuous metrics, from n / mean / std."""
+
+    def test_normal_matches_posterior_sampling(self):
+        import numpy as np
+        from scipy import stats
+        from abverdict.methods.bayesian import analyze_continuous
+
+        result = analyze_continuous(400, 50.0, 30.0, 300, 53.0, 20.0)
+
+        rng = np.random.default_rng(0)
+        control = stats.t(399, 50.0, 30.0 / np.sqrt(400)).rvs(1_000_000, random_state=rng)
+        variant = stats.t(299, 53.0, 20.0 / np.sqrt(300)).rvs(1_000_000, random_state=rng)
+        diff = variant - control
+        assert result.probability_variant_better == pytest.approx(100 * np.mean(diff > 0), abs=0.2)
+        assert result.expected_loss_choosing_control == pytest.approx(np.maximum(diff, 0).mean(), rel=0.01)
+        assert result.expected_loss_choosing_variant == pytest.approx(np.maximum(-diff, 0).mean(), rel=0.02)
+        assert result.difference_credible_interval == pytest.approx(np.percentile(diff, [2.5, 97.5]), abs=0.02)
+        assert result.lift_credible_interval == pytest.approx(
+            100 * np.percentile(variant / control - 1, [2.5, 97.5]), abs=0.05
+        )
+
+        t = stats.t.ppf(0.975, 399)
+        assert result.control_credible_interval == pytest.approx((50 - t * 1.5, 50 + t * 1.5))
+
+    def test_lognormal_matches_log_scale_posterior(self):
+        import numpy as np
+        from abverdict.methods.bayesian import analyze_continuous
+
+        n_c, mean_c, std_c = 2000, 52.0, 60.0
+        n_v, mean_v, std_v = 2000, 55.0, 65.0
+        result = analyze_continuous(n_c, mean_c, std_c, n_v, mean_v, std_v, model="lognormal")
+
+        # Exact reference-prior posterior of exp(mu + sigma^2 / 2) on the log scale
+        rng = np.random.default_rng(1)
+
+        def posterior_means(n, mean, std, size=400_000):
+            sigma_sq = np.log1p((std / mean) ** 2)
+            mu = np.log(mean) - sigma_sq / 2
+            draws_sigma_sq = (n - 1) * sigma_sq / rng.chisquare(n - 1, size)
+            draws_mu = rng.normal(mu, np.sqrt(draws_sigma_sq / n))
+            return np.exp(draws_mu + draws_sigma_sq / 2)
+
+        control = posterior_means(n_c, mean_c, std_c)
+        variant = posterior_means(n_v, mean_v, std_v)
+        diff = variant - control
+        assert result.probability_variant_better == pytest.approx(100 * np.mean(diff > 0), abs=0.5)
+        assert result.expected_loss_choosing_control == pytest.approx(np.maximum(diff, 0).mean(), rel=0.03)
+        assert result.expected_loss_choosing_variant == pytest.approx(np.maximum(-diff, 0).mean(), rel=0.05)
+        assert result.difference_credible_interval == pytest.approx(np.percentile(diff, [2.5, 97.5]), abs=0.1)
+        assert result.lift_credible_interval == pytest.approx(
+            100 * np.percentile(variant / control - 1, [2.5, 97.5]), abs=0.2
+        )
+
+    def test_prior_strength_shrinks_toward_prior_mean(self):
+        from abverdict.methods.bayesian import analyze_continuous
+
+        flat = analyze_continuous(20, 10.0, 4.0, 20, 14.0, 4.0)
+        shrunk = analyze_continuous(20, 10.0, 4.0, 20, 14.0, 4.0, prior_mean=12.0, prior_strength=20)
+        assert shrunk.probability_variant_better < flat.probability_variant_better
+        assert shrunk.control_credible_interval[0] > flat.control_credible_interval[0]
+        assert shrunk.variant_credible_interval[1] < flat.variant_credible_interval[1]
+
+    def test_prior_strength_matches_posterior_sampling(self):
+        import numpy as np
+        from abverdict.methods.bayesian import analyze_continuous
+
+        n, mean, std, prior_mean, prior_strength = 8, 10.0, 4.0, 12.0, 5.0
+        result = analyze_continuous(n, mean, std, n, 14.0, std, prior_mean=prior_mean, prior_strength=prior_strength)
+
+        # Reference-prior posterior draws, reweighted by the prior on the mean
+        rng = np.random.default_rng(2)
+        sigma_sq = (n - 1) * std ** 2 / rng.chisquare(n - 1, 2_000_000)
+        mu = rng.normal(mean, np.sqrt(sigma_sq / n))
+        weights = np.exp(-0.5 * np.log(sigma_sq) - prior_strength * (mu - prior_mean) ** 2 / (2 * sigma_sq))
+        order = np.argsort(mu)
+        cumulative = np.cumsum(weights[order]) / weights.sum()
+        expected = mu[order][np.searchsorted(cumulative, [0.025, 0.975])]
+        assert result.control_credible_interval == pytest.approx(expected, abs=0.03)
+
+    def test_lift_undefined_near_zero(self):
+        import math
+        from abverdict.methods.bayesian import analyze_continuous
+
+        result = analyze_continuous(50, 0.1, 5.0, 50, 0.5, 5.0, explain=False)
+        assert all(math.isnan(x) for x in result.lift_credible_interval)
+        assert result.difference_credible_interval[0] < 0.4 < result.difference_credible_interval[1]
+        assert result.recommendation == ""
+
+    def test_decision_and_recommendation(self):
+        from abverdict.methods.bayesian import analyze_continuous
+
+        result = analyze_continuous(5000, 52.0, 38.0, 5000, 54.1, 40.0)
+        assert result.has_winner and result.winner == "variant"
+        assert result.expected_loss_choosing_variant < result.expected_loss_choosing_control
+        assert "Variant Wins" in result.recommendation
+
+    @pytest.mark.parametrize("kwargs, message", [
+        ({"control_visitors": 2}, "at least 3"),
+        ({"control_std": 0}, "Standard deviation"),
+        ({"model": "gamma"}, "model"),
+        ({"model": "lognormal", "control_mean": -1.0}, "positive"),
+        ({"model": "lognormal", "prior_strength": 1}, "prior_strength"),
+    ])
+    def test_invalid_inputs(self, kwargs, message):
+        from abverdict.methods.bayesian import analyze_continuous
+
+        args = dict(control_visitors=100, control_mean=10.0, control_std=3.0,
+                    variant_visitors=100, variant_mean=11.0, variant_std=3.0)
+        args.update(kwargs)
+        with pytest.raises(ValueError, match=message):
+            analyze_continuous(**args)
+
+
+class TestBayesianState:
+    """Incremental posteriors with cached derived quantities."""
+
+    def test_updates_match_analyze(self):
+        from abverdict.methods.bayesian import BayesianState
+
+        state = BayesianState()
+        for delta in [(5000, 240, 5000, 270), (3000, 160, 3000, 150), (2000, 100, 2000, 130)]:
+            state.update(*delta)
+        result = state.result()
+        expected = analyze(10000, 500, 10000, 550, num_samples=1_000_000, seed=0)
+
+        assert result.probability_variant_better == pytest.approx(expected.probability_variant_better, abs=1e-7)
+        assert result.expected_loss_choosing_control == pytest.approx(expected.expected_loss_choosing_control, rel=1e-7)
+        assert result.expected_loss_choosing_variant == pytest.approx(expected.expected_loss_choosing_variant, rel=1e-7)
+        assert result.control_credible_interval == pytest.approx(expected.control_credible_interval)
+        assert result.variant_credible_interval == pytest.approx(expected.variant_credible_interval)
+        assert result.lift_credible_interval == pytest.approx(expected.lift_credible_interval, abs=0.1)
+        assert result.winner == expected.winner
+        assert result.recommendation
+
+    def test_exact_cache_reuses_only_unchanged_posteriors(self):
+        from abverdict.methods.bayesian import BayesianState
+
+        state = BayesianState(10000, 500, 10000, 550)
+        first = state.result()
+        misses = state.cache_info()["misses"]
+        assert state.result() == first
+        assert state.cache_info()["misses"] == misses
+
+        # Only the variant changed: the control interval is still cached
+        state.update(variant_visitors=100, variant_conversions=6)
+        state.credible_intervals()
+        assert state.cache_info()["misses"] == misses + 2
+        assert state.probability_variant_better() != first.probability_variant_better
+
+    def test_tolerance_bounds_staleness(self):
+        from abverdict.methods.bayesian import BayesianState
+
+        state = BayesianState(10000, 500, 10000, 550, tolerance=0.1)
+        cached = state.probability_variant_better()
+
+        state.update(200, 10, 200, 11)  # moves each posterior by well under 0.1 SD
+        assert state.probability_variant_better() == cached
+        fresh = BayesianState(10200, 510, 10200, 561).probability_variant_better()
+        assert fresh == pytest.approx(cached, abs=1.0)
+
+        state.update(5000, 200, 5000, 320)  # far outside the tolerance
+        assert state.probability_variant_better() == pytest.approx(
+            BayesianState(15200, 710, 15200, 881).probability_variant_better()
+        )
+
+    def test_invalid_updates(self):
+        from abverdict.methods.bayesian import BayesianState
+
+        state = BayesianState(100, 5, 100, 6)
+        with pytest.raises(ValueError, match="negative"):
+            state.update(control_visitors=-1)
+        with pytest.raises(ValueError, match="cannot exceed"):
+            state.update(variant_conversions=200)
+        assert state.variant_conversions == 6
+        with pytest.raises(ValueError, match="positive"):
+            BayesianState().result()
+        with pytest.raises(ValueError, match="tolerance"):
+            BayesianState(tolerance=-1)
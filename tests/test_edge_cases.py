@@ -17,6 +17,12 @@ from abverdict.utils.math import (
     effect_size_cohens_d,
     welch_degrees_of_freedom,
     calculate_lift,
+    normal_cdf,
+    normal_sf,
+    normal_ppf,
+    t_cdf,
+    t_ppf,
+    chi2_sf_1df,
 )
 
 
@@ -887,6 +893,33 @@ class TestMathUtilEdgeCases:
         assert absolute == 10
         assert relative == np.inf or np.isnan(relative) or relative > 0
 
+    def test_scalar_distribution_functions_match_scipy(self):
+        """Fast scalar paths agree with scipy.stats."""
+        from scipy.stats import norm, t, chi2
+        for x in [-8.5, -3.0, -1.96, 0.0, 0.5, 2.576, 10.0]:
+            assert normal_cdf(x) == pytest.approx(norm.cdf(x), rel=1e-12, abs=1e-300)
+            assert normal_sf(x) == pytest.approx(norm.sf(x), rel=1e-12, abs=1e-300)
+            for df in [1, 4.5, 30, 1e6]:
+                assert t_cdf(x, df) == pytest.approx(t.cdf(x, df), rel=1e-10, abs=1e-300)
+        for p in [1e-10, 0.025, 0.5, 0.8, 0.975]:
+            assert normal_ppf(p) == pytest.approx(norm.ppf(p), rel=1e-12)
+            assert t_ppf(p, 7.3) == pytest.approx(t.ppf(p, 7.3), rel=1e-10)
+        for x in [0.0, 0.3, 3.84, 50.0]:
+            assert chi2_sf_1df(x) == pytest.approx(chi2.sf(x, 1), rel=1e-10, abs=1e-300)
+
+    def test_distribution_functions_accept_arrays(self):
+        """Array inputs keep working through the ufunc path."""
+        x = np.array([-1.0, 0.0, 1.0])
+        assert normal_cdf(x) == pytest.approx([0.158655, 0.5, 0.841345], abs=1e-6)
+        assert normal_ppf(np.array([0.5])) == pytest.approx([0.0])
+        assert chi2_sf_1df(np.array([0.0, 3.841459])) == pytest.approx([1.0, 0.05], abs=1e-6)
+
+    def test_distribution_function_boundaries(self):
+        """Quantiles at 0 and 1 are infinite, outside [0, 1] undefined."""
+        assert normal_ppf(0.0) == -math.inf
+        assert normal_ppf(1.0) == math.inf
+        assert math.isnan(normal_ppf(1.5))
+
 
 class TestValidationEdgeCases:
     """Test validation function edge cases."""
@@ -0,0 +1,84 @@
+"""
+Import-time tests.
+
+``import abverdict`` must stay cheap: subpackages load lazily and scipy.stats
+is only imported inside the functions that need it. These tests run in fresh
+interpreters so earlier imports in the test session do not mask regressions.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import abverdict
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative ``-X importtime`` budget for ``import abverdict``, in microseconds.
+# The package itself imports only the standard library (~20ms), so this leaves
+# room for slow CI machines while still catching an eager numpy/scipy import
+# (over a second).
+IMPORT_BUDGET_US = 150_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+
+class TestLazyImports:
+    """Package imports defer numpy and scipy until first use."""
+
+    def test_import_does_not_load_numpy_or_scipy(self):
+        result = _run(
+            "import sys, abverdict\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in ('numpy', 'scipy')))"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_analysis_modules_do_not_load_scipy_stats(self):
+        result = _run(
+            "import sys\n"
+            "from abverdict.effects.outcome import conversion, magnitude, timing\n"
+            "from abverdict.methods import bayesian, msprt, sequential\n"
+            "from abverdict.diagnostics import srm, health, novelty\n"
+            "from abverdict.segments import analysis\n"
+            "from abverdict.business import impact, guardrails\n"
+            "from abverdict.planning import mde, duration\n"
+            "print('scipy.stats' in sys.modules)"
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_import_time_budget(self):
+        result = _run("import abverdict", "-X", "importtime")
+        cumulative = None
+        for line in result.stderr.splitlines():
+            fields = [f.strip() for f in line.split("|")]
+            if len(fields) == 3 and fields[2] == "abverdict":
+                cumulative = int(fields[1])
+        assert cumulative is not None
+        assert cumulative < IMPORT_BUDGET_US
+
+    def test_lazy_attributes_resolve(self):
+        from abverdict.effects.outcome import conversion
+        from abverdict.diagnostics.srm import check_sample_ratio
+
+        assert abverdict.conversion is conversion
+        assert abverdict.diagnostics.check_sample_ratio is check_sample_ratio
+        assert "bayesian" in dir(abverdict.methods)
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            abverdict.not_a_module
@@ -0,0 +1,133 @@
+"""
+Tests for the always-valid mSPRT engines.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from abverdict.methods.msprt import MeanMSPRT, MSPRTResult, ProportionMSPRT, summarize
+
+
+class TestProportionMSPRT:
+    """Tests for the two-proportion engine."""
+
+    def test_empty_state(self):
+        result = ProportionMSPRT().result()
+        assert isinstance(result, MSPRTResult)
+        assert result.p_value == 1.0
+        assert result.confidence_lower == -math.inf
+        assert result.confidence_upper == math.inf
+        assert result.decision == "keep_running"
+        assert not result.can_stop
+
+    def test_matches_closed_form(self):
+        test = ProportionMSPRT(mixture_sd=0.01).update(10000, 500, 10000, 600)
+        variance = 0.05 * 0.95 / 10000 + 0.06 * 0.94 / 10000
+        tau2 = 0.01 ** 2
+        ratio = math.sqrt(variance / (variance + tau2)) * math.exp(
+            tau2 * 0.01 ** 2 / (2 * variance * (variance + tau2))
+        )
+        assert test.likelihood_ratio == pytest.approx(ratio)
+        assert test.p_value == pytest.approx(1 / ratio)
+
+    def test_clear_winner_stops(self):
+        test = ProportionMSPRT().update(20000, 1000, 20000, 1300)
+        result = test.result()
+        assert result.decision == "variant_wins"
+        assert result.can_stop
+        assert result.p_value <= 0.05
+        assert 0 < result.confidence_lower < result.difference < result.confidence_upper
+
+        flipped = ProportionMSPRT().update(20000, 1300, 20000, 1000).result()
+        assert flipped.decision == "control_wins"
+
+    def test_p_value_and_interval_are_running(self):
+        test = ProportionMSPRT().update(20000, 1000, 20000, 1300)
+        p_value, lower, upper = test.p_value, test.confidence_lower, test.confidence_upper
+        # Evidence against the variant afterwards cannot undo the earlier rejection
+        test.update(20000, 1300, 20000, 1000)
+        assert test.p_value == p_value
+        assert test.confidence_lower >= lower
+        assert test.confidence_upper <= upper
+
+    def test_batches_equal_totals(self):
+        batched = ProportionMSPRT()
+        for _ in range(10):
+            batched.update(1000, 50, 1000, 58)
+        once = ProportionMSPRT().update(10000, 500, 10000, 580)
+        assert batched.likelihood_ratio == pytest.approx(once.likelihood_ratio)
+
+    def test_type_one_error_under_continuous_monitoring(self):
+        rng = np.random.default_rng(7)
+        rejected = 0
+        for _ in range(300):
+            test = ProportionMSPRT(mixture_sd=0.01)
+            control = rng.binomial(200, 0.05, size=100)
+            variant = rng.binomial(200, 0.05, size=100)
+            for c, v in zip(control, variant):
+                test.update(200, int(c), 200, int(v))
+            rejected += test.decision != "keep_running"
+        assert rejected / 300 <= 0.06
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            ProportionMSPRT(mixture_sd=0)
+        with pytest.raises(ValueError):
+            ProportionMSPRT(alpha=1.5)
+        with pytest.raises(ValueError):
+            ProportionMSPRT().update(control_visitors=-1)
+        with pytest.raises(ValueError):
+            ProportionMSPRT().update(control_visitors=10, control_conversions=11)
+
+
+class TestMeanMSPRT:
+    """Tests for the two-mean engine."""
+
+    def test_raw_values_match_summaries(self):
+        rng = np.random.default_rng(3)
+        control, variant = rng.normal(50, 10, 400), rng.normal(52, 10, 400)
+
+        raw = MeanMSPRT(mixture_sd=2.0)
+        for c, v in zip(np.split(control, 4), np.split(variant, 4)):
+            raw.update(c, v)
+
+        summary = MeanMSPRT(mixture_sd=2.0).update_summary(
+            len(control), control.mean(), control.std(ddof=1),
+            len(variant), variant.mean(), variant.std(ddof=1),
+        )
+        assert raw.likelihood_ratio == pytest.approx(summary.likelihood_ratio)
+        assert raw.result().variant_mean == pytest.approx(variant.mean())
+
+    def test_detects_shift(self):
+        rng = np.random.default_rng(11)
+        test = MeanMSPRT(mixture_sd=2.0)
+        for _ in range(50):
+            test.update(rng.normal(50, 10, 100), rng.normal(53, 10, 100))
+        result = test.result()
+        assert result.decision == "variant_wins"
+        assert result.confidence_lower < 3 < result.confidence_upper
+
+    def test_needs_two_observations_per_arm(self):
+        test = MeanMSPRT(mixture_sd=1.0).update([1.0], [2.0, 3.0])
+        assert test.p_value == 1.0
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            MeanMSPRT(mixture_sd=1.0).update([1.0, float("nan")])
+        with pytest.raises(ValueError):
+            MeanMSPRT(mixture_sd=1.0).update_summary(control_count=10, control_std=-1.0)
+
+    def test_summarize(self):
+        test = MeanMSPRT(mixture_sd=2.0).update_summary(1000, 50.0, 10.0, 1000, 53.0, 10.0)
+        summary = summarize(test.result(), "Revenue Test")
+        assert "Revenue Test" in summary
+        assert "STOP - Variant Wins" in summary
+        assert "confidence sequence" in summary
+
+
+def test_base_engine_is_abstract():
+    from abverdict.methods.msprt import _MixtureSPRT
+
+    with pytest.raises(TypeError):
+        _MixtureSPRT(mixture_sd=1.0)
@@ -4,7 +4,12 @@ Tests for Planning Module.
 Tests MDE calculation and Duration recommendations.
 """
 
+import math
+
+import numpy as np
 import pytest
+from abverdict import conversion, magnitude, timing
+from abverdict.planning.grid import sample_size_grid
 from abverdict.planning.mde import (
     minimum_detectable_effect,
     MDEResult,
@@ -434,3 +439,62 @@ class TestPlanningIntegration:
         # Should be achievable
         assert mde.minimum_detectable_effect <= 15.0
         assert duration.recommended_days <= 21
+
+
+class TestSampleSizeGrid:
+    """Tests for the vectorized sample-size planner."""
+
+    def test_conversion_grid_matches_sample_size(self):
+        """Every cell equals the scalar conversion.sample_size result."""
+        baselines = np.array([0.02, 0.05, 0.1, 0.3])
+        lifts = np.array([-10, 5, 10, 25])
+        grid = sample_size_grid(baselines[:, None], lifts, confidence=[90, 95, 99, 95], power=80)
+
+        assert grid.shape == (4, 4)
+        for i, base in enumerate(baselines):
+            for j, lift in enumerate(lifts):
+                plan = conversion.sample_size(base, lift, confidence=[90, 95, 99, 95][j])
+                assert grid[i, j] == plan.visitors_per_variant
+
+    def test_conversion_multi_variant(self):
+        grid = sample_size_grid(0.05, 10, num_variants=[2, 3, 4])
+        for k, n in zip([2, 3, 4], grid):
+            assert n == conversion.sample_size(0.05, 10, num_variants=k).visitors_per_variant
+
+    def test_percentage_baseline(self):
+        assert sample_size_grid(5, 10) == sample_size_grid(0.05, 10)
+
+    def test_continuous_grid_matches_sample_size(self):
+        grid = sample_size_grid(
+            50.0, [2, 5, 10], power=[[80], [90]],
+            metric_type="continuous", baseline_std=20.0,
+        )
+        assert grid.shape == (2, 3)
+        for i, power in enumerate([80, 90]):
+            for j, lift in enumerate([2, 5, 10]):
+                plan = magnitude.sample_size(50.0, 20.0, lift, power=power)
+                assert grid[i, j] == plan.visitors_per_variant
+
+    def test_timing_grid_matches_sample_size(self):
+        lifts = np.array([-30, -20, 25])
+        grid = sample_size_grid(10.0, lifts, metric_type="timing", dropout_rate=0.2)
+        for j, lift in enumerate(lifts):
+            plan = timing.sample_size(10.0, 10.0 * (1 + lift / 100), dropout_rate=0.2)
+            assert grid[j] == plan.subjects_per_group
+
+    def test_undefined_cells_are_nan(self):
+        """Cells where sample_size would raise are NaN, not errors."""
+        grid = sample_size_grid([0.05, 0.6, 0.0], [0, 100, 10])
+        assert all(math.isnan(v) for v in grid)
+
+        timing_grid = sample_size_grid(10.0, [0, 20], metric_type="timing")
+        assert math.isnan(timing_grid[0])
+        assert not math.isnan(timing_grid[1])
+
+    def test_continuous_requires_std(self):
+        with pytest.raises(ValueError, match="baseline_std"):
+            sample_size_grid(50.0, 5, metric_type="continuous")
+
+    def test_invalid_metric_type(self):
+        with pytest.raises(ValueError, match="metric_type"):
+            sample_size_grid(0.05, 10, metric_type="ratio")
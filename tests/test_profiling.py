@@ -0,0 +1,89 @@
+"""
+Tests for the opt-in stage instrumentation.
+"""
+
+import pytest
+from abverdict import timing
+from abverdict.methods import bayesian
+from abverdict.utils import profiling
+from abverdict.utils.profiling import add_stage_callback, record_stages, remove_stage_callback, stage
+
+
+TIMES = ([1, 2, 3, 4, 5, 6], [1, 1, 0, 1, 1, 1], [2, 4, 6, 8, 10, 12], [1, 1, 1, 0, 1, 1])
+
+
+class TestStageRecording:
+    def test_disabled_is_a_shared_noop(self):
+        assert stage("a") is stage("b")
+
+    def test_bayesian_stages(self):
+        with record_stages() as recorder:
+            bayesian.analyze(10000, 500, 10000, 550)
+
+        summary = recorder.to_dict()
+        assert set(summary) == {
+            "bayesian.probability_better",
+            "bayesian.expected_loss",
+            "bayesian.credible_intervals",
+            "bayesian.recommendation",
+        }
+        for entry in summary.values():
+            assert entry["calls"] == 1
+            assert entry["total_s"] >= 0
+            assert "allocated_bytes" not in entry
+
+    def test_explain_false_skips_recommendation_stage(self):
+        with record_stages() as recorder:
+            timing.analyze(*TIMES, explain=False)
+            bayesian.analyze_multi(
+                [{"name": "a", "visitors": 100, "conversions": 5},
+                 {"name": "b", "visitors": 100, "conversions": 9},
+                 {"name": "c", "visitors": 100, "conversions": 7}],
+                num_samples=1000, explain=False,
+            )
+        names = set(recorder.to_dict())
+        assert {"timing.kaplan_meier", "timing.log_rank", "timing.hazard_ratio"} <= names
+        assert "bayesian.probability_best" in names
+        assert not any(name.endswith("recommendation") for name in names)
+
+    def test_aggregates_and_histogram(self):
+        with record_stages() as recorder:
+            for _ in range(3):
+                timing.survival_curve(TIMES[0], TIMES[1])
+
+        entry = recorder.to_dict()["timing.kaplan_meier"]
+        assert entry["calls"] == 3
+        assert entry["mean_s"] == pytest.approx(entry["total_s"] / 3)
+        assert entry["max_s"] <= entry["total_s"]
+
+        histogram = recorder.histogram(bins=4)["timing.kaplan_meier"]
+        assert sum(histogram["counts"]) == 3
+        assert len(histogram["edges"]) == 5
+
+    def test_nested_recorders_and_reset(self):
+        with record_stages() as outer:
+            with record_stages() as inner:
+                timing.survival_curve(TIMES[0], TIMES[1])
+            timing.survival_curve(TIMES[0], TIMES[1])
+        assert len(inner.records) == 1
+        assert len(outer.records) == 1
+        assert profiling._recorder.get() is None
+
+    def test_trace_memory(self):
+        with record_stages(trace_memory=True) as recorder:
+            with stage("allocate"):
+                kept = bytearray(1_000_000)
+        assert recorder.to_dict()["allocate"]["allocated_bytes"] >= 1_000_000
+        del kept
+
+    def test_callbacks(self):
+        seen = []
+        add_stage_callback(seen.append)
+        try:
+            timing.analyze(*TIMES, explain=False)
+        finally:
+            remove_stage_callback(seen.append)
+
+        assert [r.name for r in seen] == ["timing.kaplan_meier", "timing.log_rank", "timing.hazard_ratio"]
+        assert all(r.allocated_bytes is None for r in seen)
+        assert stage("a") is stage("b")
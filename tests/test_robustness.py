@@ -716,3 +716,129 @@ class TestEdgeCaseCombinations:
         # Control declined 2%, treatment declined 4%
         # DiD = -4% - (-2%) = -2%
         assert result.diff_in_diff < 0
+
+
+class TestCriticalValues:
+    """The shared critical-value service must agree with scipy."""
+
+    @pytest.mark.parametrize("confidence", [80, 90, 95, 99, 97.5, 99.9])
+    def test_z_alpha_matches_scipy(self, confidence):
+        from scipy.stats import norm
+        expected = norm.ppf(1 - (1 - confidence / 100) / 2)
+        assert stats.z_alpha(confidence) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("power", [50, 80, 90, 95, 82.5])
+    def test_z_beta_matches_scipy(self, power):
+        from scipy.stats import norm
+        assert stats.z_beta(power) == pytest.approx(norm.ppf(power / 100), rel=1e-12, abs=1e-15)
+
+    @pytest.mark.parametrize("df", [1, 5, 29.7, 1000, 1e12])
+    def test_critical_t_matches_scipy(self, df):
+        from scipy.stats import t
+        assert stats.critical_t(df, 0.05) == pytest.approx(t.ppf(0.975, df), rel=1e-9)
+        assert stats.t_critical(df, 90) == pytest.approx(t.ppf(0.95, df), rel=1e-9)
+
+    def test_one_sided(self):
+        from scipy.stats import norm
+        assert stats.critical_z(0.05, two_sided=False) == pytest.approx(norm.ppf(0.95))
+        assert stats.critical_z(0.05) == pytest.approx(norm.ppf(0.975))
+
+    def test_degenerate_alpha(self):
+        assert stats.critical_z(0.0) == math.inf
+        assert stats.critical_z(1.0) == 0.0
+
+
+class TestExplainFlag:
+    """explain=False skips the narrative text but keeps every number."""
+
+    def test_conversion_and_magnitude(self):
+        for explain in (True, False):
+            r = conversion.analyze(10000, 500, 10000, 580, explain=explain)
+            m = magnitude.analyze(1000, 50.0, 10.0, 1000, 51.5, 11.0, explain=explain)
+            assert bool(r.recommendation) is explain
+            assert bool(m.recommendation) is explain
+
+        quiet = conversion.analyze(10000, 500, 10000, 580, explain=False)
+        loud = conversion.analyze(10000, 500, 10000, 580)
+        assert quiet.p_value == loud.p_value
+        assert quiet.confidence_interval_lower == loud.confidence_interval_lower
+
+        multi = conversion.analyze_multi(
+            [{"name": "a", "visitors": 1000, "conversions": 50},
+             {"name": "b", "visitors": 1000, "conversions": 70}],
+            explain=False,
+        )
+        assert multi.recommendation == ""
+        did = magnitude.diff_in_diff(
+            100, 10.0, 2.0, 100, 11.0, 2.0, 100, 10.0, 2.0, 100, 12.0, 2.0, explain=False,
+        )
+        assert did.recommendation == ""
+
+    def test_timing(self):
+        result = timing.analyze([5, 6, 7, 8], [1, 1, 1, 0], [3, 4, 5, 6], [1, 1, 1, 1], explain=False)
+        rates = timing.analyze_rates(50, 100.0, 70, 100.0, explain=False)
+        assert result.recommendation == ""
+        assert rates.recommendation == ""
+        assert rates.p_value == timing.analyze_rates(50, 100.0, 70, 100.0).p_value
+
+    def test_methods(self):
+        from abverdict.methods import bayesian, sequential
+
+        assert bayesian.analyze(1000, 50, 1000, 70, explain=False).recommendation == ""
+        multi = bayesian.analyze_multi(
+            [{"name": "a", "visitors": 1000, "conversions": 50},
+             {"name": "b", "visitors": 1000, "conversions": 70}],
+            num_samples=2000, explain=False,
+        )
+        assert multi.recommendation == ""
+        seq = sequential.analyze(5000, 250, 5000, 300, 10000, explain=False)
+        assert seq.recommendation == ""
+        assert seq.decision == sequential.analyze(5000, 250, 5000, 300, 10000).decision
+
+    def test_diagnostics(self):
+        from abverdict.diagnostics import check_health, check_sample_ratio, detect_novelty_effect
+
+        srm = check_sample_ratio(10500, 9500, explain=False)
+        assert srm.warning == "" and srm.recommendation == ""
+        assert not srm.is_valid
+
+        health = check_health(5000, 250, 5000, 280, explain=False)
+        assert health.recommendation == "" and health.summary == ""
+        assert health.checks
+
+        days = [
+            {"day": i, "control_visitors": 1000, "control_conversions": 50,
+             "variant_visitors": 1000, "variant_conversions": 60}
+            for i in range(1, 15)
+        ]
+        novelty = detect_novelty_effect(days, explain=False)
+        assert novelty.warning == "" and novelty.recommendation == ""
+        assert novelty.effect_type == detect_novelty_effect(days).effect_type
+
+    def test_segments_and_business(self):
+        from abverdict.business import check_guardrails, project_impact
+        from abverdict.segments import analyze_segments
+
+        segments = [
+            {"segment_name": "device", "segment_value": value, "control_visitors": 5000,
+             "control_conversions": 250, "variant_visitors": 5000, "variant_conversions": conv}
+            for value, conv in [("mobile", 300), ("desktop", 260)]
+        ]
+        for method in ("bonferroni", "holm"):
+            report = analyze_segments(segments, correction_method=method, explain=False)
+            assert report.recommendation == ""
+            assert all(s.interpretation == "" for s in report.segments)
+
+        guardrails = check_guardrails([
+            {"name": "Errors", "metric_type": "proportion",
+             "control_data": {"count": 50, "total": 10000},
+             "variant_data": {"count": 80, "total": 10000}},
+            {"name": "Revenue per user", "metric_type": "ratio",
+             "control_data": {"total_value": 5000.0, "count": 1000},
+             "variant_data": {"total_value": 5100.0, "count": 1000}},
+        ], explain=False)
+        assert guardrails.recommendation == ""
+        assert all(r.interpretation == "" for r in guardrails.results)
+
+        impact = project_impact(0.05, 0.055, 10.0, 2.0, 18.0, 100000, 50.0, explain=False)
+        assert impact.recommendation == ""
@@ -4,9 +4,13 @@ Tests for Sequential Testing Module.
 Tests the SPRT-based sequential testing with O'Brien-Fleming and Pocock boundaries.
 """
 
+import numpy as np
 import pytest
+from abverdict.methods import sequential
 from abverdict.methods.sequential import (
     analyze,
+    boundary_table,
+    get_boundaries,
     SequentialTestResult,
     summarize,
 )
@@ -200,6 +204,264 @@ class TestSequentialAnalysis:
         assert len(summary) > 0
 
 
+class TestSpendingBoundaries:
+    """Tests for the exact Lan-DeMets boundaries."""
+
+    LOOKS = [0.2, 0.4, 0.6, 0.8, 1.0]
+
+    def test_obrien_fleming_matches_published_table(self):
+        table = boundary_table(self.LOOKS, alpha=0.05, method="obrien-fleming")
+        expected = [4.877, 3.357, 2.680, 2.290, 2.031]
+        assert [b.upper for b in table] == pytest.approx(expected, abs=2e-3)
+        assert all(b.lower == -b.upper for b in table)
+        assert table[-1].alpha_spent == pytest.approx(0.05)
+
+    def test_pocock_matches_published_table(self):
+        table = boundary_table(self.LOOKS, alpha=0.05, method="pocock")
+        expected = [2.438, 2.427, 2.410, 2.397, 2.386]
+        assert [b.upper for b in table] == pytest.approx(expected, abs=2e-3)
+
+    def test_overall_type_one_error(self):
+        # Brownian motion observed at the looks: Z_k = S_k / sqrt(t_k)
+        rng = np.random.default_rng(2024)
+        increments = rng.standard_normal((200_000, 5)) * np.sqrt(0.2)
+        z = np.cumsum(increments, axis=1) / np.sqrt(self.LOOKS)
+        for method in ("obrien-fleming", "pocock"):
+            bounds = np.array([b.upper for b in boundary_table(self.LOOKS, method=method)])
+            rejected = (np.abs(z) >= bounds).any(axis=1).mean()
+            assert rejected == pytest.approx(0.05, abs=0.002)
+
+    def test_get_boundaries_uses_planned_looks(self):
+        assert get_boundaries(0.6).upper == pytest.approx(boundary_table(self.LOOKS)[2].upper)
+        # An unplanned look at 0.5 follows the planned looks at 0.2 and 0.4
+        assert get_boundaries(0.5).upper == pytest.approx(boundary_table([0.2, 0.4, 0.5])[-1].upper)
+        assert get_boundaries(1.3).upper == pytest.approx(boundary_table(self.LOOKS)[-1].upper)
+        assert get_boundaries(0.0).upper == float("inf")
+
+    def test_tables_are_cached(self, monkeypatch):
+        sequential._boundary_uppers.cache_clear()
+        sequential._look_states.clear()
+        steps = []
+        next_look = sequential._next_look
+        monkeypatch.setattr(sequential, "_next_look", lambda *args: steps.append(args[-1]) or next_look(*args))
+
+        boundary_table(self.LOOKS)
+        boundary_table(self.LOOKS)
+        assert sequential._boundary_uppers.cache_info().hits == 1
+        assert len(steps) == len(self.LOOKS)
+        # A schedule sharing the computed prefix only integrates its new look
+        boundary_table(self.LOOKS[:4] + [0.9])
+        assert steps[len(self.LOOKS):] == [0.9]
+
+    def test_many_looks(self):
+        # Far deeper than the recursion limit would allow one frame per look
+        looks = [k / 600 for k in range(1, 601)]
+        table = boundary_table(looks, method="pocock")
+        assert len(table) == 600
+        assert np.isfinite([b.upper for b in table]).all()
+        assert get_boundaries(1.0, method="pocock", num_planned_looks=600).upper == table[-1].upper
+        assert len(sequential._look_states) <= sequential._LOOK_STATE_CACHE_SIZE
+
+    def test_invalid_schedules(self):
+        with pytest.raises(ValueError):
+            boundary_table([])
+        with pytest.raises(ValueError):
+            boundary_table([0.5, 0.4, 1.0])
+        with pytest.raises(ValueError):
+            boundary_table([0.5, 1.2])
+        with pytest.raises(ValueError):
+            boundary_table(self.LOOKS, method="haybittle")
+
+
+class TestTrajectory:
+    """Tests for the vectorized per-look analysis."""
+
+    LOOKS = (
+        [1000, 2000, 3000, 4000, 5000],
+        [50, 100, 150, 200, 250],
+        [1000, 2000, 3000, 4000, 5000],
+        [60, 125, 195, 265, 340],
+    )
+
+    def test_matches_analyze_at_every_look(self):
+        trajectory = sequential.analyze_trajectory(*self.LOOKS, expected_visitors_per_variant=10000)
+        assert isinstance(trajectory, sequential.SequentialTrajectory)
+        assert len(trajectory) == 5
+        for i in range(5):
+            expected = analyze(*(counts[i] for counts in self.LOOKS), expected_visitors_per_variant=10000)
+            result = trajectory.result(i)
+            assert result.decision == expected.decision
+            assert result.z_statistic == pytest.approx(expected.z_statistic)
+            assert result.upper_boundary == pytest.approx(expected.upper_boundary)
+            assert result.adjusted_alpha == pytest.approx(expected.adjusted_alpha)
+            assert result.estimated_remaining_visitors == expected.estimated_remaining_visitors
+            assert result.recommendation == expected.recommendation
+
+    def test_first_crossing(self):
+        trajectory = sequential.analyze_trajectory(*self.LOOKS, expected_visitors_per_variant=10000)
+        assert trajectory.first_crossing == 4
+        assert list(trajectory.decision[:4]) == ["keep_running"] * 4
+
+        flat = sequential.analyze_trajectory(
+            [1000, 2000], [50, 100], [1000, 2000], [51, 101], expected_visitors_per_variant=10000,
+        )
+        assert flat.first_crossing is None
+
+    def test_final_look_without_crossing(self):
+        trajectory = sequential.analyze_trajectory(
+            [5000, 10000], [250, 500], [5000, 10000], [255, 510], expected_visitors_per_variant=10000,
+        )
+        assert list(trajectory.decision) == ["keep_running", "no_difference"]
+        assert trajectory.first_crossing == 1
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            sequential.analyze_trajectory([1000, 900], [50, 50], [1000, 900], [50, 50], 10000)
+        with pytest.raises(ValueError):
+            sequential.analyze_trajectory([1000, 2000], [50, 100], [1000], [50], 10000)
+        with pytest.raises(ValueError):
+            sequential.analyze_trajectory([100], [150], [100], [5], 10000)
+
+
+class TestSimulation:
+    """Tests for the operating-characteristics simulator."""
+
+    def test_type_one_error(self):
+        oc = sequential.simulate(0.05, 20000, num_trials=100_000, seed=1)
+        assert oc.rejection_rate == pytest.approx(0.05, abs=4 * oc.rejection_rate_error)
+        assert oc.variant_win_rate == pytest.approx(oc.control_win_rate, abs=0.005)
+        assert sum(oc.stopping_probabilities) == pytest.approx(1.0)
+        assert oc.look_visitors == (4000, 8000, 12000, 16000, 20000)
+
+    def test_power_and_early_stopping(self):
+        design = sequential.sample_size(0.05, 0.10)
+        oc = sequential.simulate(0.05, design["visitors_per_variant"], relative_lift=0.10,
+                                 num_trials=50_000, seed=2)
+        assert oc.rejection_rate > 0.78
+        assert oc.control_win_rate < 0.001
+        assert oc.expected_visitors_per_variant < design["visitors_per_variant"]
+
+    def test_pocock_stops_earlier_than_obrien_fleming(self):
+        kwargs = dict(relative_lift=0.15, num_trials=20_000, seed=3)
+        obf = sequential.simulate(0.05, 20000, **kwargs)
+        pocock = sequential.simulate(0.05, 20000, method="pocock", **kwargs)
+        assert pocock.stopping_probabilities[0] > obf.stopping_probabilities[0]
+
+    def test_reproducible_across_workers(self):
+        kwargs = dict(num_trials=120_000, seed=4)
+        assert sequential.simulate(0.05, 5000, workers=2, **kwargs) == sequential.simulate(0.05, 5000, **kwargs)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            sequential.simulate(0.6, 1000, relative_lift=1.0)
+        with pytest.raises(ValueError):
+            sequential.simulate(0.05, 3, num_planned_looks=5)
+        with pytest.raises(ValueError):
+            sequential.simulate(0.05, 1000, workers=0)
+
+
+class TestBoundaryStore:
+    """Tests for the persistent boundary store."""
+
+    @pytest.fixture(autouse=True)
+    def no_store_after(self):
+        yield
+        sequential.set_boundary_store(None)
+
+    def test_tables_persist_across_stores(self, tmp_path):
+        path = tmp_path / "boundaries.db"
+        sequential.set_boundary_store(path)
+        computed = get_boundaries(0.5)
+
+        # A fresh process: empty in-memory caches, same file
+        sequential.set_boundary_store(path)
+        sequential._look_states.clear()
+        assert get_boundaries(0.5) == computed
+        assert not sequential._look_states
+
+    def test_warm(self, tmp_path):
+        store = sequential.BoundaryStore(tmp_path / "boundaries.db")
+        assert sequential.warm_boundary_store(methods=["pocock"], store=store) == 1000
+        assert len(store) == 1000
+        assert sequential.warm_boundary_store(methods=["pocock"], store=store) == 0
+
+        upper = store.get(0.05, "pocock", (0.2, 0.4, 0.6, 0.8, 1.0))
+        expected = [b.upper for b in boundary_table([0.2, 0.4, 0.6, 0.8, 1.0], method="pocock")]
+        assert list(upper) == pytest.approx(expected)
+        assert store.get(0.05, "pocock", (0.3, 1.0)) is None
+
+    def test_warm_commits_each_design(self, tmp_path, monkeypatch):
+        store = sequential.BoundaryStore(tmp_path / "boundaries.db")
+        look_state = sequential._look_state
+
+        def fail_on_pocock(alpha, method, schedule):
+            if method == "pocock":
+                raise RuntimeError("interrupted")
+            return look_state(alpha, method, schedule)
+
+        monkeypatch.setattr(sequential, "_look_state", fail_on_pocock)
+        with pytest.raises(RuntimeError):
+            sequential.warm_boundary_store(store=store)
+        # The O'Brien-Fleming design was committed before the failure
+        assert len(store) == 1000
+
+    def test_warm_skips_designs_claimed_elsewhere(self, tmp_path):
+        store = sequential.BoundaryStore(tmp_path / "boundaries.db")
+        assert store._claim(0.05, "pocock", 5)  # another worker is warming it
+        assert sequential.warm_boundary_store(store=store) == 1000
+        assert store.get(0.05, "pocock", (0.2, 0.4, 0.5)) is None
+        assert store.get(0.05, "obrien-fleming", (0.2, 0.4, 0.5)) is not None
+
+    def test_store_from_another_version_is_rebuilt(self, tmp_path, monkeypatch, caplog):
+        path = tmp_path / "boundaries.db"
+        sequential.BoundaryStore(path).put(0.05, "pocock", (1.0,), [1.96])
+
+        assert len(sequential.BoundaryStore(path)) == 1
+        monkeypatch.setattr(sequential, "_GRID_POINTS", 201)
+        with caplog.at_level("WARNING", logger="abverdict.methods.sequential"):
+            store = sequential.BoundaryStore(path)
+        assert len(store) == 0
+        assert "rebuilding" in caplog.records[0].getMessage()
+
+    def test_store_errors_fall_back_to_integration(self, tmp_path, monkeypatch, caplog):
+        import sqlite3
+
+        store = sequential.set_boundary_store(tmp_path / "boundaries.db")
+
+        def locked(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(store, "get", locked)
+        monkeypatch.setattr(store, "put", locked)
+        with caplog.at_level("WARNING", logger="abverdict.methods.sequential"):
+            upper = get_boundaries(0.5).upper
+        assert upper == pytest.approx(boundary_table([0.2, 0.4, 0.5])[-1].upper)
+        assert len(caplog.records) == 1
+        assert "unreadable" in caplog.records[0].getMessage()
+
+    def test_unopenable_default_store_falls_back_to_memory(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setenv(sequential.BOUNDARY_STORE_ENV, str(tmp_path / "missing" / "boundaries.db"))
+        monkeypatch.setattr(sequential, "_store", sequential._UNSET)
+        sequential._boundary_uppers.cache_clear()
+
+        with caplog.at_level("WARNING", logger="abverdict.methods.sequential"):
+            assert get_boundaries(0.5).upper == pytest.approx(boundary_table([0.2, 0.4, 0.5])[-1].upper)
+            assert analyze(1000, 50, 1000, 60, 10000).information_fraction == pytest.approx(0.1)
+        assert sequential.get_boundary_store() is None
+        assert len(caplog.records) == 1
+        assert "Cannot open" in caplog.records[0].getMessage()
+
+    def test_infinite_boundaries_round_trip(self, tmp_path):
+        store = sequential.BoundaryStore(tmp_path / "boundaries.db")
+        store.put(0.05, "obrien-fleming", (0.001,), [float("inf")])
+        assert store.get(0.05, "obrien-fleming", (0.001,)) == (float("inf"),)
+
+    def test_warm_requires_store(self):
+        sequential.set_boundary_store(None)
+        with pytest.raises(ValueError):
+            sequential.warm_boundary_store()
+
+
 class TestSequentialEdgeCases:
     """Edge case tests for sequential analysis."""
 
@@ -153,6 +153,18 @@ class TestTimingAnalyze:
         
         assert "Hazard ratio" in result.recommendation or "hazard" in result.recommendation.lower()
 
+    def test_large_arms_do_not_overflow(self):
+        rng = np.random.default_rng(0)
+        n = 150_000
+        control = np.ceil(rng.exponential(10.0, size=n)).tolist()
+        treatment = np.ceil(rng.exponential(10.0, size=n)).tolist()
+        events = [1] * n
+
+        with np.errstate(over="raise"):
+            result = timing.analyze(control, events, treatment, events, explain=False)
+        assert 0.0 <= result.p_value <= 1.0
+        assert result.p_value > 0.001
+
 
 class TestTimingSampleSize:
     def test_basic_calculation(self):